@@ -0,0 +1,340 @@
+"""
+Parser throughput benchmark.
+
+Runs QuizParser.parse_quiz with each available backend over a corpus of
+quiz pages and reports questions/sec, p50/p99 time per page and peak
+traced memory per page (Python allocations only: tracemalloc does not see
+lxml's C tree). Each result is appended, with the git commit, to
+data/benchmarks/parser.jsonl and compared against the previous run on the
+same corpus, so parser changes land with a known cost.
+
+Corpus (first that is non-empty):
+    --html-dir DIR     *.html files
+    the HTML archive   (HTML_ARCHIVE_DIR env var, data/archive)
+    --synthetic N      N generated pages in the site's markup
+
+Usage (from the automation directory):
+    python benchmarks/parser_benchmark.py
+    python benchmarks/parser_benchmark.py --backend lxml --repeat 5
+    python benchmarks/parser_benchmark.py --synthetic 30 --fail-on-regression
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import hashlib
+import logging
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add the automation directory to sys.path so we can import 'src'
+automation_dir = Path(__file__).resolve().parent.parent
+if str(automation_dir) not in sys.path:
+    sys.path.insert(0, str(automation_dir))
+
+from src.parser import QuizParser
+from src.parser_backends import available_backends
+from src.html_archive import HTMLArchive
+
+logger = logging.getLogger("ParserBenchmark")
+
+DEFAULT_RESULTS_PATH = 'data/benchmarks/parser.jsonl'
+
+# Relative change beyond which a metric counts as a regression
+DEFAULT_MAX_REGRESSION = 0.10
+
+
+def load_corpus(html_dir: Optional[str] = None, archive_dir: Optional[str] = None,
+                synthetic: int = 0, limit: Optional[int] = None) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Collect the pages to parse
+
+    Returns:
+        (source name, [(page name, html), ...])
+    """
+    pages: List[Tuple[str, str]] = []
+    source = ''
+
+    if html_dir:
+        source = f"dir:{html_dir}"
+        for path in sorted(Path(html_dir).glob('*.html')):
+            pages.append((path.name, path.read_text(encoding='utf-8', errors='replace')))
+    else:
+        archive = HTMLArchive(directory=archive_dir)
+        source = f"archive:{archive.directory}"
+        for url in archive.urls():
+            html = archive.get(url)
+            if html is not None:
+                pages.append((url, html))
+
+    if not pages and synthetic:
+        source = 'synthetic'
+        pages = [(f"synthetic-{n:03d}", synthetic_page(n)) for n in range(synthetic)]
+
+    if limit:
+        pages = pages[:limit]
+    return source, pages
+
+
+def synthetic_page(seed: int, questions: int = 20) -> str:
+    """A solved quiz page with English and Hindi copies and page chrome around them"""
+    blocks = []
+    for n in range(questions):
+        for question, options, head in (
+            (f"Q{seed}.{n}: Which ministry launched scheme number {n} in 2025?",
+             ["Finance", "Home Affairs", "Education", "Health"], "Correct Answer: Option C"),
+            (f"प्रश्न {seed}.{n}: 2025 में योजना {n} किस मंत्रालय ने शुरू की?",
+             ["वित्त", "गृह", "शिक्षा", "स्वास्थ्य"], "सही उत्तर: C"),
+        ):
+            items = ''.join(
+                f'<li><label><input type="radio"><div class="containerr-text-opt">{label}. {text}</div></label></li>'
+                for label, text in zip('ABCD', options)
+            )
+            blocks.append(
+                f'<div class="q-section-inner-sol"><div class="q-name"><p>{question}</p></div>'
+                f'<div class="q-option"><ul>{items}</ul></div>'
+                f'<div class="solution-sec"><div class="head">{head}</div><div class="ans-text">'
+                f'<ul><li>The scheme targets   district level outcomes.</li><li>Budget: ₹{n} crore</li></ul>'
+                f'<p>· Announced in the Union Budget.</p></div></div></div>'
+            )
+    chrome = '<nav>' + '<a href="/quiz">Quiz</a>' * 300 + '</nav>' + '<script>var t = 1;</script>' * 50
+    return f'<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>{chrome}{"".join(blocks)}</body></html>'
+
+
+def corpus_fingerprint(pages: List[Tuple[str, str]]) -> str:
+    """Identifies the corpus so runs are only compared on the same pages"""
+    digest = hashlib.sha256()
+    for name, html in pages:
+        digest.update(hashlib.sha256(html.encode('utf-8')).digest())
+    return digest.hexdigest()[:16]
+
+
+def git_commit() -> str:
+    """Short commit hash, marked -dirty when the tree has uncommitted changes"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True, cwd=automation_dir).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               capture_output=True, text=True, cwd=automation_dir).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def benchmark_backend(backend: str, pages: List[Tuple[str, str]], repeat: int) -> Dict:
+    """
+    Time and trace one backend over the corpus
+
+    Returns:
+        Metrics for the result record
+    """
+    parser = QuizParser(backend=backend)
+
+    def parse(name: str, html: str) -> int:
+        try:
+            return len(parser.parse_quiz(html, name).questions)
+        except ValueError:
+            return -1
+
+    # Warm-up pass (imports, compiled XPath, regex caches)
+    questions_per_page = [parse(name, html) for name, html in pages]
+
+    page_times: List[float] = []
+    total_time = 0.0
+    for _ in range(repeat):
+        for name, html in pages:
+            started = time.perf_counter()
+            parse(name, html)
+            elapsed = time.perf_counter() - started
+            page_times.append(elapsed)
+            total_time += elapsed
+
+    # Memory is traced in a separate pass so tracing does not distort the timings
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for name, html in pages:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            parse(name, html)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    questions = sum(count for count in questions_per_page if count > 0) * repeat
+    return {
+        'backend': parser.backend.name,
+        'pages': len(pages),
+        'errors': sum(1 for count in questions_per_page if count < 0),
+        'questions': questions // repeat,
+        'questions_per_sec': round(questions / total_time, 1) if total_time else 0.0,
+        'pages_per_sec': round(len(page_times) / total_time, 2) if total_time else 0.0,
+        'p50_ms': round(percentile(page_times, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(page_times, 0.99) * 1000, 3),
+        'peak_kib_max': round(max(peaks) / 1024, 1) if peaks else 0.0,
+        'peak_kib_mean': round(sum(peaks) / len(peaks) / 1024, 1) if peaks else 0.0,
+    }
+
+
+def load_results(path: str) -> List[Dict]:
+    """Previously stored result records (unreadable lines are skipped)"""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_result(path: str, record: Dict) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def previous_result(records: List[Dict], record: Dict) -> Optional[Dict]:
+    """Latest earlier run of the same backend on the same corpus"""
+    for candidate in reversed(records):
+        if (candidate.get('backend') == record['backend']
+                and candidate.get('corpus', {}).get('fingerprint') == record['corpus']['fingerprint']
+                and candidate.get('repeat') == record['repeat']):
+            return candidate
+    return None
+
+
+def compare(previous: Dict, current: Dict, max_regression: float) -> List[str]:
+    """
+    Relative change of each metric against the previous run
+
+    Returns:
+        Names of metrics that regressed by more than max_regression
+    """
+    regressions = []
+    # (metric, True if higher is better, counts towards regressions);
+    # single-page tail latency is too noisy on small corpora to gate on
+    for metric, higher_is_better, gating in (('questions_per_sec', True, True), ('p50_ms', False, True),
+                                             ('p99_ms', False, False), ('peak_kib_max', False, True)):
+        before = previous.get(metric)
+        after = current.get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        worse = -change if higher_is_better else change
+        marker = ''
+        if gating and worse > max_regression:
+            regressions.append(metric)
+            marker = '  <-- REGRESSION'
+        logger.info(f"   {metric:18s} {before:>12} -> {after:>12} ({change:+.1%}){marker}")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark QuizParser over a corpus of quiz pages")
+    parser.add_argument('--backend', action='append', dest='backends', metavar='NAME',
+                        help="Backend to run (repeatable; default: every installed backend)")
+    parser.add_argument('--html-dir', help="Directory of *.html pages to use as the corpus")
+    parser.add_argument('--archive-dir', help="HTML archive directory (default: HTML_ARCHIVE_DIR or data/archive)")
+    parser.add_argument('--synthetic', type=int, default=0, metavar='N',
+                        help="Generate N pages when no recorded corpus is available")
+    parser.add_argument('--limit', type=int, help="Use at most this many pages")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes over the corpus (default: 3)")
+    parser.add_argument('--output', default=DEFAULT_RESULTS_PATH,
+                        help=f"Results file (default: {DEFAULT_RESULTS_PATH})")
+    parser.add_argument('--no-save', action='store_true', help="Compare only, do not append the results")
+    parser.add_argument('--max-regression', type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Relative slowdown treated as a regression (default: 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Exit with status 1 if any metric regressed")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # src.parser configures logging on import; force the plain report format
+    logging.basicConfig(level=logging.INFO, format='%(message)s', force=True)
+    args = parse_args(argv)
+    # Parser progress logging is not part of what is measured
+    parser_logger = logging.getLogger('src.parser')
+    parser_level = parser_logger.level
+    parser_logger.setLevel(logging.CRITICAL)
+    try:
+        return run(args)
+    finally:
+        parser_logger.setLevel(parser_level)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Benchmark every requested backend and record the results"""
+    source, pages = load_corpus(args.html_dir, args.archive_dir, args.synthetic, args.limit)
+    if not pages:
+        logger.error("No pages to benchmark: archive some quizzes, pass --html-dir, or use --synthetic N")
+        return 1
+
+    fingerprint = corpus_fingerprint(pages)
+    commit = git_commit()
+    backends = args.backends or available_backends()
+    history = load_results(args.output)
+    regressed = False
+
+    logger.info(f"Corpus: {len(pages)} pages from {source} (fingerprint {fingerprint}), commit {commit}")
+
+    for backend in backends:
+        metrics = benchmark_backend(backend, pages, max(1, args.repeat))
+        record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': commit,
+            'python': platform.python_version(),
+            'repeat': max(1, args.repeat),
+            'corpus': {'source': source, 'pages': len(pages), 'fingerprint': fingerprint},
+            **metrics,
+        }
+
+        logger.info(
+            f"\n{record['backend']}: {record['questions_per_sec']} questions/s, "
+            f"p50 {record['p50_ms']} ms, p99 {record['p99_ms']} ms per page, "
+            f"peak {record['peak_kib_max']} KiB, {record['errors']} pages without questions"
+        )
+
+        previous = previous_result(history, record)
+        if previous:
+            logger.info(f"   vs {previous.get('commit', '?')} ({previous.get('timestamp', '?')}):")
+            if compare(previous, record, args.max_regression):
+                regressed = True
+        else:
+            logger.info("   (no previous run on this corpus)")
+
+        if not args.no_save:
+            append_result(args.output, record)
+            history.append(record)
+
+    if not args.no_save:
+        logger.info(f"\nResults appended to {args.output}")
+
+    return 1 if regressed and args.fail_on_regression else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
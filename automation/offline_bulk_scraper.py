@@ -5,10 +5,12 @@ Scrapes all quizzes for a specific month and generates a single PDF
 
 import os
 import sys
+import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List
+import queue
+from typing import List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import pytz
 
@@ -17,7 +19,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.login import LoginManager, AuthenticationError
-from src.scraper import QuizScraper, ScraperError
+from src.scraper import QuizScraper, ReplayScraper, ScraperError
+from src.async_scraper import scrape_quizzes
 from src.parser import QuizParser, QuizData, QuizQuestion
 from src.translator import Translator, TranslatedQuizData
 from src.pdf_generator import PDFGenerator
@@ -40,31 +43,60 @@ logger = logging.getLogger(__name__)
 class BulkQuizScraper:
     """Bulk scraper for processing multiple quizzes"""
     
-    def __init__(self, email: str, password: str):
-        """Initialize bulk scraper"""
+    def __init__(self, email: Optional[str], password: Optional[str], replay: bool = False):
+        """
+        Initialize bulk scraper
+        
+        Args:
+            email: Login email (unused in replay mode)
+            password: Login password (unused in replay mode)
+            replay: Read quizzes from the HTML archive instead of the website
+        """
         self.email = email
         self.password = password
+        self.replay = replay
         self.session = None
         self.scraper = None
-        self.parser = QuizParser()
+        # Bulk runs use the fastest installed parser backend unless one is configured
+        self.parser = QuizParser(backend=os.getenv('QUIZ_PARSER_BACKEND', 'auto'))
         self.translator = Translator()
         self.date_extractor = DateExtractor()
         
     def authenticate(self):
         """Authenticate and get session"""
+        if self.replay:
+            self.scraper = ReplayScraper()
+            logger.info(f"✓ Replay mode: {len(self.scraper.archive)} archived quizzes, no login")
+            return
+        
         logger.info("Authenticating...")
         login_manager = LoginManager(self.email, self.password)
         self.session = login_manager.get_session()
         self.scraper = QuizScraper(self.session)
         logger.info("✓ Authentication successful")
     
-    def get_all_quiz_urls(self) -> List[str]:
-        """Fetch all quiz URLs from listing page"""
+    def get_all_quiz_urls(self, until_date: Optional[datetime] = None) -> List[str]:
+        """Fetch quiz URLs from the listing, paging back to until_date if given"""
         logger.info("Fetching quiz listing...")
-        urls = self.scraper.get_quiz_urls()
+        urls = self.scraper.get_quiz_urls(until_date=until_date)
         logger.info(f"✓ Found {len(urls)} total quizzes")
         return urls
     
+    def month_start_date(self, month_name: str) -> Optional[datetime]:
+        """
+        First day of the most recent occurrence of a month
+        
+        Used as the archive target so the listing is paged back far enough
+        to include every quiz of that month.
+        """
+        month = DateExtractor.MONTH_MAP.get(month_name.lower())
+        if not month:
+            return None
+        
+        today = datetime.now(pytz.timezone('Asia/Kolkata'))
+        year = today.year if month <= today.month else today.year - 1
+        return datetime(year, month, 1)
+    
     def filter_urls_by_month(self, urls: List[str], month_name: str) -> List[str]:
         """Filter URLs that contain the specified month"""
         month_name = month_name.lower()
@@ -95,18 +127,36 @@ class BulkQuizScraper:
             logger.error(f"[{index}/{total}] ✗ Error: {e}")
             return None
     
+    def _scrape_worker(self, jobs: "queue.Queue", total: int) -> List[QuizData]:
+        """
+        Worker loop that keeps one pooled browser for every quiz it handles.
+        
+        Playwright browsers belong to the thread that launched them, so the
+        worker closes its own browser once the job queue is drained.
+        """
+        results = []
+        try:
+            while True:
+                try:
+                    index, url = jobs.get_nowait()
+                except queue.Empty:
+                    return results
+                
+                quiz_data = self.process_single_quiz(url, index, total)
+                if quiz_data:
+                    results.append(quiz_data)
+        finally:
+            self.scraper.close()
+    
     def merge_quiz_data(self, quiz_data_list: List[QuizData]) -> QuizData:
         """Merge multiple quiz data into one"""
         all_questions = []
-        question_number = 1
         
         for quiz_data in quiz_data_list:
             if quiz_data:
                 for question in quiz_data.questions:
-                    # Renumber questions sequentially
-                    question.question_number = question_number
-                    all_questions.append(question)
-                    question_number += 1
+                    # Renumber into a copy; the per-day records stay untouched
+                    all_questions.append(question.with_number(len(all_questions) + 1))
         
         # Use first URL as source
         source_url = quiz_data_list[0].source_url if quiz_data_list else ""
@@ -119,8 +169,86 @@ class BulkQuizScraper:
         
         return merged
     
-    def process_month(self, month_name: str, max_workers: int = 5):
-        """Process all quizzes for a specific month"""
+    def _parse_scraped(self, url: str, html: str) -> QuizData:
+        """Parse one page handed over by the async engine"""
+        quiz_data = self.parser.parse_quiz(html, url)
+        logger.info(f"✓ Parsed {len(quiz_data.questions)} questions: {url}")
+        return quiz_data
+    
+    def scrape_month_async(self, month_urls: List[str], concurrency: int) -> List[QuizData]:
+        """Scrape quizzes on concurrent pages of one shared browser"""
+        # The async engine brings its own browser, so release the listing browser first
+        self.scraper.close()
+        
+        results = scrape_quizzes(
+            self.session,
+            month_urls,
+            concurrency=concurrency,
+            handler=self._parse_scraped,
+            fast_path=self.scraper.try_http_reveal,
+            tier_stats=self.scraper.tier_stats,
+            archive=self.scraper.archive,
+            rate_controller=self.scraper.rate_controller
+        )
+        self.scraper.log_http_cache_stats()
+        self.scraper.log_rate_stats()
+        # Results come back in listing order, so the merged PDF follows the website
+        return list(results.values())
+    
+    def replay_month(self, month_urls: List[str]) -> List[QuizData]:
+        """Parse archived pages in listing order (no browser, no network)"""
+        quiz_data_list = []
+        for idx, url in enumerate(month_urls, 1):
+            quiz_data = self.process_single_quiz(url, idx, len(month_urls))
+            if quiz_data:
+                quiz_data_list.append(quiz_data)
+        
+        self.scraper.log_tier_stats()
+        return quiz_data_list
+    
+    def scrape_month_threaded(self, month_urls: List[str], max_workers: int) -> List[QuizData]:
+        """Scrape quizzes with worker threads that each own a browser"""
+        quiz_data_list = []
+        
+        jobs = queue.Queue()
+        for idx, url in enumerate(month_urls, 1):
+            jobs.put((idx, url))
+        
+        worker_count = min(max_workers, len(month_urls))
+        # Every worker may have a request in flight at the same time
+        self.scraper.rate_controller.set_concurrency(worker_count)
+        
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            # Each worker reuses one browser for all quizzes it pulls from the queue
+            futures = [
+                executor.submit(self._scrape_worker, jobs, len(month_urls))
+                for _ in range(worker_count)
+            ]
+            
+            # Collect results as workers finish
+            for future in as_completed(futures):
+                try:
+                    quiz_data_list.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Worker failed: {e}")
+        
+        logger.info(f"✓ Browsers launched: {self.scraper.browser_pool.launch_count} for {len(month_urls)} quizzes")
+        if self.scraper.browser_pool.open_browsers:
+            logger.warning(f"{self.scraper.browser_pool.open_browsers} worker browser(s) were not closed")
+        self.scraper.log_tier_stats()
+        self.scraper.log_http_cache_stats()
+        self.scraper.log_rate_stats()
+        return quiz_data_list
+    
+    def process_month(self, month_name: str, max_workers: int = 5, engine: str = "async"):
+        """
+        Process all quizzes for a specific month
+        
+        Args:
+            month_name: Month to scrape (matched against quiz URLs)
+            max_workers: Concurrent pages (async) or threads (threads)
+            engine: "async" for one shared browser, "threads" for a browser per thread
+        """
         logger.info("=" * 80)
         logger.info(f"BULK QUIZ SCRAPER - {month_name.upper()}")
         logger.info("=" * 80)
@@ -128,8 +256,13 @@ class BulkQuizScraper:
         # Step 1: Authenticate
         self.authenticate()
         
-        # Step 2: Get all URLs
-        all_urls = self.get_all_quiz_urls()
+        with self.scraper:
+            self._process_month(month_name, max_workers, engine)
+    
+    def _process_month(self, month_name: str, max_workers: int, engine: str):
+        """Run the month pipeline with an open scraper"""
+        # Step 2: Get all URLs back to the start of the month
+        all_urls = self.get_all_quiz_urls(until_date=self.month_start_date(month_name))
         
         # Step 3: Filter by month
         month_urls = self.filter_urls_by_month(all_urls, month_name)
@@ -144,27 +277,18 @@ class BulkQuizScraper:
         
         # Step 4: Process quizzes in parallel
         logger.info(f"\n{'=' * 80}")
-        logger.info(f"PROCESSING {len(month_urls)} QUIZZES (using {max_workers} threads)")
-        logger.info("=" * 80)
-        
-        quiz_data_list = []
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(self.process_single_quiz, url, idx, len(month_urls)): url
-                for idx, url in enumerate(month_urls, 1)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    quiz_data = future.result()
-                    if quiz_data:
-                        quiz_data_list.append(quiz_data)
-                except Exception as e:
-                    logger.error(f"Exception processing {url}: {e}")
+        if self.replay:
+            logger.info(f"REPLAYING {len(month_urls)} QUIZZES FROM THE HTML ARCHIVE")
+            logger.info("=" * 80)
+            quiz_data_list = self.replay_month(month_urls)
+        elif engine == "async":
+            logger.info(f"PROCESSING {len(month_urls)} QUIZZES (async, {max_workers} concurrent pages)")
+            logger.info("=" * 80)
+            quiz_data_list = self.scrape_month_async(month_urls, max_workers)
+        else:
+            logger.info(f"PROCESSING {len(month_urls)} QUIZZES (using {max_workers} threads)")
+            logger.info("=" * 80)
+            quiz_data_list = self.scrape_month_threaded(month_urls, max_workers)
         
         # Step 5: Merge all quiz data
         logger.info(f"\n{'=' * 80}")
@@ -181,6 +305,7 @@ class BulkQuizScraper:
         
         translated_data = self.translator.translate_quiz(merged_data)
         logger.info("✓ Translation completed")
+        self.translator.log_summary()
         
         # Step 7: Generate PDF
         logger.info(f"\n{'=' * 80}")
@@ -217,13 +342,29 @@ class BulkQuizScraper:
         logger.info(f"\n✅ SUCCESS! PDF saved to: {pdf_path}")
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Scrape a month of quizzes into one PDF")
+    parser.add_argument(
+        '--replay',
+        action='store_true',
+        help="Build the month from the HTML archive without logging in or scraping"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main execution"""
+    args = parse_args(argv)
+    
     print("=" * 80)
-    print("OFFLINE BULK QUIZ SCRAPER")
+    print("OFFLINE BULK QUIZ SCRAPER" + (" (REPLAY)" if args.replay else ""))
     print("=" * 80)
     print()
     
+    if args.replay:
+        return replay_main()
+    
     # Check Playwright installation
     try:
         from playwright.sync_api import sync_playwright
@@ -253,9 +394,9 @@ def main():
         print("❌ Error: Month name cannot be empty")
         return 1
     
-    # Ask for number of threads
-    print("\nEnter number of parallel threads (default: 5, recommended: 3-10):")
-    threads_input = input("Threads: ").strip()
+    # Ask for number of concurrent pages
+    print("\nEnter number of concurrent pages (default: 5, recommended: 3-10):")
+    threads_input = input("Pages: ").strip()
     
     try:
         max_workers = int(threads_input) if threads_input else 5
@@ -264,13 +405,16 @@ def main():
     except ValueError:
         max_workers = 5
     
-    print(f"\n✓ Using {max_workers} parallel threads")
+    # BULK_ENGINE=threads restores the one-browser-per-thread mode
+    engine = os.getenv('BULK_ENGINE', 'async').lower()
+    
+    print(f"\n✓ Using {max_workers} concurrent pages ({engine} engine)")
     print()
     
     # Create scraper and process
     try:
         scraper = BulkQuizScraper(email, password)
-        scraper.process_month(month_name, max_workers)
+        scraper.process_month(month_name, max_workers, engine)
         return 0
         
     except AuthenticationError as e:
@@ -281,6 +425,24 @@ def main():
         return 1
 
 
+def replay_main():
+    """Rebuild a month PDF from archived pages"""
+    print("Enter the month name to replay (e.g., november, october, december):")
+    month_name = input("Month: ").strip()
+    
+    if not month_name:
+        print("❌ Error: Month name cannot be empty")
+        return 1
+    
+    try:
+        scraper = BulkQuizScraper(None, None, replay=True)
+        scraper.process_month(month_name)
+        return 0
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        return 1
+
+
 if __name__ == "__main__":
     exit_code = main()
     sys.exit(exit_code)
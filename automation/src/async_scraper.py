@@ -0,0 +1,373 @@
+"""
+Asyncio scraping engine for bulk quiz runs.
+One Chromium browser and one logged-in context serve N concurrent pages,
+instead of one browser (and one login) per worker thread. The browser is
+only launched when the first quiz misses the HTTP fast path.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from .browser_pool import DEFAULT_USER_AGENT, session_cookies_for_browser
+from .request_filter import RequestFilter
+from .html_archive import HTMLArchive
+from .rate_limiter import RateController
+from .debug_capture import DebugCapture
+from .lazy_imports import backend
+from .scraper import (
+    ScraperError,
+    TierStats,
+    REVEAL_MARKERS,
+    SOLUTIONS_REVEALED_JS,
+    DEFAULT_REVEAL_TIMEOUT,
+    remaining_ms,
+)
+
+# Checked without importing; the async API loads when the engine starts
+ASYNC_PLAYWRIGHT_AVAILABLE = backend('playwright_async').available
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncQuizScraper:
+    """Reveals quiz solutions on concurrent pages of a single shared browser context"""
+
+    def __init__(self, session: requests.Session, concurrency: int = 5,
+                 headless: Optional[bool] = None,
+                 storage_state_path: Optional[str] = "data/browser_state.json",
+                 request_filter: Optional[RequestFilter] = None,
+                 fast_path: Optional[Callable[[str], Optional[str]]] = None,
+                 tier_stats: Optional[TierStats] = None,
+                 archive: Optional[HTMLArchive] = None,
+                 rate_controller: Optional[RateController] = None,
+                 debug_capture: Optional[DebugCapture] = None):
+        """
+        Initialize the async scraper
+
+        Args:
+            session: Authenticated requests.Session whose cookies seed the context
+            concurrency: Maximum number of quiz pages open at the same time
+            headless: Run Chromium headless (defaults to USE_HEADLESS env var)
+            storage_state_path: Saved Playwright storage_state to restore/refresh
+            request_filter: Blocks non-essential requests (default RequestFilter if omitted)
+            fast_path: Blocking Callable(url) returning revealed HTML or None,
+                tried in a worker thread before a browser page is opened
+            tier_stats: TierStats recording which tier served each quiz
+            archive: HTMLArchive receiving every revealed page
+            rate_controller: RateController pacing page navigations (shared
+                with the fast path's HTTP session when given)
+            debug_capture: Saves page artifacts of failed reveals
+                (default DebugCapture if omitted)
+        """
+        if headless is None:
+            headless = os.getenv('USE_HEADLESS', 'true').lower() == 'true'
+
+        self.session = session
+        self.concurrency = max(1, concurrency)
+        self.headless = headless
+        self.storage_state_path = storage_state_path
+        self.request_filter = request_filter or RequestFilter()
+        self.fast_path = fast_path
+        self.tier_stats = tier_stats or TierStats()
+        self.archive = archive
+        self.rate_controller = rate_controller
+        if rate_controller is not None:
+            # Let every configured page have a navigation in flight
+            rate_controller.set_concurrency(self.concurrency)
+        self.debug_capture = debug_capture or DebugCapture()
+        self.login_url = "https://pendulumedu.com/login"
+        self.reveal_timeout = DEFAULT_REVEAL_TIMEOUT
+
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._logins = 0
+
+    async def __aenter__(self) -> "AsyncQuizScraper":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Prepare the engine; the browser is launched on the first browser fallback"""
+        # Without a fast path every quiz needs the browser, so fail before scraping
+        if self.fast_path is None and not ASYNC_PLAYWRIGHT_AVAILABLE:
+            raise ScraperError("Playwright not installed. Run: pip install playwright && playwright install chromium")
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._login_lock = asyncio.Lock()
+        self._launch_lock = asyncio.Lock()
+
+    async def _get_context(self):
+        """Shared logged-in context, launching the browser on first use"""
+        async with self._launch_lock:
+            if self._context is None:
+                await self._launch()
+            return self._context
+
+    async def _launch(self) -> None:
+        """Launch the browser and create the shared logged-in context (launch lock held)"""
+        if not ASYNC_PLAYWRIGHT_AVAILABLE:
+            raise ScraperError("Playwright not installed. Run: pip install playwright && playwright install chromium")
+
+        async_playwright = backend('playwright_async').load()
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+
+            options = {'user_agent': DEFAULT_USER_AGENT}
+            if self.storage_state_path and Path(self.storage_state_path).exists():
+                options['storage_state'] = self.storage_state_path
+            context = await self._browser.new_context(**options)
+
+            cookies = session_cookies_for_browser(self.session)
+            if cookies:
+                await context.add_cookies(cookies)
+
+            await self.request_filter.install_async(context)
+        except Exception:
+            # Leave nothing half-started; the next fallback tries again
+            await self.close()
+            raise
+        self._context = context
+
+        logger.info(f"ASYNC: Browser launched (headless={self.headless}, concurrency={self.concurrency})")
+
+    async def close(self) -> None:
+        """Close the shared context, browser and Playwright driver if they were launched"""
+        if self._playwright is None:
+            return
+        try:
+            if self._context:
+                await self._context.close()
+            if self._browser:
+                await self._browser.close()
+        except Exception as e:
+            logger.warning(f"ASYNC: Error while closing browser: {e}")
+        finally:
+            if self._playwright:
+                await self._playwright.stop()
+            self._context = self._browser = self._playwright = None
+            logger.info("ASYNC: Browser closed")
+            self.request_filter.log_summary()
+
+    async def _goto(self, page, url: str):
+        """
+        Navigate a page (waiting for network idle), paced by the rate controller
+
+        The rate-limited slot is released once the response arrives, so the
+        network-idle wait of one page does not hold back the others.
+        """
+        if self.rate_controller is None:
+            return await page.goto(url, wait_until='networkidle', timeout=30000)
+
+        started = time.monotonic()
+        async with self.rate_controller.async_slot(url) as ticket:
+            response = await page.goto(url, wait_until='commit', timeout=30000)
+            ticket.status = response.status if response else 200
+
+        remaining = 30000 - (time.monotonic() - started) * 1000
+        await page.wait_for_load_state('networkidle', timeout=max(1000.0, remaining))
+        return response
+
+    async def _is_logged_out(self, page) -> bool:
+        """Check whether a loaded page shows the logged-out state"""
+        if '/login' in page.url.lower():
+            return True
+        try:
+            signin = page.locator('.signin-btn, .signup-btn')
+            return await signin.count() > 0 and await signin.first.is_visible()
+        except Exception:
+            return False
+
+    async def _ensure_logged_in(self, page, url: str) -> None:
+        """
+        Fall back to a single form login shared by all pages of the context.
+
+        Only one page logs in; pages that were waiting on the lock simply
+        reload once the shared context holds the new session.
+        """
+        async with self._login_lock:
+            await self._goto(page, url)
+            if not await self._is_logged_out(page):
+                return
+
+            email = os.getenv('LOGIN_EMAIL')
+            password = os.getenv('LOGIN_PASSWORD')
+            if not email or not password:
+                raise ScraperError("LOGIN_EMAIL and LOGIN_PASSWORD must be set")
+
+            logger.info("ASYNC: Injected session not accepted, logging in with form...")
+            await self._goto(page, self.login_url)
+            await page.fill('input[name="emailId"]', email)
+            await page.fill('input[name="password"]', password)
+            await page.click('button[type="submit"]')
+            await page.wait_for_load_state('networkidle', timeout=10000)
+            self._logins += 1
+
+            if self.storage_state_path:
+                try:
+                    Path(self.storage_state_path).parent.mkdir(parents=True, exist_ok=True)
+                    await self._context.storage_state(path=self.storage_state_path)
+                except Exception as e:
+                    logger.warning(f"ASYNC: Could not save storage state: {e}")
+
+            await self._goto(page, url)
+            if await self._is_logged_out(page):
+                raise ScraperError("Browser session is not logged in after form login")
+
+    async def submit_quiz(self, url: str) -> str:
+        """
+        Open a quiz on its own page and return the HTML with solutions revealed
+
+        Args:
+            url: URL of the quiz page
+
+        Returns:
+            HTML content with solutions visible
+        """
+        async with self._semaphore:
+            html = None
+            if self.fast_path:
+                html = await asyncio.to_thread(self.fast_path, url)
+
+            if html is None:
+                html = await self._reveal_in_browser(url)
+                self.tier_stats.record(url, 'browser')
+
+            if self.archive:
+                await asyncio.to_thread(self.archive.put, url, html)
+            return html
+
+    async def _reveal_in_browser(self, url: str) -> str:
+        """Reveal solutions on a fresh page of the shared context"""
+        context = await self._get_context()
+        page = await context.new_page()
+        try:
+            async with self.debug_capture.capture_async(url, 'playwright') as capture:
+                capture.attach_page(page)
+                await self._goto(page, url)
+                if await self._is_logged_out(page):
+                    await self._ensure_logged_in(page, url)
+
+                # One deadline covers finding the submit button and the reveal itself
+                wait_started = time.monotonic()
+                deadline = wait_started + self.reveal_timeout
+                revealed = await page.evaluate(SOLUTIONS_REVEALED_JS, list(REVEAL_MARKERS))
+
+                if not revealed:
+                    submit_button = page.locator('#submit-ans')
+                    await submit_button.wait_for(state='visible', timeout=remaining_ms(deadline))
+                    await submit_button.scroll_into_view_if_needed()
+
+                    page.on('dialog', lambda dialog: dialog.accept())
+                    await submit_button.click()
+
+                    try:
+                        await page.wait_for_function(
+                            SOLUTIONS_REVEALED_JS,
+                            arg=list(REVEAL_MARKERS),
+                            polling='mutation',
+                            timeout=remaining_ms(deadline)
+                        )
+                        revealed = True
+                    except Exception:
+                        revealed = False
+
+                waited = time.monotonic() - wait_started
+                if revealed:
+                    logger.info(f"ASYNC: ✓ Solutions revealed after {waited:.2f}s: {url}")
+                else:
+                    logger.warning(f"ASYNC: Timeout after {waited:.2f}s waiting for solutions: {url}")
+                    capture.mark_failed(f"solutions not revealed after {waited:.2f}s")
+
+                return await page.content()
+        finally:
+            await page.close()
+
+    async def scrape_all(self, urls: List[str],
+                         handler: Optional[Callable[[str, str], object]] = None) -> Dict[str, object]:
+        """
+        Scrape all URLs concurrently (bounded by the concurrency cap)
+
+        Each page's HTML is handed to the handler (run in a worker thread so
+        parsing does not block the event loop) as soon as it is ready, and
+        only the handler's result is kept, so memory stays flat on big months.
+
+        Args:
+            urls: Quiz URLs to scrape
+            handler: Callable(url, html) whose return value is stored;
+                the raw HTML is stored when omitted
+
+        Returns:
+            Mapping of URL to handler result for URLs that succeeded, in the
+            order of urls (not completion order)
+        """
+        results: Dict[str, object] = {}
+        total = len(urls)
+
+        async def run_one(index: int, url: str) -> None:
+            try:
+                logger.info(f"[{index}/{total}] Processing: {url}")
+                html = await self.submit_quiz(url)
+                if handler:
+                    result = await asyncio.to_thread(handler, url, html)
+                else:
+                    result = html
+                if result is not None:
+                    results[url] = result
+            except Exception as e:
+                logger.error(f"[{index}/{total}] ✗ Error: {e}")
+
+        started = time.monotonic()
+        await asyncio.gather(*(run_one(idx, url) for idx, url in enumerate(urls, 1)))
+
+        logger.info(
+            f"ASYNC: Scraped {len(results)}/{total} quizzes in {time.monotonic() - started:.1f}s "
+            f"(concurrency={self.concurrency}, form logins={self._logins})"
+        )
+        logger.info(f"ASYNC: Reveal tiers: {self.tier_stats.summary()}")
+        return {url: results[url] for url in urls if url in results}
+
+
+def scrape_quizzes(session: requests.Session, urls: List[str], concurrency: int = 5,
+                   handler: Optional[Callable[[str, str], object]] = None,
+                   fast_path: Optional[Callable[[str], Optional[str]]] = None,
+                   tier_stats: Optional[TierStats] = None,
+                   archive: Optional[HTMLArchive] = None,
+                   rate_controller: Optional[RateController] = None) -> Dict[str, object]:
+    """
+    Synchronous entry point for the async engine
+
+    Args:
+        session: Authenticated requests.Session
+        urls: Quiz URLs to scrape
+        concurrency: Maximum number of concurrent pages
+        handler: Optional Callable(url, html) applied to every page
+        fast_path: Optional HTTP reveal tried before the browser
+        tier_stats: Optional TierStats shared with the sync scraper
+        archive: Optional HTMLArchive for revealed pages
+        rate_controller: Optional RateController shared with the sync scraper
+
+    Returns:
+        Mapping of URL to handler result (or HTML)
+    """
+    async def run() -> Dict[str, object]:
+        async with AsyncQuizScraper(session, concurrency=concurrency,
+                                    fast_path=fast_path, tier_stats=tier_stats,
+                                    archive=archive,
+                                    rate_controller=rate_controller) as scraper:
+            return await scraper.scrape_all(urls, handler)
+
+    return asyncio.run(run())
@@ -0,0 +1,359 @@
+"""
+Persistent Playwright browser pool for pendulumedu.com scraping.
+Keeps one Chromium instance alive per worker thread and recycles pages
+between quizzes instead of launching a fresh browser for every call.
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import requests
+
+from .request_filter import RequestFilter
+from .rate_limiter import RateController
+from .lazy_imports import backend
+
+# Checked without importing; Playwright itself loads when the first browser launches
+PLAYWRIGHT_AVAILABLE = backend('playwright').available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+)
+
+
+class BrowserPoolError(Exception):
+    """Raised when the browser pool cannot provide a page"""
+    pass
+
+
+def session_cookies_for_browser(session: requests.Session,
+                                default_url: str = "https://pendulumedu.com") -> List[Dict]:
+    """
+    Convert the cookies of a requests.Session into Playwright cookie dicts.
+    
+    Args:
+        session: Authenticated requests.Session (e.g. from LoginManager)
+        default_url: URL used for cookies that carry no domain
+        
+    Returns:
+        List of cookies accepted by BrowserContext.add_cookies()
+    """
+    cookies = []
+    for cookie in session.cookies:
+        entry = {
+            'name': cookie.name,
+            'value': cookie.value,
+        }
+        if cookie.domain:
+            entry['domain'] = cookie.domain
+            entry['path'] = cookie.path or '/'
+        else:
+            entry['url'] = default_url
+        if cookie.expires:
+            entry['expires'] = float(cookie.expires)
+        if cookie.secure:
+            entry['secure'] = True
+        cookies.append(entry)
+    return cookies
+
+
+class _ThreadBrowser:
+    """Playwright objects owned by a single thread."""
+
+    def __init__(self, playwright, browser, context):
+        self.playwright = playwright
+        self.browser = browser
+        self.context = context
+        self.idle_pages: List = []
+        self.page_uses = {}
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium browser and context that hands out reusable pages.
+
+    Playwright's sync API is bound to the thread that started it, so the pool
+    keeps one browser per thread. Single-threaded callers (the daily runner)
+    therefore share one browser for the whole run, and each worker thread of
+    the bulk scraper reuses its own browser across all quizzes it processes.
+
+    For the same reason a browser can only be closed by the thread that
+    launched it: every thread that used the pool must call close() itself
+    before it exits (the bulk scraper's workers do so when their queue is
+    drained). open_browsers counts browsers that are still open.
+    """
+
+    def __init__(self, headless: Optional[bool] = None,
+                 user_agent: str = DEFAULT_USER_AGENT,
+                 max_page_uses: int = 10,
+                 cookies: Optional[List[Dict]] = None,
+                 storage_state_path: Optional[str] = "data/browser_state.json",
+                 request_filter: Optional[RequestFilter] = None,
+                 rate_controller: Optional[RateController] = None):
+        """
+        Initialize the pool (the browser itself is launched lazily).
+
+        Args:
+            headless: Run Chromium headless (defaults to USE_HEADLESS env var)
+            user_agent: User agent for the browser context
+            max_page_uses: Number of times a page is recycled before it is closed
+            cookies: Authenticated cookies injected into every new context
+            storage_state_path: Saved Playwright storage_state restored into new
+                contexts and refreshed after a browser form login
+            request_filter: Blocks non-essential requests on every context
+                (a default RequestFilter is used if omitted)
+            rate_controller: Paces page navigations together with the
+                scraper's HTTP requests (navigations are not limited if None)
+        """
+        if headless is None:
+            headless = os.getenv('USE_HEADLESS', 'true').lower() == 'true'
+
+        self.headless = headless
+        self.user_agent = user_agent
+        self.max_page_uses = max_page_uses
+        self.cookies = list(cookies or [])
+        self.storage_state_path = storage_state_path
+        self.request_filter = request_filter or RequestFilter()
+        self.rate_controller = rate_controller
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._launch_count = 0
+        # Thread name of every browser launched and not yet closed
+        self._open: Dict[int, str] = {}
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def launch_count(self) -> int:
+        """Number of browsers launched by this pool so far."""
+        return self._launch_count
+
+    @property
+    def open_browsers(self) -> int:
+        """Number of browsers launched by any thread and not yet closed."""
+        with self._lock:
+            return len(self._open)
+
+    def _get_thread_browser(self) -> _ThreadBrowser:
+        """Return the calling thread's browser, launching it on first use."""
+        state = getattr(self._local, 'state', None)
+        if state is not None:
+            if self._is_connected(state):
+                return state
+            # A crashed or killed browser cannot serve pages again; start over
+            logger.warning("PLAYWRIGHT: Browser disconnected, launching a new one")
+            self._close_state(state)
+
+        if not PLAYWRIGHT_AVAILABLE:
+            raise BrowserPoolError("Playwright not installed. Run: pip install playwright && playwright install chromium")
+
+        sync_playwright = backend('playwright').load()
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=self.headless)
+            context = self._new_context(browser)
+        except Exception:
+            playwright.stop()
+            raise
+
+        state = _ThreadBrowser(playwright, browser, context)
+        self._local.state = state
+
+        with self._lock:
+            self._launch_count += 1
+            self._open[threading.get_ident()] = threading.current_thread().name
+
+        logger.info(f"PLAYWRIGHT: Browser launched (headless={self.headless}, thread={threading.current_thread().name})")
+        return state
+
+    def _new_context(self, browser):
+        """
+        Create the browser context used for every page of a thread.
+
+        The saved storage_state (if any) is restored first and the injected
+        cookies are added on top, so a session freshly validated by
+        LoginManager wins over an older browser login.
+        """
+        options = {'user_agent': self.user_agent}
+        if self.storage_state_path and Path(self.storage_state_path).exists():
+            options['storage_state'] = self.storage_state_path
+
+        try:
+            context = browser.new_context(**options)
+        except Exception as e:
+            logger.warning(f"PLAYWRIGHT: Could not restore storage state ({e}), starting clean")
+            context = browser.new_context(user_agent=self.user_agent)
+
+        if self.cookies:
+            try:
+                context.add_cookies(self.cookies)
+                logger.info(f"PLAYWRIGHT: Injected {len(self.cookies)} session cookies into browser context")
+            except Exception as e:
+                logger.warning(f"PLAYWRIGHT: Could not inject session cookies: {e}")
+
+        self.request_filter.install(context)
+        return context
+
+    @property
+    def context(self):
+        """Browser context of the calling thread."""
+        return self._get_thread_browser().context
+
+    def save_storage_state(self) -> Optional[List[Dict]]:
+        """
+        Persist the calling thread's context state after a form login.
+
+        The new cookies also replace the injected ones so that contexts
+        launched later by other threads start from the fresh session.
+
+        Returns:
+            The context cookies, or None if saving failed
+        """
+        context = self._get_thread_browser().context
+        try:
+            if self.storage_state_path:
+                Path(self.storage_state_path).parent.mkdir(parents=True, exist_ok=True)
+                context.storage_state(path=self.storage_state_path)
+            cookies = context.cookies()
+        except Exception as e:
+            logger.warning(f"PLAYWRIGHT: Could not save storage state: {e}")
+            return None
+
+        with self._lock:
+            self.cookies = cookies
+        return cookies
+
+    @contextmanager
+    def page(self) -> Iterator:
+        """
+        Borrow a page from the pool.
+
+        The page is returned to the pool after use (navigated to about:blank)
+        unless it has been used max_page_uses times, was closed, or the
+        caller raised while using it (its state is then unknown).
+
+        Yields:
+            Playwright Page object
+        """
+        state = self._get_thread_browser()
+
+        if state.idle_pages:
+            page = state.idle_pages.pop()
+        else:
+            page = state.context.new_page()
+            state.page_uses[page] = 0
+
+        try:
+            yield page
+        except BaseException:
+            self._discard_page(state, page)
+            raise
+        else:
+            self._release_page(state, page)
+
+    def goto(self, page, url: str, **kwargs):
+        """
+        Navigate a page, paced by the shared rate controller.
+
+        Args:
+            page: Page borrowed from this pool
+            url: URL to open
+            **kwargs: Passed to Page.goto (wait_until, timeout, ...)
+
+        Returns:
+            Playwright Response of the navigation (or None)
+        """
+        if self.rate_controller is None:
+            return page.goto(url, **kwargs)
+
+        # The slot covers the request itself; waiting for the load state
+        # (e.g. network idle) happens after it is handed to the next worker
+        wait_until = kwargs.pop('wait_until', 'load')
+        timeout = kwargs.get('timeout')
+        started = time.monotonic()
+        with self.rate_controller.slot(url) as ticket:
+            response = page.goto(url, wait_until='commit', **kwargs)
+            ticket.status = response.status if response else 200
+
+        if wait_until != 'commit':
+            load_options = {}
+            if timeout is not None:
+                # One deadline for the navigation and the load state together
+                remaining = timeout - (time.monotonic() - started) * 1000
+                load_options['timeout'] = max(1000.0, remaining)
+            page.wait_for_load_state(wait_until, **load_options)
+        return response
+
+    def _release_page(self, state: _ThreadBrowser, page) -> None:
+        """Recycle a page or close it when it is worn out."""
+        uses = state.page_uses.get(page, 0) + 1
+        state.page_uses[page] = uses
+
+        if page.is_closed() or uses >= self.max_page_uses:
+            self._discard_page(state, page)
+            return
+
+        try:
+            page.goto('about:blank')
+            state.idle_pages.append(page)
+        except Exception:
+            self._discard_page(state, page)
+
+    def _discard_page(self, state: _ThreadBrowser, page) -> None:
+        """Close a page and forget about it."""
+        state.page_uses.pop(page, None)
+        try:
+            if not page.is_closed():
+                page.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_connected(state: _ThreadBrowser) -> bool:
+        try:
+            return state.browser.is_connected()
+        except Exception:
+            return False
+
+    def _close_state(self, state: _ThreadBrowser) -> None:
+        """Close one thread's Playwright objects (called from that thread)."""
+        self._local.state = None
+        with self._lock:
+            self._open.pop(threading.get_ident(), None)
+        try:
+            state.context.close()
+            state.browser.close()
+        except Exception as e:
+            logger.warning(f"PLAYWRIGHT: Error while closing browser: {e}")
+        finally:
+            try:
+                state.playwright.stop()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """
+        Close the calling thread's browser if one was launched.
+
+        Browsers of other threads are left alone: Playwright objects cannot
+        be used across threads, so each thread closes its own.
+        """
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            return
+
+        self._close_state(state)
+        logger.info("PLAYWRIGHT: Browser closed")
+        self.request_filter.log_summary()
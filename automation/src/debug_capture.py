@@ -0,0 +1,246 @@
+"""
+Failure-only debug artifacts for scraping and parsing stages.
+A capture keeps references to the HTML and the live page of one quiz while
+a stage runs. Nothing is rendered or written unless the stage fails (or
+SCRAPER_DEBUG is on); then the HTML, a screenshot and an optional
+Playwright trace go to a bounded per-URL ring under debug/.
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QuizCapture:
+    """In-memory artifacts of one stage for one quiz"""
+
+    def __init__(self, url: str, stage: str):
+        self.url = url
+        self.stage = stage
+        self.html: Dict[str, str] = {}
+        self.notes: Dict[str, str] = {}
+        self.page = None
+        self.context = None
+        self.tracing = False
+        self.failure: Optional[str] = None
+
+    def add_html(self, name: str, html: str) -> None:
+        """Keep a reference to an HTML document (no copy, no I/O)"""
+        self.html[name] = html
+
+    def note(self, key: str, value) -> None:
+        """Record a small piece of context (shown in info.json)"""
+        self.notes[key] = str(value)
+
+    def attach_page(self, page, context=None, trace: bool = False) -> None:
+        """
+        Remember the live page so a screenshot can be taken on failure
+
+        Args:
+            page: Playwright page used by the stage
+            context: Its browser context (needed for tracing)
+            trace: Start a Playwright trace for this stage
+        """
+        self.page = page
+        self.context = context
+        if trace and context is not None:
+            try:
+                context.tracing.start(screenshots=True, snapshots=True)
+                self.tracing = True
+            except Exception as e:
+                logger.debug(f"DEBUG: Could not start trace: {e}")
+
+    def mark_failed(self, reason: str) -> None:
+        """Flag the stage as failed without raising"""
+        self.failure = reason
+
+    @property
+    def failed(self) -> bool:
+        return self.failure is not None
+
+
+class DebugCapture:
+    """Writes failed (or, in debug mode, all) captures to a bounded on-disk ring"""
+
+    def __init__(self, directory: Optional[str] = None, enabled: Optional[bool] = None,
+                 trace: Optional[bool] = None, max_per_url: Optional[int] = None,
+                 max_urls: Optional[int] = None):
+        """
+        Initialize debug capture
+
+        Args:
+            directory: Ring directory (DEBUG_CAPTURE_DIR env var, debug)
+            enabled: Also write successful stages (SCRAPER_DEBUG env var, false)
+            trace: Record Playwright traces for browser stages (SCRAPER_DEBUG_TRACE env var, false)
+            max_per_url: Captures kept per quiz URL (DEBUG_CAPTURE_PER_URL env var, 3)
+            max_urls: Quiz URLs kept in the ring (DEBUG_CAPTURE_MAX_URLS env var, 20)
+        """
+        if directory is None:
+            directory = os.getenv('DEBUG_CAPTURE_DIR', 'debug')
+        if enabled is None:
+            enabled = os.getenv('SCRAPER_DEBUG', 'false').lower() == 'true'
+        if trace is None:
+            trace = os.getenv('SCRAPER_DEBUG_TRACE', 'false').lower() == 'true'
+        if max_per_url is None:
+            max_per_url = int(os.getenv('DEBUG_CAPTURE_PER_URL', '3'))
+        if max_urls is None:
+            max_urls = int(os.getenv('DEBUG_CAPTURE_MAX_URLS', '20'))
+
+        self.directory = Path(directory)
+        self.enabled = enabled
+        self.trace = trace
+        self.max_per_url = max(1, max_per_url)
+        self.max_urls = max(1, max_urls)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def capture(self, url: str, stage: str) -> Iterator[QuizCapture]:
+        """
+        Capture one stage; artifacts are written if it raises or is marked failed
+
+        Args:
+            url: Quiz URL
+            stage: Stage name ("playwright", "http", "parse", ...)
+
+        Yields:
+            QuizCapture to attach HTML and the page to
+        """
+        capture = QuizCapture(url, stage)
+        try:
+            yield capture
+        except GeneratorExit:
+            # A streaming consumer stopped early; that is not a failure of this stage
+            self._finish(capture, write=capture.failed or self.enabled)
+            raise
+        except BaseException as e:
+            capture.mark_failed(f"{type(e).__name__}: {e}")
+            self._finish(capture, write=True)
+            raise
+        else:
+            self._finish(capture, write=capture.failed or self.enabled)
+
+    @asynccontextmanager
+    async def capture_async(self, url: str, stage: str) -> AsyncIterator[QuizCapture]:
+        """Asyncio variant of capture() for async Playwright pages"""
+        capture = QuizCapture(url, stage)
+        try:
+            yield capture
+        except BaseException as e:
+            capture.mark_failed(f"{type(e).__name__}: {e}")
+            await self._finish_async(capture, write=True)
+            raise
+        else:
+            await self._finish_async(capture, write=capture.failed or self.enabled)
+
+    def _finish(self, capture: QuizCapture, write: bool) -> None:
+        """Collect page artifacts (only when writing) and flush"""
+        if not write:
+            self._stop_trace(capture, write_trace=False)
+            return
+
+        artifacts: Dict[str, bytes] = {}
+        if capture.page is not None:
+            try:
+                artifacts['page.html'] = capture.page.content().encode('utf-8')
+                artifacts['screenshot.png'] = capture.page.screenshot(full_page=True)
+            except Exception as e:
+                capture.note('page_capture_error', e)
+        trace = self._stop_trace(capture, write_trace=True)
+        if trace:
+            artifacts['trace.zip'] = trace
+
+        self._write(capture, artifacts)
+
+    async def _finish_async(self, capture: QuizCapture, write: bool) -> None:
+        if not write:
+            return
+
+        artifacts: Dict[str, bytes] = {}
+        if capture.page is not None:
+            try:
+                artifacts['page.html'] = (await capture.page.content()).encode('utf-8')
+                artifacts['screenshot.png'] = await capture.page.screenshot(full_page=True)
+            except Exception as e:
+                capture.note('page_capture_error', e)
+
+        self._write(capture, artifacts)
+
+    def _stop_trace(self, capture: QuizCapture, write_trace: bool) -> Optional[bytes]:
+        """Stop a running trace, returning its bytes if they are needed"""
+        if not capture.tracing:
+            return None
+        capture.tracing = False
+        try:
+            if not write_trace:
+                capture.context.tracing.stop()
+                return None
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, 'trace.zip')
+                capture.context.tracing.stop(path=path)
+                with open(path, 'rb') as f:
+                    return f.read()
+        except Exception as e:
+            capture.note('trace_error', e)
+            return None
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """Readable, collision-free directory name for a URL"""
+        slug = re.sub(r'[^a-z0-9-]+', '-', url.rstrip('/').rsplit('/', 1)[-1].lower()).strip('-')[:60]
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]
+        return f"{slug or 'page'}-{digest}"
+
+    def _write(self, capture: QuizCapture, artifacts: Dict[str, bytes]) -> None:
+        """Write one capture into the ring and prune old entries"""
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        url_dir = self.directory / self._url_key(capture.url)
+        entry_dir = url_dir / f"{stamp}-{capture.stage}"
+
+        info = {
+            'url': capture.url,
+            'stage': capture.stage,
+            'failure': capture.failure,
+            'captured_at': datetime.now().isoformat(timespec='seconds'),
+            'notes': capture.notes,
+        }
+
+        with self._lock:
+            try:
+                entry_dir.mkdir(parents=True, exist_ok=True)
+                for name, html in capture.html.items():
+                    (entry_dir / f"{name}.html").write_text(html, encoding='utf-8')
+                for name, data in artifacts.items():
+                    (entry_dir / name).write_bytes(data)
+                (entry_dir / 'info.json').write_text(json.dumps(info, indent=2, ensure_ascii=False), encoding='utf-8')
+                os.utime(url_dir)
+                self._prune(url_dir)
+            except OSError as e:
+                logger.warning(f"DEBUG: Could not write debug capture for {capture.url}: {e}")
+                return
+
+        label = f"failed ({capture.failure})" if capture.failed else "debug mode"
+        logger.info(f"DEBUG: Saved {capture.stage} artifacts for {capture.url} to {entry_dir} [{label}]")
+
+    def _prune(self, url_dir: Path) -> None:
+        """Keep max_per_url entries per URL and max_urls URLs (lock held)"""
+        entries = sorted(path for path in url_dir.iterdir() if path.is_dir())
+        for old in entries[:-self.max_per_url]:
+            shutil.rmtree(old, ignore_errors=True)
+
+        url_dirs = sorted(
+            (path for path in self.directory.iterdir() if path.is_dir()),
+            key=lambda path: path.stat().st_mtime
+        )
+        for old in url_dirs[:-self.max_urls]:
+            shutil.rmtree(old, ignore_errors=True)
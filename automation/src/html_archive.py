@@ -0,0 +1,164 @@
+"""
+Content-addressed archive of revealed quiz pages.
+Every HTML page returned by QuizScraper.submit_quiz is stored gzip-compressed
+under its SHA-256 and indexed by quiz URL and date, so parser and translator
+changes can be re-run over past quizzes without scraping pendulumedu again.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .date_extractor import DateExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class HTMLArchive:
+    """Compressed, de-duplicated store of quiz HTML with a URL index"""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the archive (files are created on first store)
+
+        Args:
+            directory: Archive directory (defaults to HTML_ARCHIVE_DIR env var, data/archive)
+        """
+        if directory is None:
+            directory = os.getenv('HTML_ARCHIVE_DIR', 'data/archive')
+
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / 'objects'
+        self.index_path = self.directory / 'index.json'
+        self.date_extractor = DateExtractor()
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict]] = None
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Read index.json once per process (lock held)"""
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"ARCHIVE: Could not read index ({e}), starting a new one")
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        """Write index.json atomically (lock held)"""
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def put(self, url: str, html: str) -> Optional[str]:
+        """
+        Archive the HTML of a quiz page
+
+        Identical pages are stored once; the index always points the URL
+        at its latest content.
+
+        Args:
+            url: Quiz URL
+            html: Revealed page HTML
+
+        Returns:
+            SHA-256 of the content, or None if it could not be written
+        """
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+
+        date_info = self.date_extractor.extract_date_from_url(url)
+        quiz_date = date_info[0].strftime('%Y-%m-%d') if date_info else None
+
+        with self._lock:
+            try:
+                if not object_path.exists():
+                    object_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = object_path.with_suffix('.tmp')
+                    with open(tmp_path, 'wb') as f:
+                        f.write(gzip.compress(data, compresslevel=6))
+                    os.replace(tmp_path, object_path)
+
+                index = self._load_index()
+                index[url] = {
+                    'sha256': digest,
+                    'date': quiz_date,
+                    'archived_at': datetime.now().isoformat(timespec='seconds'),
+                    'size': len(data),
+                }
+                self._save_index()
+            except OSError as e:
+                logger.warning(f"ARCHIVE: Could not archive {url}: {e}")
+                return None
+
+        return digest
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Load the archived HTML of a quiz
+
+        Args:
+            url: Quiz URL
+
+        Returns:
+            HTML content, or None if the URL was never archived
+        """
+        with self._lock:
+            entry = self._load_index().get(url)
+        if not entry:
+            return None
+
+        try:
+            with open(self._object_path(entry['sha256']), 'rb') as f:
+                return gzip.decompress(f.read()).decode('utf-8')
+        except (OSError, ValueError) as e:
+            logger.warning(f"ARCHIVE: Could not read archived page for {url}: {e}")
+            return None
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._load_index()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+    def urls(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[str]:
+        """
+        Archived quiz URLs, newest quiz date first (like the website listing)
+
+        Args:
+            since: Only quizzes dated on or after this day
+            until: Only quizzes dated on or before this day
+
+        Returns:
+            List of archived URLs
+        """
+        with self._lock:
+            entries = dict(self._load_index())
+
+        selected = []
+        for url, entry in entries.items():
+            quiz_date = entry.get('date')
+            if since and (not quiz_date or quiz_date < since.strftime('%Y-%m-%d')):
+                continue
+            if until and (not quiz_date or quiz_date > until.strftime('%Y-%m-%d')):
+                continue
+            selected.append((quiz_date or '', url))
+
+        selected.sort(reverse=True)
+        return [url for _, url in selected]
@@ -0,0 +1,305 @@
+"""
+On-disk conditional-GET cache for the scraper's requests.Session.
+Stores gzip-compressed bodies with their ETag/Last-Modified validators,
+revalidates them with If-None-Match/If-Modified-Since, and serves the
+cached body only when the server answers 304 Not Modified.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .rate_limiter import RateLimitedAdapter
+
+logger = logging.getLogger(__name__)
+
+# Response headers that describe the wire encoding, not the stored body
+HOP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+
+class HTTPCache:
+    """Size-bounded store of validated response bodies keyed by URL"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache (the directory is created on first store)
+
+        Args:
+            directory: Cache directory (defaults to HTTP_CACHE_DIR env var, data/http_cache)
+            max_bytes: Size limit of stored files (defaults to HTTP_CACHE_MAX_MB env var, 100 MB)
+        """
+        if directory is None:
+            directory = os.getenv('HTTP_CACHE_DIR', 'data/http_cache')
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('HTTP_CACHE_MAX_MB', '100')) * 1024 * 1024)
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        """Metadata and body file of an entry"""
+        key = self._key(url)
+        return self.directory / f"{key}.json", self.directory / f"{key}.body.gz"
+
+    def get(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Look up a cached response
+
+        Args:
+            url: Request URL
+
+        Returns:
+            (metadata, body) or None if not cached or unreadable
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = gzip.decompress(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"HTTP CACHE: Dropping unreadable entry for {url}: {e}")
+            self.delete(url)
+            return None
+
+        if meta.get('url') != url:
+            return None
+
+        # Touch the entry so eviction removes the least recently used first
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return meta, body
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Conditional request headers for a cached URL
+
+        Args:
+            url: Request URL
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, headers, body: bytes) -> None:
+        """
+        Store a 200 response that carries a validator
+
+        Args:
+            url: Request URL
+            headers: Response headers
+            body: Decoded response body
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS},
+            'stored_at': time.time(),
+        }
+        compressed = gzip.compress(body, compresslevel=6)
+        meta_path, body_path = self._paths(url)
+
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                previous = self._entry_size(meta_path, body_path)
+                with open(body_path, 'wb') as f:
+                    f.write(compressed)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+            except OSError as e:
+                logger.warning(f"HTTP CACHE: Could not store {url}: {e}")
+                return
+
+            size = self._entry_size(meta_path, body_path)
+            self._total_bytes = self._current_total() - previous + size
+            self._evict()
+
+    def delete(self, url: str) -> None:
+        """Remove an entry if present"""
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            size = self._entry_size(meta_path, body_path)
+            for path in (meta_path, body_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    @staticmethod
+    def _entry_size(meta_path: Path, body_path: Path) -> int:
+        size = 0
+        for path in (meta_path, body_path):
+            try:
+                size += path.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _current_total(self) -> int:
+        """Total stored bytes, scanning the directory once per process"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(
+                path.stat().st_size for path in self.directory.glob('*') if path.is_file()
+            )
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes (lock held)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        entries = sorted(self.directory.glob('*.json'), key=lambda path: path.stat().st_mtime)
+        for meta_path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            body_path = meta_path.with_name(meta_path.stem + '.body.gz')
+            size = self._entry_size(meta_path, body_path)
+            for path in (meta_path, body_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def record(self, outcome: str, saved: int = 0) -> None:
+        """Count a cache lookup ("hit", "miss" or "uncacheable")"""
+        with self._lock:
+            if outcome == 'hit':
+                self.hits += 1
+                self.bytes_saved += saved
+            elif outcome == 'miss':
+                self.misses += 1
+            else:
+                self.uncacheable += 1
+
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.uncacheable} uncacheable, "
+            f"~{self.bytes_saved / 1024:.0f} KB not re-downloaded, {self.evictions} evicted"
+        )
+
+    def log_summary(self) -> None:
+        """Log statistics if the cache was used"""
+        if self.hits or self.misses or self.uncacheable:
+            logger.info(f"HTTP CACHE: {self.summary()}")
+
+
+class CachingHTTPAdapter(RateLimitedAdapter):
+    """Rate-limited adapter that revalidates GET responses against an HTTPCache"""
+
+    def __init__(self, cache: HTTPCache, *args, **kwargs):
+        """
+        Args:
+            cache: Store used for validators and bodies
+            *args, **kwargs: Passed to RateLimitedAdapter (e.g. max_retries, rate_controller)
+        """
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        url = request.url
+        sent_validators = False
+        # Callers ask for a fresh copy with Cache-Control: no-cache; the response is still stored
+        bypass = 'no-cache' in request.headers.get('Cache-Control', '')
+        if not bypass and not any(h in request.headers for h in ('If-None-Match', 'If-Modified-Since')):
+            validators = self.cache.validators(url)
+            request.headers.update(validators)
+            sent_validators = bool(validators)
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and sent_validators:
+            cached = self.cache.get(url)
+            if cached is not None:
+                meta, body = cached
+                self.cache.record('hit', len(body))
+                return self._cached_response(request, response, meta, body)
+            # Entry vanished between validation and read: ask again unconditionally
+            for header in ('If-None-Match', 'If-Modified-Since'):
+                request.headers.pop(header, None)
+            response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 200:
+            if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+                self.cache.store(url, response.headers, response.content)
+                self.cache.record('miss')
+            else:
+                self.cache.record('uncacheable')
+
+        return response
+
+    def _cached_response(self, request, not_modified: Response, meta: Dict, body: bytes) -> Response:
+        """Build a 200 response from a cache entry validated by a 304"""
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        # Validators refreshed by the 304 take precedence
+        for header in ('ETag', 'Last-Modified', 'Date', 'Cache-Control'):
+            if header in not_modified.headers:
+                response.headers[header] = not_modified.headers[header]
+        response.headers['X-Cache'] = 'HIT'
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        # Keep the 304's raw response so Set-Cookie headers still reach the session
+        response.raw = not_modified.raw
+        response.cookies = not_modified.cookies
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        return response
@@ -0,0 +1,150 @@
+"""
+Lazy loading of heavy third-party backends.
+Playwright, python-telegram-bot, supabase and deep_translator are imported
+the first time a stage actually uses them, so a run that finds nothing new
+never pays for them. Every timed import is recorded for the
+startup report logged by the runner.
+"""
+
+import time
+import logging
+import importlib
+import importlib.util
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Process-relative reference point for the startup report
+PROCESS_START = time.perf_counter()
+
+_lock = threading.Lock()
+
+# Seconds spent importing, per module or backend name, in first-import order
+IMPORT_TIMES: Dict[str, float] = {}
+
+
+def record_import(name: str, seconds: float) -> None:
+    """Remember how long importing name took (first import only)"""
+    with _lock:
+        IMPORT_TIMES.setdefault(name, seconds)
+
+
+@contextmanager
+def import_timer(name: str) -> Iterator[None]:
+    """
+    Time an import block for the startup report
+
+    Example:
+        with import_timer('src.scraper'):
+            from src.scraper import QuizScraper
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_import(name, time.perf_counter() - started)
+
+
+class LazyBackend:
+    """A module (or one of its attributes) imported on first use"""
+
+    def __init__(self, name: str, module: str, attribute: Optional[str] = None,
+                 install_hint: Optional[str] = None):
+        """
+        Args:
+            name: Registry name used in the startup report
+            module: Module to import
+            attribute: Attribute of the module to return instead of the module
+            install_hint: Appended to the ImportError when the module is missing
+        """
+        self.name = name
+        self.module = module
+        self.attribute = attribute
+        self.install_hint = install_hint
+        self._value = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether the module can be imported (checked without importing it)"""
+        if self._value is not None:
+            return True
+        try:
+            return importlib.util.find_spec(self.module.split('.')[0]) is not None
+        except (ImportError, ValueError):
+            return False
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def load(self):
+        """
+        Import the backend (once) and return the module or attribute
+
+        Raises:
+            ImportError: If the module is not installed
+        """
+        if self._value is not None:
+            return self._value
+
+        with self._load_lock:
+            if self._value is None:
+                started = time.perf_counter()
+                try:
+                    module = importlib.import_module(self.module)
+                except ImportError as e:
+                    hint = f" {self.install_hint}" if self.install_hint else ""
+                    raise ImportError(f"{self.name} backend unavailable: {e}.{hint}") from e
+                value = getattr(module, self.attribute) if self.attribute else module
+                record_import(self.name, time.perf_counter() - started)
+                logger.debug(f"Loaded {self.name} backend in {IMPORT_TIMES[self.name] * 1000:.0f} ms")
+                self._value = value
+        return self._value
+
+
+BACKENDS: Dict[str, LazyBackend] = {
+    'playwright': LazyBackend(
+        'playwright', 'playwright.sync_api', 'sync_playwright',
+        "Run: pip install playwright && playwright install chromium"),
+    'playwright_async': LazyBackend(
+        'playwright_async', 'playwright.async_api', 'async_playwright',
+        "Run: pip install playwright && playwright install chromium"),
+    'telegram': LazyBackend('telegram', 'telegram', install_hint="Run: pip install python-telegram-bot"),
+    'supabase': LazyBackend('supabase', 'supabase', install_hint="Run: pip install supabase"),
+    'deep_translator': LazyBackend(
+        'deep_translator', 'deep_translator', 'GoogleTranslator',
+        "Run: pip install deep-translator"),
+}
+
+
+def backend(name: str) -> LazyBackend:
+    """Registry lookup"""
+    return BACKENDS[name]
+
+
+def import_report() -> str:
+    """
+    Startup cost broken down by module, most expensive first
+
+    Returns:
+        Multi-line report of timed imports and the lazy backends never loaded
+    """
+    with _lock:
+        times = dict(IMPORT_TIMES)
+
+    lines = [f"Startup import report ({(time.perf_counter() - PROCESS_START):.2f}s since start):"]
+    for name, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True):
+        lines.append(f"  {seconds * 1000:8.1f} ms  {name}")
+
+    skipped = [name for name, lazy in BACKENDS.items() if not lazy.loaded]
+    if skipped:
+        lines.append(f"  not loaded: {', '.join(skipped)}")
+    return '\n'.join(lines)
+
+
+def log_import_report() -> None:
+    """Log the startup import report"""
+    logger.info(import_report())
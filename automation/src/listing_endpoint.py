@@ -0,0 +1,222 @@
+"""
+Description of the paginated endpoint behind the listing's "Show more" button.
+The browser listing path records the XHR calls that clicking .show_more
+triggers; the HTTP listing path replays them through the requests.Session
+so later runs can page the listing without launching Chromium.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# Parameter names that usually carry the page number or offset
+PAGE_PARAM_HINTS = ('page', 'pageno', 'page_no', 'offset', 'start', 'limit_start', 'skip', 'count')
+
+
+class ListingEndpoint:
+    """Replayable description of the "Show more" request"""
+
+    def __init__(self, method: str, url: str, params: Dict[str, str], encoding: str,
+                 page_param: str, first_value: int, step: int):
+        """
+        Args:
+            method: HTTP method ("GET" or "POST")
+            url: Endpoint URL without query string
+            params: Query (GET) or body (POST) parameters of the first click
+            encoding: "query", "form" or "json"
+            page_param: Parameter that advances with every click
+            first_value: Its value on the first click (listing page 2)
+            step: Increment per click
+        """
+        self.method = method.upper()
+        self.url = url
+        self.params = params
+        self.encoding = encoding
+        self.page_param = page_param
+        self.first_value = first_value
+        self.step = step
+
+    def request_for_page(self, page_number: int) -> Dict:
+        """
+        Build requests.Session.request() arguments for a listing page
+
+        Args:
+            page_number: Listing page (2 is the first "Show more" click)
+
+        Returns:
+            Keyword arguments for requests.Session.request()
+        """
+        params = dict(self.params)
+        params[self.page_param] = str(self.first_value + (page_number - 2) * self.step)
+
+        kwargs = {
+            'method': self.method,
+            'url': self.url,
+            'headers': {'X-Requested-With': 'XMLHttpRequest'},
+        }
+        if self.encoding == 'query':
+            kwargs['params'] = params
+        elif self.encoding == 'json':
+            kwargs['json'] = params
+        else:
+            kwargs['data'] = params
+        return kwargs
+
+    def to_dict(self) -> Dict:
+        return {
+            'method': self.method,
+            'url': self.url,
+            'params': self.params,
+            'encoding': self.encoding,
+            'page_param': self.page_param,
+            'first_value': self.first_value,
+            'step': self.step,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ListingEndpoint":
+        return cls(
+            method=data['method'],
+            url=data['url'],
+            params=data['params'],
+            encoding=data['encoding'],
+            page_param=data['page_param'],
+            first_value=int(data['first_value']),
+            step=int(data['step']),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ListingEndpoint"]:
+        """Load a saved endpoint description, or None if missing/corrupt"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Could not load listing endpoint from {path}: {e}")
+            return None
+
+    def save(self, path: str) -> None:
+        """Persist the endpoint description"""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+        except IOError as e:
+            logger.warning(f"Could not save listing endpoint: {e}")
+
+    @classmethod
+    def learn(cls, recorded: List[Tuple[str, str, Optional[str]]], clicks: int,
+              cards_per_page: int = 0) -> Optional["ListingEndpoint"]:
+        """
+        Derive the endpoint from XHR requests recorded while clicking "Show more"
+
+        Args:
+            recorded: (method, url, post_data) of same-site XHR/fetch requests
+            clicks: Number of "Show more" clicks during recording
+            cards_per_page: Cards on the first listing page (offset step guess)
+
+        Returns:
+            ListingEndpoint, or None if no paginated request was recognised
+        """
+        groups: Dict[Tuple[str, str], List[Tuple[Dict[str, str], str]]] = {}
+        for method, url, post_data in recorded:
+            parsed = urlparse(url)
+            base_url = urlunparse(parsed._replace(query='', fragment=''))
+
+            if method.upper() == 'GET':
+                params, encoding = dict(parse_qsl(parsed.query)), 'query'
+            elif post_data and post_data.lstrip().startswith('{'):
+                try:
+                    params = {k: str(v) for k, v in json.loads(post_data).items()}
+                except (ValueError, AttributeError):
+                    continue
+                encoding = 'json'
+            else:
+                params, encoding = dict(parse_qsl(post_data or '')), 'form'
+
+            groups.setdefault((method.upper(), base_url), []).append((params, encoding))
+
+        if not groups:
+            return None
+
+        # The pagination call fires once per click; prefer that group
+        key = min(groups, key=lambda k: (abs(len(groups[k]) - clicks), -len(groups[k])))
+        samples = groups[key]
+        first_params, encoding = samples[0]
+
+        numeric = {name: int(value) for name, value in first_params.items()
+                   if str(value).lstrip('-').isdigit()}
+        if not numeric:
+            return None
+
+        page_param, step = None, None
+        if len(samples) > 1:
+            second_params = samples[1][0]
+            for name, value in numeric.items():
+                other = second_params.get(name, '')
+                if str(other).lstrip('-').isdigit() and int(other) != value:
+                    page_param, step = name, int(other) - value
+                    break
+
+        if page_param is None:
+            hinted = [name for name in numeric if name.lower() in PAGE_PARAM_HINTS]
+            if not hinted:
+                return None
+            page_param = hinted[0]
+            is_offset = any(hint in page_param.lower() for hint in ('offset', 'start', 'skip'))
+            step = (cards_per_page or numeric[page_param]) if is_offset else 1
+
+        return cls(
+            method=key[0],
+            url=key[1],
+            params={name: str(value) for name, value in first_params.items()},
+            encoding=encoding,
+            page_param=page_param,
+            first_value=numeric[page_param],
+            step=step,
+        )
+
+
+def extract_fragment_html(response_text: str) -> str:
+    """
+    Get the HTML carried by a "Show more" response
+
+    The endpoint may answer with an HTML fragment or with JSON that embeds
+    the fragment; every JSON string containing card markup is joined.
+
+    Args:
+        response_text: Raw response body
+
+    Returns:
+        HTML that can be parsed for card-section divs
+    """
+    stripped = response_text.lstrip()
+    if not stripped.startswith(('{', '[')):
+        return response_text
+
+    try:
+        data = json.loads(stripped)
+    except ValueError:
+        return response_text
+
+    fragments = []
+
+    def collect(value) -> None:
+        if isinstance(value, str):
+            if 'card-section' in value:
+                fragments.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    collect(data)
+    return '\n'.join(fragments)
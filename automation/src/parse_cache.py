@@ -0,0 +1,216 @@
+"""
+On-disk cache of parsed quiz pages.
+Maps the SHA-256 of a revealed quiz page, the parser version and the tree
+backend to the QuizData extracted from it, so a quiz re-run after a translation, PDF or
+Telegram failure skips parsing when the page has not changed. Bumping
+PARSER_VERSION or switching QUIZ_PARSER_BACKEND makes every other entry
+unreachable; those age out through
+the same size-bounded least-recently-used eviction as the HTTP cache.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .parser import PARSER_VERSION, QuizData, QuizQuestion
+from .parser_backends import get_backend
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Size-bounded store of QuizData keyed by page content, parser version and backend"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None,
+                 parser_version: str = PARSER_VERSION, backend: Optional[str] = None):
+        """
+        Initialize the cache (the directory is created on first store)
+
+        Args:
+            directory: Cache directory (defaults to PARSE_CACHE_DIR env var, data/parse_cache)
+            max_bytes: Size limit of stored files (defaults to PARSE_CACHE_MAX_MB env var, 20 MB)
+            parser_version: Version mixed into every key (defaults to the running parser's)
+            backend: Name of the parser's tree backend, also mixed into every key
+                (defaults to the QUIZ_PARSER_BACKEND one)
+        """
+        if directory is None:
+            directory = os.getenv('PARSE_CACHE_DIR', 'data/parse_cache')
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('PARSE_CACHE_MAX_MB', '20')) * 1024 * 1024)
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version
+        # The backends agree on the pages tested for parity, not on every page
+        self.backend = backend or get_backend().name
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, html: str) -> str:
+        digest = hashlib.sha256(f"parser-v{self.parser_version}\0{self.backend}\0".encode('utf-8'))
+        digest.update(html.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, html: str) -> Path:
+        return self.directory / f"{self._key(html)}.json.gz"
+
+    def get(self, html: str, url: str) -> Optional[QuizData]:
+        """
+        Look up the parse result of a page
+
+        Args:
+            html: Revealed quiz page
+            url: Quiz URL the page was fetched from (used as source_url)
+
+        Returns:
+            QuizData or None if not cached or unreadable
+        """
+        path = self._path(html)
+        try:
+            with open(path, 'rb') as f:
+                entry = json.loads(gzip.decompress(f.read()).decode('utf-8'))
+            quiz_data = self._decode(entry, url)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"PARSE CACHE: Dropping unreadable entry for {url}: {e}")
+            self._delete(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the entry so eviction removes the least recently used first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return quiz_data
+
+    def put(self, html: str, quiz_data: QuizData) -> None:
+        """
+        Store the parse result of a page
+
+        Args:
+            html: Revealed quiz page the questions were parsed from
+            quiz_data: Parser output
+        """
+        path = self._path(html)
+        compressed = gzip.compress(json.dumps(self._encode(quiz_data), ensure_ascii=False).encode('utf-8'))
+
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # Scan before writing so the new entry is counted once
+                total = self._current_total()
+                previous = self._entry_size(path)
+                tmp_path = path.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"PARSE CACHE: Could not store {quiz_data.source_url}: {e}")
+                return
+
+            self._total_bytes = total - previous + len(compressed)
+            self._evict()
+
+    def _encode(self, quiz_data: QuizData) -> Dict:
+        return {
+            'parser_version': self.parser_version,
+            'backend': self.backend,
+            'source_url': quiz_data.source_url,
+            'extracted_date': quiz_data.extracted_date,
+            'questions': [
+                {
+                    'question_number': q.question_number,
+                    'question_text': q.question_text,
+                    # Pairs keep the option order through JSON
+                    'options': list(q.options.items()),
+                    'correct_answer': q.correct_answer,
+                    'explanation': q.explanation,
+                }
+                for q in quiz_data.questions
+            ],
+        }
+
+    def _decode(self, entry: Dict, url: str) -> QuizData:
+        if entry['parser_version'] != self.parser_version:
+            raise ValueError(f"entry written by parser v{entry['parser_version']}")
+        if entry['backend'] != self.backend:
+            raise ValueError(f"entry written by the {entry['backend']} backend")
+        return QuizData(
+            source_url=url,
+            questions=tuple(
+                QuizQuestion(
+                    question_number=q['question_number'],
+                    question_text=q['question_text'],
+                    options=[tuple(pair) for pair in q['options']],
+                    correct_answer=q['correct_answer'],
+                    explanation=q['explanation'],
+                )
+                for q in entry['questions']
+            ),
+            extracted_date=entry['extracted_date'],
+        )
+
+    def _delete(self, path: Path) -> None:
+        with self._lock:
+            size = self._entry_size(path)
+            try:
+                path.unlink()
+            except OSError:
+                return
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _current_total(self) -> int:
+        """Total stored bytes, scanning the directory once per process"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(path.stat().st_size for path in self.directory.glob('*.json.gz'))
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes (lock held)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        entries = sorted(self.directory.glob('*.json.gz'), key=lambda path: path.stat().st_mtime)
+        for path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = self._entry_size(path)
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        return f"{self.hits} hits, {self.misses} misses, {self.evictions} evicted"
+
+    def log_summary(self) -> None:
+        """Log statistics if the cache was used"""
+        if self.hits or self.misses:
+            logger.info(f"PARSE CACHE: {self.summary()}")
@@ -2,40 +2,148 @@
 HTML Parser for extracting quiz data from pendulumedu.com quiz pages.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
-from bs4 import BeautifulSoup
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import logging
+import re
+
+from .parser_backends import get_backend
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump whenever a change alters what the parser extracts from the same HTML;
+# cached parse results (ParseCache) of other versions are then ignored
+PARSER_VERSION = '2'
+
+# Question containers: solved pages use q-section-inner-sol, unsolved ones q-section-inner
+SECTION_CLASSES = ('q-section-inner-sol', 'q-section-inner')
+
+# Landmarks collected in one walk of each question section
+LANDMARK_CLASSES = ('q-name', 'q-option', 'solution-sec', 'head', 'answr', 'ans-text')
+
+OPTION_LABELS = ('A', 'B', 'C', 'D')
+
+ANSWER_PATTERN = re.compile(r'(?:Answer|Correct Answer|Ans)[\s:]*(?:Option[\s:]*)?([A-D])', re.IGNORECASE)
+OPTION_LABEL_PATTERN = re.compile(r'^[A-D][\.\)]\s*')
+OPTION_LABEL_SPACE_PATTERN = re.compile(r'^[A-D]\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Script scan for the language pre-filter
+DEVANAGARI_PATTERN = re.compile('[\u0900-\u097F]')
+LATIN_LETTER_PATTERN = re.compile('[A-Za-z]')
+
+
+# Interned label tuples of QuizOptions
+_SHARED_LABELS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class QuizOptions(Mapping):
+    """
+    Immutable, tuple-backed mapping of option labels to option text.
+    
+    Behaves like the dict it replaces ({'A': 'option text', ...}): lookups,
+    iteration in label order, len, and equality with plain dicts. Use
+    dict(options) where a real dict is needed (e.g. JSON payloads).
+    """
+    
+    __slots__ = ('_labels', '_texts')
+    
+    def __init__(self, options: Union[Mapping, Iterable[Tuple[str, str]]] = ()):
+        items = options.items() if isinstance(options, Mapping) else options
+        labels = []
+        texts = []
+        for label, text in items:
+            if label in labels:
+                texts[labels.index(label)] = text
+            else:
+                labels.append(label)
+                texts.append(text)
+        # Nearly every question has the labels A-D: share one tuple between them
+        labels = tuple(labels)
+        object.__setattr__(self, '_labels', _SHARED_LABELS.setdefault(labels, labels))
+        object.__setattr__(self, '_texts', tuple(texts))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("QuizOptions is immutable")
+    
+    def __getitem__(self, label: str) -> str:
+        # At most four options: a linear scan beats hashing
+        for index, candidate in enumerate(self._labels):
+            if candidate == label:
+                return self._texts[index]
+        raise KeyError(label)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._labels)
+    
+    def __len__(self) -> int:
+        return len(self._labels)
+    
+    def __hash__(self) -> int:
+        return hash((self._labels, self._texts))
+    
+    def __repr__(self) -> str:
+        return repr(dict(zip(self._labels, self._texts)))
+    
+    def __reduce__(self):
+        return (QuizOptions, (tuple(zip(self._labels, self._texts)),))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuizQuestion:
-    """Represents a single quiz question with options, answer, and explanation."""
+    """Represents a single quiz question with options, answer, and explanation.
+    
+    Records are immutable so stages running in parallel can share them;
+    derive changed copies with with_number() or replace().
+    """
     question_number: int
     question_text: str
-    options: Dict[str, str]  # {'A': 'option text', 'B': '...', ...}
+    options: QuizOptions  # {'A': 'option text', 'B': '...', ...}; dicts are converted
     correct_answer: str  # 'A', 'B', 'C', or 'D'
     explanation: str
+    
+    def __post_init__(self):
+        if not isinstance(self.options, QuizOptions):
+            object.__setattr__(self, 'options', QuizOptions(self.options))
+    
+    def with_number(self, question_number: int) -> 'QuizQuestion':
+        """Copy with a new question number (text and options are shared, not copied)"""
+        if question_number == self.question_number:
+            return self
+        return replace(self, question_number=question_number)
+    
+    def replace(self, **changes) -> 'QuizQuestion':
+        """Copy with the given fields changed"""
+        return replace(self, **changes)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuizData:
     """Represents complete quiz data with all questions."""
     source_url: str
-    questions: List[QuizQuestion]
+    questions: Tuple[QuizQuestion, ...]  # Lists are converted to tuples
     extracted_date: str
+    
+    def __post_init__(self):
+        if not isinstance(self.questions, tuple):
+            object.__setattr__(self, 'questions', tuple(self.questions))
 
 
 class QuizParser:
     """Parser for extracting structured quiz data from HTML."""
     
-    def __init__(self):
-        """Initialize the quiz parser."""
-        pass
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize the quiz parser.
+        
+        Args:
+            backend: Tree backend, 'html.parser', 'lxml' or 'auto'
+                (defaults to QUIZ_PARSER_BACKEND env var, html.parser)
+        """
+        self.backend = get_backend(backend)
     
     def _is_english_text(self, text: str) -> bool:
         """
@@ -50,11 +158,11 @@ class QuizParser:
         if not text:
             return True
         
-        # Count Devanagari characters (Hindi script: U+0900 to U+097F)
-        devanagari_count = sum(1 for char in text if '\u0900' <= char <= '\u097F')
-        
-        # Count ASCII/Latin characters (English)
-        english_count = sum(1 for char in text if char.isascii() and char.isalpha())
+        # Count Devanagari (U+0900 to U+097F) and ASCII letters with C-level scans
+        devanagari_count = len(DEVANAGARI_PATTERN.findall(text))
+        if devanagari_count == 0:
+            return True
+        english_count = len(LATIN_LETTER_PATTERN.findall(text))
         
         # If more than 30% of alphabetic characters are Devanagari, it's Hindi
         total_alpha = devanagari_count + english_count
@@ -78,63 +186,113 @@ class QuizParser:
         Raises:
             ValueError: If required elements are not found in HTML
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        questions = []
+        questions = list(self.iter_questions(html, url))
+        
+        return QuizData(
+            source_url=url,
+            questions=questions,
+            extracted_date=datetime.now().isoformat()
+        )
+    
+    def iter_questions(self, html: str, url: str) -> Iterator[QuizQuestion]:
+        """
+        Yield the quiz's English questions one by one as they are extracted.
+        
+        Consumers (e.g. Translator.translate_stream) can start work on the
+        first question while later sections are still being parsed.
+        
+        Args:
+            html: HTML content of the quiz page (after solution reveal)
+            url: Source URL of the quiz
+            
+        Yields:
+            QuizQuestion objects, numbered sequentially
+            
+        Raises:
+            ValueError: If no question sections are found, or (after the last
+                section) if no English question could be parsed
+        """
+        dom = self.backend
+        # Only question sections are built into the tree (SoupStrainer for html.parser)
+        root = dom.parse(html, only=('div', SECTION_CLASSES))
         
         # Find all question sections
-        question_sections = soup.find_all('div', class_='q-section-inner-sol')
+        question_sections = dom.find_all(root, 'div', SECTION_CLASSES[0])
         
         if not question_sections:
             logger.warning("No question sections found. Trying alternative selector.")
             # Try alternative selector if the main one doesn't work
-            question_sections = soup.find_all('div', class_='q-section-inner')
+            question_sections = dom.find_all(root, 'div', SECTION_CLASSES[1])
         
         if not question_sections:
             raise ValueError("No question sections found in HTML")
         
         logger.info(f"Found {len(question_sections)} question sections")
         
-        hindi_questions_skipped = 0
-        english_questions_found = 0
+        # Hindi copies are dropped before any extraction work
+        english_sections, hindi_sections_skipped = self._partition_by_language(question_sections)
+        logger.info(f"Language filtering: {len(english_sections)} sections kept, {hindi_sections_skipped} Hindi sections skipped")
         
-        for idx, section in enumerate(question_sections, start=1):
+        questions_found = 0
+        for idx, (section, question_text) in enumerate(english_sections, start=1):
             try:
-                question = self._parse_question_section(section, idx)
-                
-                # Filter out Hindi questions - only keep English questions
-                if self._is_english_text(question.question_text):
-                    # Renumber questions sequentially for English-only questions
-                    question.question_number = english_questions_found + 1
-                    questions.append(question)
-                    english_questions_found += 1
-                    logger.debug(f"✓ Question {idx} is English - keeping")
-                else:
-                    hindi_questions_skipped += 1
-                    logger.debug(f"✗ Question {idx} is Hindi - skipping")
-                    
+                # Questions are numbered sequentially among the English ones kept
+                question = self._parse_question_section(section, questions_found + 1, question_text)
             except Exception as e:
                 logger.error(f"Error parsing question {idx}: {str(e)}")
                 # Continue with other questions even if one fails
                 continue
+            
+            questions_found += 1
+            yield question
         
-        logger.info(f"Language filtering: {english_questions_found} English questions kept, {hindi_questions_skipped} Hindi questions skipped")
-        
-        if not questions:
+        if not questions_found:
             raise ValueError("No English questions could be parsed from HTML")
+    
+    def _partition_by_language(self, sections) -> Tuple[List[Tuple[object, Optional[str]]], int]:
+        """
+        Split question sections into English ones and Hindi copies.
         
-        return QuizData(
-            source_url=url,
-            questions=questions,
-            extracted_date=datetime.now().isoformat()
-        )
+        Only the q-name text of each section is read and scanned for
+        Devanagari; nothing else is extracted from Hindi sections.
+        
+        Args:
+            sections: Question section elements in page order
+            
+        Returns:
+            ([(section, question_text), ...] for English sections, number of
+            Hindi sections skipped). question_text is None when the section has
+            no q-name div (extraction then reports it as malformed).
+        """
+        dom = self.backend
+        english_sections = []
+        hindi_count = 0
+        
+        for idx, section in enumerate(sections, start=1):
+            question_div = dom.find(section, 'div', 'q-name')
+            question_text = dom.text(question_div) if question_div is not None else None
+            
+            if question_text is not None and not self._is_english_text(question_text):
+                hindi_count += 1
+                logger.debug(f"✗ Section {idx} is Hindi - skipping")
+                continue
+            
+            english_sections.append((section, question_text))
+        
+        return english_sections, hindi_count
     
-    def _parse_question_section(self, section, question_number: int) -> QuizQuestion:
+    def _parse_question_section(self, section, question_number: int,
+                                question_text: Optional[str] = None) -> QuizQuestion:
         """
-        Parse a single question section.
+        Parse a single (English) question section.
+        
+        The section is walked once to collect its landmarks (question text,
+        options, solution head and explanation); each is then read in place.
         
         Args:
-            section: BeautifulSoup element containing the question section
+            section: Backend element containing the question section
             question_number: The question number
+            question_text: Question text already read by the language pre-filter
             
         Returns:
             QuizQuestion object
@@ -142,31 +300,41 @@ class QuizParser:
         Raises:
             ValueError: If required elements are missing
         """
+        dom = self.backend
+        landmarks = dom.find_all_by_class(section, 'div', LANDMARK_CLASSES)
+        
         # Extract question text from q-name div
-        question_div = section.find('div', class_='q-name')
-        if not question_div:
+        if not landmarks['q-name']:
             raise ValueError(f"Question text not found for question {question_number}")
         
-        question_text = question_div.get_text(strip=True)
-        
-        # Check if question is in Hindi - skip early to avoid parsing errors
-        if not self._is_english_text(question_text):
-            raise ValueError(f"Question {question_number} is in Hindi - skipping")
+        if question_text is None:
+            question_text = dom.text(landmarks['q-name'][0])
         
         # Extract options from containerr-text-opt elements
-        options = self._extract_options(section)
+        q_option_div = landmarks['q-option'][0] if landmarks['q-option'] else None
+        options = self._extract_options(q_option_div)
         
         if not options:
             raise ValueError(f"No options found for question {question_number}")
         
+        # head, answr and ans-text only count inside the (first) solution-sec div
+        solution_div = landmarks['solution-sec'][0] if landmarks['solution-sec'] else None
+        solution_parts = {}
+        if solution_div is not None:
+            for cls in ('head', 'answr', 'ans-text'):
+                solution_parts[cls] = next(
+                    (element for element in landmarks[cls] if dom.contains(solution_div, element)),
+                    None
+                )
+        
         # Extract correct answer from solution-sec div
-        correct_answer = self._extract_correct_answer(section)
+        correct_answer = self._extract_correct_answer(solution_div, solution_parts)
         
         if not correct_answer:
             raise ValueError(f"Correct answer not found for question {question_number}")
         
         # Extract explanation from ans-text div
-        explanation = self._extract_explanation(section)
+        explanation = self._extract_explanation(solution_div, solution_parts.get('ans-text'))
         
         # Debug logging
         if explanation:
@@ -182,44 +350,42 @@ class QuizParser:
             explanation=explanation
         )
     
-    def _extract_options(self, section) -> Dict[str, str]:
+    def _extract_options(self, q_option_div) -> Dict[str, str]:
         """
-        Extract all options from the question section.
+        Extract all options from the question's q-option div.
         
         Args:
-            section: BeautifulSoup element containing the question section
+            q_option_div: The q-option element (None if the section has none)
             
         Returns:
             Dictionary mapping option labels (A, B, C, D) to option text
         """
-        options = {}
-        option_labels = ['A', 'B', 'C', 'D']
+        options: Dict[str, str] = {}
         
-        # Find the q-option div first to avoid getting explanation list items
-        q_option_div = section.find('div', class_='q-option')
-        if not q_option_div:
+        # Options live in the q-option div, which keeps explanation list items out
+        if q_option_div is None:
             return options
         
-        # Find all li elements that contain options within q-option div
+        dom = self.backend
+        
         # Structure: <div class="q-option"><ul><li>...</li></ul></div>
-        option_list_items = q_option_div.find_all('li')
+        option_list_items = dom.find_all(q_option_div, 'li')
         
         option_count = 0
         for li in option_list_items:
-            if option_count >= len(option_labels):
-                logger.warning(f"More than {len(option_labels)} options found, ignoring extras")
+            if option_count >= len(OPTION_LABELS):
+                logger.warning(f"More than {len(OPTION_LABELS)} options found, ignoring extras")
                 break
             
             # Find the div with class containerr-text-opt inside the li
-            option_div = li.find('div', class_='containerr-text-opt')
-            if not option_div:
+            option_div = dom.find(li, 'div', 'containerr-text-opt')
+            if option_div is None:
                 continue
             
-            option_text = option_div.get_text(strip=True)
-            option_text = self._clean_option_text(option_text)
+            option_text = self._clean_option_text(dom.text(option_div))
             
             if option_text:  # Only add if text is not empty
-                options[option_labels[option_count]] = option_text
+                options[OPTION_LABELS[option_count]] = option_text
                 option_count += 1
         
         return options
@@ -235,62 +401,48 @@ class QuizParser:
             Cleaned option text
         """
         # Remove patterns like "A. ", "A) ", "A ", etc.
-        import re
-        cleaned = re.sub(r'^[A-D][\.\)]\s*', '', text)
-        cleaned = re.sub(r'^[A-D]\s+', '', cleaned)
+        cleaned = OPTION_LABEL_PATTERN.sub('', text, count=1)
+        cleaned = OPTION_LABEL_SPACE_PATTERN.sub('', cleaned, count=1)
         return cleaned.strip()
     
-    def _extract_correct_answer(self, section) -> str:
+    def _extract_correct_answer(self, solution_div, solution_parts: Dict) -> str:
         """
         Extract the correct answer label from the solution section.
         
         Args:
-            section: BeautifulSoup element containing the question section
+            solution_div: The solution-sec element (None if missing)
+            solution_parts: Its head/answr elements, as found by _parse_question_section
             
         Returns:
             Correct answer label ('A', 'B', 'C', or 'D')
         """
-        solution_div = section.find('div', class_='solution-sec')
-        
-        if not solution_div:
+        if solution_div is None:
             logger.warning("❌ No solution-sec div found")
             return ""
         
+        dom = self.backend
         logger.info("=" * 80)
         logger.info("🔍 EXTRACTING CORRECT ANSWER")
         
-        # Check for head div first (new format)
-        head_div = solution_div.find('div', class_='head')
-        if head_div:
-            head_text = head_div.get_text(strip=True)
-            logger.info(f"📌 Found 'head' div with text: '{head_text}'")
-            
-            import re
-            match = re.search(r'(?:Answer|Correct Answer|Ans)[\s:]*(?:Option[\s:]*)?([A-D])', head_text, re.IGNORECASE)
-            if match:
-                answer = match.group(1).upper()
-                logger.info(f"✅ Extracted answer from 'head' div: {answer}")
-                return answer
-        
-        # Check for answr div (old format)
-        answr_div = solution_div.find('div', class_='answr')
-        if answr_div:
-            answr_text = answr_div.get_text(strip=True)
-            logger.info(f"📌 Found 'answr' div with text: '{answr_text}'")
+        # Check for head div first (new format), then answr div (old format)
+        for cls in ('head', 'answr'):
+            div = solution_parts.get(cls)
+            if div is None:
+                continue
+            div_text = dom.text(div)
+            logger.info(f"📌 Found '{cls}' div with text: '{div_text}'")
             
-            import re
-            match = re.search(r'(?:Answer|Correct Answer|Ans)[\s:]*(?:Option[\s:]*)?([A-D])', answr_text, re.IGNORECASE)
+            match = ANSWER_PATTERN.search(div_text)
             if match:
                 answer = match.group(1).upper()
-                logger.info(f"✅ Extracted answer from 'answr' div: {answer}")
+                logger.info(f"✅ Extracted answer from '{cls}' div: {answer}")
                 return answer
         
         # Fallback: get all text from solution-sec
-        solution_text = solution_div.get_text(strip=True)
+        solution_text = dom.text(solution_div)
         logger.info(f"📌 Full solution-sec text (first 200 chars): '{solution_text[:200]}'")
         
-        import re
-        match = re.search(r'(?:Answer|Correct Answer|Ans)[\s:]*(?:Option[\s:]*)?([A-D])', solution_text, re.IGNORECASE)
+        match = ANSWER_PATTERN.search(solution_text)
         
         if match:
             answer = match.group(1).upper()
@@ -300,68 +452,61 @@ class QuizParser:
         logger.warning("❌ Could not extract answer using any method")
         return ""
     
-    def _extract_explanation(self, section) -> str:
+    def _extract_explanation(self, solution_div, explanation_div) -> str:
         """
         Extract the explanation text from the answer section.
         
         Args:
-            section: BeautifulSoup element containing the question section
+            solution_div: The solution-sec element (None if missing)
+            explanation_div: Its ans-text element (None if missing)
             
         Returns:
             Explanation text (may be empty string if not found)
         """
-        import re
-        
         logger.info("🔍 EXTRACTING EXPLANATION")
+        dom = self.backend
         
-        # First find the solution-sec div
-        solution_div = section.find('div', class_='solution-sec')
-        
-        if not solution_div:
+        if solution_div is None:
             logger.warning("❌ No solution-sec div found in section")
             return ""
         
         logger.info("✓ Found solution-sec div")
         
-        # Then find ans-text div inside solution-sec
-        explanation_div = solution_div.find('div', class_='ans-text')
-        
-        if not explanation_div:
+        if explanation_div is None:
             logger.warning("❌ No ans-text div found inside solution-sec")
             # Debug: print what divs ARE in solution-sec
-            divs_in_solution = solution_div.find_all('div')
-            div_classes = [div.get('class') for div in divs_in_solution]
+            divs_in_solution = dom.find_all(solution_div, 'div')
+            div_classes = [dom.classes(div) for div in divs_in_solution]
             logger.warning(f"Divs found in solution-sec: {div_classes}")
             
             # Show the HTML structure for debugging
-            logger.warning(f"solution-sec HTML (first 500 chars): {str(solution_div)[:500]}")
+            logger.warning(f"solution-sec HTML (first 500 chars): {dom.markup(solution_div)[:500]}")
             return ""
         
         logger.info("✓ Found ans-text div")
         
+        # List items and paragraphs are collected in one walk, list items first
+        list_items = []
+        paragraphs = []
+        for element in dom.find_all(explanation_div, ('li', 'p')):
+            (list_items if dom.tag_name(element) == 'li' else paragraphs).append(element)
+        
         # Extract text from list items and paragraphs
         explanation_parts = []
         
-        # Get all list items
-        list_items = explanation_div.find_all('li')
         logger.info(f"📝 Found {len(list_items)} list items")
         for li in list_items:
-            text = li.get_text(strip=True)
             # Clean up extra whitespace
-            text = re.sub(r'\s+', ' ', text)
+            # Nested items are listed on their own
+            text = WHITESPACE_PATTERN.sub(' ', dom.own_text(li))
             if text:
                 logger.info(f"  • List item: {text[:100]}...")
                 explanation_parts.append(f"• {text}")
         
-        # Get all paragraphs
-        paragraphs = explanation_div.find_all('p')
         logger.info(f"📝 Found {len(paragraphs)} paragraphs")
         for p in paragraphs:
-            text = p.get_text(strip=True)
-            # Clean up extra whitespace
-            text = re.sub(r'\s+', ' ', text)
-            # Replace middle dot with bullet point
-            text = text.replace('·', '•')
+            # Clean up extra whitespace and replace middle dot with bullet point
+            text = WHITESPACE_PATTERN.sub(' ', dom.own_text(p)).replace('·', '•')
             if text and text not in explanation_parts:  # Avoid duplicates
                 logger.info(f"  • Paragraph: {text[:100]}...")
                 explanation_parts.append(text)
@@ -369,14 +514,11 @@ class QuizParser:
         # If no structured content found, get all text
         if not explanation_parts:
             logger.warning("⚠️ No structured content found, getting all text")
-            explanation_text = explanation_div.get_text(separator=' ', strip=True)
-            # Clean up extra whitespace
-            explanation_text = re.sub(r'\s+', ' ', explanation_text)
+            explanation_text = WHITESPACE_PATTERN.sub(' ', dom.text(explanation_div, separator=' '))
             logger.info(f"📄 Raw text (first 200 chars): {explanation_text[:200]}...")
             return explanation_text
         
-        result = ' '.join(explanation_parts)
         # Final cleanup of any remaining extra whitespace
-        result = re.sub(r'\s+', ' ', result)
+        result = WHITESPACE_PATTERN.sub(' ', ' '.join(explanation_parts))
         logger.info(f"✅ Final explanation ({len(result)} chars): {result[:200]}...")
         return result
@@ -0,0 +1,241 @@
+"""
+Tree backends for QuizParser.
+The parser only needs a handful of operations (find by tag and class, text
+of a node), so each backend wraps one HTML library behind the same small
+interface. BeautifulSoup with html.parser is the reference implementation;
+the lxml backend builds a C tree and answers lookups with compiled XPath,
+which makes bulk reparsing of archived pages several times faster.
+"""
+
+import os
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer
+
+# lxml is optional; the soup backend is always available
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# A tag name or several tag names matched together
+Tags = Union[str, Tuple[str, ...]]
+
+DEFAULT_BACKEND = 'html.parser'
+
+
+class SoupBackend:
+    """BeautifulSoup with the standard library html.parser (reference behaviour)"""
+
+    name = 'html.parser'
+
+    def parse(self, html: str, only: Optional[Tuple[str, Sequence[str]]] = None):
+        """
+        Build the tree
+
+        Args:
+            html: Page HTML
+            only: (tag, classes) to keep; everything outside matching elements
+                is discarded while parsing (SoupStrainer)
+        """
+        if only is None:
+            return BeautifulSoup(html, 'html.parser')
+        tag, classes = only
+        return BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(tag, class_=list(classes)))
+
+    def find(self, node, tag: str, cls: str):
+        """First descendant <tag> whose class list contains cls, or None"""
+        return node.find(tag, class_=cls)
+
+    def find_all(self, node, tag: Tags, cls: Optional[str] = None) -> List:
+        """All descendant <tag> elements (with class cls if given), in document order"""
+        tag = list(tag) if isinstance(tag, tuple) else tag
+        if cls is None:
+            return node.find_all(tag)
+        return node.find_all(tag, class_=cls)
+
+    def find_all_by_class(self, node, tag: str, classes: Sequence[str]) -> Dict[str, List]:
+        """
+        Descendant <tag> elements carrying any of classes, found in one walk
+
+        Returns:
+            Matches per class, each list in document order
+        """
+        wanted = set(classes)
+        found: Dict[str, List] = {cls: [] for cls in classes}
+        for element in node.find_all(tag, class_=list(classes)):
+            for cls in element.get('class') or ():
+                if cls in wanted:
+                    found[cls].append(element)
+        return found
+
+    def contains(self, ancestor, node) -> bool:
+        """Whether node is a descendant of ancestor"""
+        return any(parent is ancestor for parent in node.parents)
+
+    def text(self, node, separator: str = '') -> str:
+        """Stripped text fragments of a node joined by separator (get_text(strip=True))"""
+        return node.get_text(separator=separator, strip=True)
+
+    def own_text(self, node, separator: str = '') -> str:
+        """
+        text() without descendants of the node's own tag
+
+        html.parser does not close <p> or <li> implicitly, so "<p>one<p>two"
+        nests the second paragraph inside the first; skipping it keeps its
+        text from being counted twice (lxml closes the first one instead).
+        """
+        parts = []
+        for string in node.find_all(string=True):
+            # Same string types as get_text(): no comments, script or style contents
+            if type(string) not in (NavigableString, CData):
+                continue
+            parent = string.parent
+            while parent is not node and parent.name != node.name:
+                parent = parent.parent
+            stripped = string.strip()
+            if parent is node and stripped:
+                parts.append(stripped)
+        return separator.join(parts)
+
+    def tag_name(self, node) -> str:
+        return node.name
+
+    def classes(self, node) -> Optional[List[str]]:
+        return node.get('class')
+
+    def markup(self, node) -> str:
+        return str(node)
+
+
+class LxmlBackend:
+    """lxml.html tree queried with cached, compiled XPath expressions"""
+
+    name = 'lxml'
+
+    # Elements whose text BeautifulSoup leaves out of get_text()
+    NON_TEXT_TAGS = ('script', 'style', 'template')
+
+    def __init__(self):
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml parser backend unavailable. Run: pip install lxml")
+        self._parser = lxml.html.HTMLParser(encoding='utf-8', remove_comments=True)
+        self._xpaths: Dict[tuple, 'etree.XPath'] = {}
+
+    def parse(self, html: str, only: Optional[Tuple[str, Sequence[str]]] = None):
+        # only is a BeautifulSoup memory optimisation; lxml builds the full tree in C anyway
+        if not html or not html.strip():
+            return lxml.html.fromstring('<html></html>')
+        # Encode explicitly so pages with an XML declaration or a stray <meta charset> parse the same
+        root = lxml.html.document_fromstring(html.encode('utf-8'), parser=self._parser)
+        etree.strip_elements(root, *self.NON_TEXT_TAGS, with_tail=False)
+        return root
+
+    @staticmethod
+    def _has_class(cls: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+    def _xpath(self, tag: Tags, cls: Union[None, str, Tuple[str, ...]]):
+        key = (tag, cls)
+        xpath = self._xpaths.get(key)
+        if xpath is None:
+            tags = tag if isinstance(tag, tuple) else (tag,)
+            if cls is None:
+                predicate = ''
+            elif isinstance(cls, tuple):
+                predicate = '[' + ' or '.join(self._has_class(c) for c in cls) + ']'
+            else:
+                predicate = f'[{self._has_class(cls)}]'
+            # A union is still returned in document order
+            xpath = etree.XPath(' | '.join(f'.//{t}{predicate}' for t in tags))
+            self._xpaths[key] = xpath
+        return xpath
+
+    def find(self, node, tag: str, cls: str):
+        matches = self._xpath(tag, cls)(node)
+        return matches[0] if matches else None
+
+    def find_all(self, node, tag: Tags, cls: Optional[str] = None) -> List:
+        return self._xpath(tag, cls)(node)
+
+    def find_all_by_class(self, node, tag: str, classes: Sequence[str]) -> Dict[str, List]:
+        classes = tuple(classes)
+        found: Dict[str, List] = {cls: [] for cls in classes}
+        for element in self._xpath(tag, classes)(node):
+            for cls in (element.get('class') or '').split():
+                if cls in found:
+                    found[cls].append(element)
+        return found
+
+    def contains(self, ancestor, node) -> bool:
+        return any(parent is ancestor for parent in node.iterancestors())
+
+    def text(self, node, separator: str = '') -> str:
+        return separator.join(part for part in (s.strip() for s in node.itertext()) if part)
+
+    def own_text(self, node, separator: str = '') -> str:
+        chunks = []
+
+        def walk(element):
+            chunks.append(element.text)
+            for child in element:
+                if child.tag != node.tag:
+                    walk(child)
+                chunks.append(child.tail)
+
+        walk(node)
+        return separator.join(part for part in (s.strip() for s in chunks if s) if part)
+
+    def tag_name(self, node) -> str:
+        return node.tag
+
+    def classes(self, node) -> Optional[List[str]]:
+        value = node.get('class')
+        return value.split() if value is not None else None
+
+    def markup(self, node) -> str:
+        return lxml.html.tostring(node, encoding='unicode', with_tail=False)
+
+
+BACKENDS = {
+    SoupBackend.name: SoupBackend,
+    LxmlBackend.name: LxmlBackend,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the backends that can be created in this environment"""
+    return [name for name in BACKENDS if name != LxmlBackend.name or LXML_AVAILABLE]
+
+
+def get_backend(name: Optional[str] = None):
+    """
+    Create a parser backend
+
+    Args:
+        name: 'html.parser', 'lxml' or 'auto' (lxml when installed); defaults
+            to the QUIZ_PARSER_BACKEND env var, html.parser
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested backend's library is not installed
+    """
+    if name is None:
+        name = os.getenv('QUIZ_PARSER_BACKEND', DEFAULT_BACKEND)
+    name = name.strip().lower()
+
+    if name == 'auto':
+        name = LxmlBackend.name if LXML_AVAILABLE else SoupBackend.name
+
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(f"Unknown parser backend '{name}' (expected one of: auto, {', '.join(BACKENDS)})")
+    return backend_class()
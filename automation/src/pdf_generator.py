@@ -7,7 +7,7 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Sequence
 import pytz
 import base64
 
@@ -70,7 +70,7 @@ class PDFGenerator:
             logger.error(f"Error loading logo: {e}")
             return ""
 
-    def _generate_answer_key_page(self, questions: List[QuizQuestion]) -> str:
+    def _generate_answer_key_page(self, questions: Sequence[QuizQuestion]) -> str:
         """Generate answer key grid page"""
         # Create grid of answers (4 per row)
         answers_grid = ""
@@ -110,7 +110,7 @@ class PDFGenerator:
     </div>
 """
     
-    def _generate_explanations_section(self, questions: List[QuizQuestion]) -> str:
+    def _generate_explanations_section(self, questions: Sequence[QuizQuestion]) -> str:
         """Generate detailed explanations section"""
         explanations_html = ""
         
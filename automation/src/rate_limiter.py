@@ -0,0 +1,320 @@
+"""
+Adaptive per-host rate control shared by every scraper worker.
+Each host gets a token bucket (requests per second) and a concurrency limit.
+Both grow additively while responses are fast and successful and are cut
+in half on 429/5xx, connection errors or slow responses (AIMD), so bulk
+runs settle at the pace the site tolerates without fixed sleeps.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterator, AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down"
+CONGESTION_STATUSES = {429, 500, 502, 503, 504}
+
+# Longest single wait before re-checking a bucket (lets releases wake waiters)
+MAX_POLL_INTERVAL = 0.25
+
+
+class RequestTicket:
+    """Outcome of one rate-limited request, filled in by the caller"""
+
+    def __init__(self, host: str, track_latency: bool):
+        self.host = host
+        self.track_latency = track_latency
+        self.started = time.monotonic()
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+
+class _HostState:
+    """Token bucket, concurrency limit and statistics of one host"""
+
+    def __init__(self, rate: float, concurrency: float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.latency_ewma: Optional[float] = None
+        self.requests = 0
+        self.congestion_events = 0
+        self.waited = 0.0
+
+
+class RateController:
+    """Thread- and asyncio-safe AIMD rate and concurrency controller"""
+
+    def __init__(self, rate: Optional[float] = None, max_rate: Optional[float] = None,
+                 max_concurrency: Optional[int] = None,
+                 latency_target: Optional[float] = None,
+                 min_rate: float = 0.2, min_concurrency: int = 1,
+                 concurrency: Optional[int] = None):
+        """
+        Initialize the controller
+
+        Args:
+            rate: Starting requests/second per host (SCRAPER_RATE env var, 2)
+            max_rate: Ceiling for requests/second (SCRAPER_MAX_RATE env var, 10)
+            max_concurrency: Ceiling for in-flight requests per host
+                (SCRAPER_MAX_CONCURRENCY env var, 8)
+            latency_target: Response time above which a host counts as
+                overloaded, in seconds (SCRAPER_LATENCY_TARGET env var, 3)
+            min_rate: Floor for requests/second
+            min_concurrency: Floor for in-flight requests
+            concurrency: Starting in-flight requests per host (2 if omitted);
+                worker pools pass their size so every worker can start at once
+        """
+        if rate is None:
+            rate = float(os.getenv('SCRAPER_RATE', '2'))
+        if max_rate is None:
+            max_rate = float(os.getenv('SCRAPER_MAX_RATE', '10'))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('SCRAPER_MAX_CONCURRENCY', '8'))
+        if latency_target is None:
+            latency_target = float(os.getenv('SCRAPER_LATENCY_TARGET', '3'))
+
+        self.initial_rate = max(min_rate, min(rate, max_rate))
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.max_concurrency = max(min_concurrency, max_concurrency)
+        self.min_concurrency = min_concurrency
+        self.initial_concurrency = max(min_concurrency, min(concurrency or 2, self.max_concurrency))
+        self.latency_target = latency_target
+
+        self._cond = threading.Condition()
+        self._hosts: Dict[str, _HostState] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url).hostname or '').lower()
+
+    def _state(self, host: str) -> _HostState:
+        """Per-host state (condition held)"""
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.initial_rate, self.initial_concurrency)
+            self._hosts[host] = state
+        return state
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """
+        Seed and cap per-host concurrency from a worker pool's size
+
+        Called by engines that share this controller with a differently sized
+        caller, so N configured workers can have N requests in flight from the
+        start. Hosts that already backed off keep their lower limit.
+
+        Args:
+            concurrency: Number of workers that issue requests in parallel
+        """
+        with self._cond:
+            self.max_concurrency = max(self.min_concurrency, concurrency)
+            self.initial_concurrency = self.max_concurrency
+            for state in self._hosts.values():
+                if state.congestion_events:
+                    state.concurrency = min(state.concurrency, self.max_concurrency)
+                else:
+                    state.concurrency = self.initial_concurrency
+            self._cond.notify_all()
+
+    def _try_acquire(self, host: str) -> float:
+        """
+        Take a token and a concurrency slot if both are available
+
+        Returns:
+            0 if acquired, otherwise seconds to wait before trying again
+        """
+        with self._cond:
+            state = self._state(host)
+            now = time.monotonic()
+
+            if now < state.blocked_until:
+                return state.blocked_until - now
+
+            # Refill, keeping a burst of at most one second worth of tokens
+            burst = max(1.0, state.rate)
+            state.tokens = min(burst, state.tokens + (now - state.updated) * state.rate)
+            state.updated = now
+
+            if state.in_flight >= int(state.concurrency):
+                return MAX_POLL_INTERVAL
+            if state.tokens < 1.0:
+                return (1.0 - state.tokens) / state.rate
+
+            state.tokens -= 1.0
+            state.in_flight += 1
+            state.requests += 1
+            return 0.0
+
+    def acquire(self, url: str, track_latency: bool = True) -> RequestTicket:
+        """
+        Block until a request to the URL's host may start
+
+        Args:
+            url: Request URL
+            track_latency: Feed the response time into the controller
+
+        Returns:
+            Ticket to pass to release()
+        """
+        host = self.host_of(url)
+        started = time.monotonic()
+        while True:
+            wait = self._try_acquire(host)
+            if wait <= 0:
+                break
+            with self._cond:
+                self._cond.wait(timeout=min(wait, MAX_POLL_INTERVAL))
+        self._record_wait(host, time.monotonic() - started)
+        return RequestTicket(host, track_latency)
+
+    async def acquire_async(self, url: str, track_latency: bool = True) -> RequestTicket:
+        """Asyncio variant of acquire() that never blocks the event loop"""
+        host = self.host_of(url)
+        started = time.monotonic()
+        while True:
+            wait = self._try_acquire(host)
+            if wait <= 0:
+                break
+            await asyncio.sleep(min(wait, MAX_POLL_INTERVAL))
+        self._record_wait(host, time.monotonic() - started)
+        return RequestTicket(host, track_latency)
+
+    def _record_wait(self, host: str, waited: float) -> None:
+        with self._cond:
+            self._state(host).waited += waited
+
+    def release(self, ticket: RequestTicket) -> None:
+        """
+        Finish a request and adapt the host's rate and concurrency
+
+        A ticket without a status (the request raised) counts as congestion.
+
+        Args:
+            ticket: Ticket returned by acquire(), with status filled in
+        """
+        latency = time.monotonic() - ticket.started
+
+        with self._cond:
+            state = self._state(ticket.host)
+            state.in_flight = max(0, state.in_flight - 1)
+
+            if ticket.track_latency:
+                if state.latency_ewma is None:
+                    state.latency_ewma = latency
+                else:
+                    state.latency_ewma = 0.8 * state.latency_ewma + 0.2 * latency
+
+            congested = ticket.status is None or ticket.status in CONGESTION_STATUSES
+            slow = ticket.track_latency and latency > self.latency_target
+
+            if ticket.retry_after:
+                state.blocked_until = max(state.blocked_until, time.monotonic() + ticket.retry_after)
+
+            if congested or slow:
+                # Multiplicative decrease, once per window: requests that were
+                # already in flight at the last decrease report the same congestion
+                state.congestion_events += 1
+                if ticket.started >= state.last_decrease:
+                    state.last_decrease = time.monotonic()
+                    state.rate = max(self.min_rate, state.rate / 2)
+                    state.concurrency = max(self.min_concurrency, state.concurrency / 2)
+                    reason = f"status {ticket.status}" if congested else f"latency {latency:.1f}s"
+                    logger.info(
+                        f"RATE: Backing off {ticket.host} ({reason}): "
+                        f"{state.rate:.2f} req/s, {int(state.concurrency)} concurrent"
+                    )
+            else:
+                # Additive increase: +0.25 req/s and one slot per "window" of requests
+                state.rate = min(self.max_rate, state.rate + 0.25)
+                state.concurrency = min(self.max_concurrency,
+                                        state.concurrency + 1 / max(1.0, state.concurrency))
+
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, url: str, track_latency: bool = True) -> Iterator[RequestTicket]:
+        """
+        Hold a rate-limited slot for one request
+
+        Set ticket.status (and ticket.retry_after) inside the block; an
+        exception leaves the status empty and is treated as congestion.
+        """
+        ticket = self.acquire(url, track_latency)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    @asynccontextmanager
+    async def async_slot(self, url: str, track_latency: bool = True) -> AsyncIterator[RequestTicket]:
+        """Asyncio variant of slot()"""
+        ticket = await self.acquire_async(url, track_latency)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def summary(self) -> str:
+        """Human-readable per-host statistics"""
+        with self._cond:
+            parts = []
+            for host, state in sorted(self._hosts.items()):
+                latency = f"{state.latency_ewma:.2f}s" if state.latency_ewma is not None else "n/a"
+                parts.append(
+                    f"{host}: {state.requests} requests, now {state.rate:.2f} req/s x "
+                    f"{int(state.concurrency)}, {state.congestion_events} back-offs, "
+                    f"latency {latency}, {state.waited:.1f}s waited"
+                )
+            return '; '.join(parts) or 'no requests'
+
+    def log_summary(self) -> None:
+        """Log statistics if any request went through the controller"""
+        if self._hosts:
+            logger.info(f"RATE: {self.summary()}")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a numeric Retry-After header (HTTP dates are ignored)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request through a RateController"""
+
+    def __init__(self, *args, rate_controller: Optional[RateController] = None, **kwargs):
+        """
+        Args:
+            rate_controller: Shared controller (requests are not limited if None)
+            *args, **kwargs: Passed to HTTPAdapter (e.g. max_retries)
+        """
+        self.rate_controller = rate_controller
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        if self.rate_controller is None:
+            return super().send(request, *args, **kwargs)
+
+        with self.rate_controller.slot(request.url) as ticket:
+            response = super().send(request, *args, **kwargs)
+            ticket.status = response.status_code
+            ticket.retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            return response
@@ -0,0 +1,176 @@
+"""
+Request interception for scraper browser contexts.
+Blocks or stubs resources that QuizParser never reads (images, fonts,
+media, ads and analytics) while letting through the documents, scripts,
+stylesheets and XHR calls the site needs to reveal solutions.
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Resource types never needed to read quiz content
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+# Resource types that are stubbed instead of aborted, so page scripts
+# waiting on load/error events still see a successful response
+STUBBED_RESOURCE_TYPES = {'image'}
+
+# Third-party hosts (and their subdomains) serving ads, analytics or widgets
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googleadservices.com',
+    'googlesyndication.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'facebook.com',
+    'connect.facebook.net',
+    'hotjar.com',
+    'clarity.ms',
+    'onesignal.com',
+    'tawk.to',
+    'youtube.com',
+    'ytimg.com',
+)
+
+# Rough average transfer size per resource type, used to estimate savings
+# for requests that are never downloaded
+ESTIMATED_BYTES = {
+    'image': 35_000,
+    'media': 400_000,
+    'font': 50_000,
+    'script': 40_000,
+    'stylesheet': 20_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'other': 5_000,
+}
+
+# 1x1 transparent GIF served in place of blocked images
+TRANSPARENT_GIF = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01'
+    b'\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+
+class RequestFilter:
+    """Decides per request whether to allow, stub or abort it and keeps statistics"""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        """
+        Initialize the request filter
+
+        Args:
+            enabled: Whether to block anything (defaults to BLOCK_RESOURCES env var, true)
+        """
+        if enabled is None:
+            enabled = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.blocked: Dict[str, int] = {}
+        self.estimated_bytes_saved = 0
+
+    @staticmethod
+    def _is_blocked_host(host: str) -> bool:
+        """Check a hostname against the third-party blocklist"""
+        host = host.lower()
+        return any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS)
+
+    def classify(self, url: str, resource_type: str) -> str:
+        """
+        Decide what to do with a request
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type (document, script, image, ...)
+
+        Returns:
+            "allow", "stub" or "abort"
+        """
+        if not self.enabled or resource_type == 'document':
+            return 'allow'
+
+        host = urlparse(url).hostname or ''
+
+        if self._is_blocked_host(host):
+            # Stub scripts so inline calls into them fail quietly instead of erroring
+            return 'stub' if resource_type == 'script' else 'abort'
+
+        if resource_type in BLOCKED_RESOURCE_TYPES:
+            return 'stub' if resource_type in STUBBED_RESOURCE_TYPES else 'abort'
+
+        return 'allow'
+
+    def _record(self, decision: str, resource_type: str) -> None:
+        """Update counters for one request"""
+        with self._lock:
+            if decision == 'allow':
+                self.allowed += 1
+                return
+            self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+            self.estimated_bytes_saved += ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES['other'])
+
+    @staticmethod
+    def _stub_response(resource_type: str) -> Dict:
+        """Response served for stubbed requests"""
+        if resource_type == 'image':
+            return {'status': 200, 'content_type': 'image/gif', 'body': TRANSPARENT_GIF}
+        return {'status': 200, 'content_type': 'application/javascript', 'body': ''}
+
+    def handle(self, route) -> None:
+        """Route handler for the sync Playwright API"""
+        request = route.request
+        decision = self.classify(request.url, request.resource_type)
+        self._record(decision, request.resource_type)
+
+        if decision == 'allow':
+            route.continue_()
+        elif decision == 'stub':
+            route.fulfill(**self._stub_response(request.resource_type))
+        else:
+            route.abort()
+
+    async def handle_async(self, route) -> None:
+        """Route handler for the async Playwright API"""
+        request = route.request
+        decision = self.classify(request.url, request.resource_type)
+        self._record(decision, request.resource_type)
+
+        if decision == 'allow':
+            await route.continue_()
+        elif decision == 'stub':
+            await route.fulfill(**self._stub_response(request.resource_type))
+        else:
+            await route.abort()
+
+    def install(self, context) -> None:
+        """Attach the filter to a sync BrowserContext"""
+        if self.enabled:
+            context.route('**/*', self.handle)
+
+    async def install_async(self, context) -> None:
+        """Attach the filter to an async BrowserContext"""
+        if self.enabled:
+            await context.route('**/*', self.handle_async)
+
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        blocked_total = sum(self.blocked.values())
+        by_type = ', '.join(f"{rtype}={count}" for rtype, count in sorted(self.blocked.items()))
+        return (
+            f"{blocked_total} requests blocked ({by_type or 'none'}), "
+            f"{self.allowed} allowed, ~{self.estimated_bytes_saved / 1024:.0f} KB saved (estimated)"
+        )
+
+    def log_summary(self) -> None:
+        """Log statistics if anything went through the filter"""
+        if self.enabled and (self.allowed or self.blocked):
+            logger.info(f"REQUEST FILTER: {self.summary()}")
@@ -5,8 +5,11 @@ Coordinates the entire pipeline from authentication to Telegram distribution.
 
 import os
 import sys
+import time
+import argparse
 import logging
 from typing import List, Optional
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -14,18 +17,33 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import all modules
-from src.state_manager import StateManager
-from src.login import LoginManager, AuthenticationError
-from src.scraper import QuizScraper, ScraperError
-from src.parser import QuizParser, QuizData
-from src.translator import Translator, TranslatedQuizData
-from src.pdf_generator import PDFGenerator
-from src.telegram_sender import TelegramSender
-from src.telegram_text_sender import TelegramTextSender
-from src.date_extractor import DateExtractor
-from src.supabase_manager import SupabaseManager
-from src.notification_sender import NotificationSender
+# Import all modules (timed for the startup report; heavy third-party
+# backends such as Playwright, telegram and supabase load on first use)
+from src.lazy_imports import import_timer, log_import_report
+with import_timer('src.state_manager'):
+    from src.state_manager import StateManager
+with import_timer('src.login'):
+    from src.login import LoginManager, AuthenticationError
+with import_timer('src.scraper'):
+    from src.scraper import QuizScraper, ReplayScraper, ScraperError
+    from src.html_archive import HTMLArchive
+    from src.debug_capture import DebugCapture, QuizCapture
+with import_timer('src.parser'):
+    from src.parser import QuizParser, QuizData
+    from src.parse_cache import ParseCache
+with import_timer('src.translator'):
+    from src.translator import Translator, TranslatedQuizData
+with import_timer('src.pdf_generator'):
+    from src.pdf_generator import PDFGenerator
+with import_timer('src.telegram_sender'):
+    from src.telegram_sender import TelegramSender
+    from src.telegram_text_sender import TelegramTextSender
+with import_timer('src.date_extractor'):
+    from src.date_extractor import DateExtractor
+with import_timer('src.supabase_manager'):
+    from src.supabase_manager import SupabaseManager
+with import_timer('src.notification_sender'):
+    from src.notification_sender import NotificationSender
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -105,7 +123,9 @@ def process_quiz(
     supabase_manager: SupabaseManager,
     notification_sender: NotificationSender,
     state_manager: StateManager,
-    date_extractor: DateExtractor
+    date_extractor: DateExtractor,
+    debug_capture: Optional[DebugCapture] = None,
+    parse_cache: Optional[ParseCache] = None
 ) -> bool:
     """
     Process a single quiz through the complete pipeline.
@@ -119,6 +139,8 @@ def process_quiz(
         telegram_sender: TelegramSender instance
         state_manager: StateManager instance
         date_extractor: DateExtractor instance
+        debug_capture: Optional DebugCapture that keeps the page of a failed parse
+        parse_cache: Optional ParseCache; an unchanged page is not parsed again
         
     Returns:
         True if successful, False otherwise
@@ -154,13 +176,38 @@ def process_quiz(
         
         # Step 2: Parse quiz data
         logger.info("Step 2: Parsing quiz data...")
-        quiz_data = parser.parse_quiz(html, url)
-        logger.info(f"Parsed {len(quiz_data.questions)} questions")
-        
-        # Step 3: Translate to Gujarati
-        logger.info("Step 3: Translating content to Gujarati...")
-        translated_data = translator.translate_quiz(quiz_data)
-        logger.info("Translation completed")
+        if debug_capture:
+            parse_stage = debug_capture.capture(url, 'parse')
+        else:
+            parse_stage = nullcontext(QuizCapture(url, 'parse'))
+        
+        cached_quiz = parse_cache.get(html, url) if parse_cache else None
+        if cached_quiz is not None:
+            logger.info(f"✓ Parse cache hit: reusing {len(cached_quiz.questions)} parsed questions")
+        
+        def parsed_questions():
+            if cached_quiz is not None:
+                yield from cached_quiz.questions
+                return
+            questions = []
+            # The capture only sees parser errors, not translation errors
+            with parse_stage as capture:
+                capture.add_html('quiz', html)
+                for question in parser.iter_questions(html, url):
+                    questions.append(question)
+                    yield question
+            # Only a complete parse is cached
+            if parse_cache:
+                parse_cache.put(html, QuizData(
+                    source_url=url,
+                    questions=questions,
+                    extracted_date=datetime.now().isoformat()
+                ))
+        
+        # Step 3: Translate to Gujarati, starting as soon as the first question is parsed
+        logger.info("Step 3: Translating content to Gujarati (streaming from the parser)...")
+        translated_data = translator.translate_stream(parsed_questions(), source_url=url)
+        logger.info(f"Parsed and translated {len(translated_data.questions)} questions")
         
         # Step 4: Generate PDFs (both modes)
         logger.info("Step 4: Generating PDFs...")
@@ -255,7 +302,7 @@ def process_quiz(
         # Step 7: Sync to Supabase for PWA
         logger.info("Step 7: Syncing data to Supabase...")
         date_obj_to_sync = date_obj.date() if 'date_obj' in locals() else None
-        quiz_slug = supabase_manager.sync_quiz(quiz_data, translated_data.questions, date_gujarati, date_obj_to_sync)
+        quiz_slug = supabase_manager.sync_quiz(url, translated_data.questions, date_gujarati, date_obj_to_sync)
         if quiz_slug:
             logger.info(f"✅ Data synced to Supabase. Slug: {quiz_slug}")
             
@@ -296,15 +343,85 @@ def process_quiz(
         return False
 
 
-def main():
+def replay_archive(urls: Optional[List[str]] = None) -> int:
+    """
+    Re-parse archived quiz pages without touching the network.
+    
+    Nothing is translated, published or marked as processed; this is a
+    dry run for checking parser changes against real pages.
+    
+    Args:
+        urls: Archived URLs to replay (the whole archive if omitted)
+        
+    Returns:
+        Exit code (0 if every page parsed)
+    """
+    logger.info("=" * 80)
+    logger.info("REPLAY: Parsing archived quiz pages (no network, no publishing)")
+    logger.info("=" * 80)
+    
+    scraper = ReplayScraper(HTMLArchive())
+    # Bulk reparsing uses the fastest installed backend unless one is configured
+    parser = QuizParser(backend=os.getenv('QUIZ_PARSER_BACKEND', 'auto'))
+    
+    urls = urls or scraper.get_quiz_urls()
+    if not urls:
+        logger.warning("REPLAY: The HTML archive is empty")
+        return 1
+    
+    started = time.monotonic()
+    total_questions = 0
+    failed = 0
+    
+    for idx, url in enumerate(urls, start=1):
+        try:
+            html = scraper.submit_quiz(url)
+            quiz_data = parser.parse_quiz(html, url)
+            total_questions += len(quiz_data.questions)
+            logger.info(f"[{idx}/{len(urls)}] ✓ {len(quiz_data.questions)} questions: {url}")
+        except (ScraperError, ValueError) as e:
+            failed += 1
+            logger.error(f"[{idx}/{len(urls)}] ✗ {url}: {e}")
+    
+    logger.info("=" * 80)
+    logger.info(f"REPLAY: {len(urls) - failed}/{len(urls)} quizzes parsed, "
+                f"{total_questions} questions in {time.monotonic() - started:.2f}s")
+    logger.info("=" * 80)
+    return 1 if failed else 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Pendulumedu quiz scraper pipeline")
+    parser.add_argument(
+        '--replay',
+        action='store_true',
+        help="Parse quiz pages from the HTML archive instead of scraping (dry run)"
+    )
+    parser.add_argument(
+        '--url',
+        action='append',
+        dest='urls',
+        help="Archived quiz URL to replay (repeatable; default: whole archive)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main execution function.
     Orchestrates the entire quiz scraping, translation, and distribution pipeline.
     """
+    args = parse_args(argv)
+    if args.replay:
+        return replay_archive(args.urls)
+    
     logger.info("=" * 80)
     logger.info("Starting Pendulumedu Quiz Scraper")
     logger.info("=" * 80)
     
+    scraper = None
+    
     try:
         # Step 1: Load environment variables
         logger.info("\n[1/8] Loading configuration...")
@@ -325,10 +442,51 @@ def main():
         session = login_manager.get_session()
         logger.info("Authentication successful")
         
-        # Step 4: Initialize all components
-        logger.info("\n[4/8] Initializing pipeline components...")
+        # Step 4: Initialize the scraper; everything else waits until there is work
+        logger.info("\n[4/8] Initializing scraper...")
+        # The scraper owns a browser pool shared by the listing fetch and every quiz
         scraper = QuizScraper(session)
+        
+        # Step 5: Fetch quiz listing
+        logger.info("\n[5/8] Fetching quiz listing from website...")
+        # Page through the listing only until the newest processed quiz shows up
+        all_quiz_urls = scraper.get_quiz_urls(known_urls=processed_urls)
+        logger.info(f"✓ Found {len(all_quiz_urls)} total quizzes on website")
+        
+        if all_quiz_urls:
+            logger.info(f"   Latest quiz: {all_quiz_urls[0]}")
+            if len(all_quiz_urls) > 1:
+                logger.info(f"   Oldest quiz: {all_quiz_urls[-1]}")
+        
+        # Step 6: Filter out already-processed URLs
+        logger.info("\n[6/8] Filtering new quizzes...")
+        logger.info(f"   Processed URLs in database: {len(processed_urls)}")
+        logger.info(f"   Total URLs from website: {len(all_quiz_urls)}")
+        
+        new_quiz_urls = [url for url in all_quiz_urls if not state_manager.is_processed(url)]
+        already_processed = len(all_quiz_urls) - len(new_quiz_urls)
+        
+        logger.info(f"   Already processed: {already_processed}")
+        logger.info(f"   ✓ New quizzes to process: {len(new_quiz_urls)}")
+        
+        if new_quiz_urls:
+            logger.info(f"\n   New quiz URLs:")
+            for idx, url in enumerate(new_quiz_urls[:5], 1):  # Show first 5
+                logger.info(f"      {idx}. {url}")
+            if len(new_quiz_urls) > 5:
+                logger.info(f"      ... and {len(new_quiz_urls) - 5} more")
+        
+        if not new_quiz_urls:
+            logger.info("\n✓ No new quizzes to process. All quizzes are up to date!")
+            logger.info(f"   Database has {len(processed_urls)} processed quizzes")
+            logger.info(f"   Website has {len(all_quiz_urls)} total quizzes")
+            log_import_report()
+            return 0
+        
+        # Step 7: Initialize the remaining components and process each new quiz
+        logger.info("\n[7/8] Initializing pipeline components...")
         parser = QuizParser()
+        parse_cache = ParseCache(backend=parser.backend.name) if os.getenv('PARSE_CACHE', 'true').lower() == 'true' else None
         translator = Translator()
         pdf_generator = PDFGenerator()
         date_extractor = DateExtractor()
@@ -364,41 +522,6 @@ def main():
         
         logger.info("All components initialized")
         
-        # Step 5: Fetch quiz listing
-        logger.info("\n[5/8] Fetching quiz listing from website...")
-        all_quiz_urls = scraper.get_quiz_urls()
-        logger.info(f"✓ Found {len(all_quiz_urls)} total quizzes on website")
-        
-        if all_quiz_urls:
-            logger.info(f"   Latest quiz: {all_quiz_urls[0]}")
-            if len(all_quiz_urls) > 1:
-                logger.info(f"   Oldest quiz: {all_quiz_urls[-1]}")
-        
-        # Step 6: Filter out already-processed URLs
-        logger.info("\n[6/8] Filtering new quizzes...")
-        logger.info(f"   Processed URLs in database: {len(processed_urls)}")
-        logger.info(f"   Total URLs from website: {len(all_quiz_urls)}")
-        
-        new_quiz_urls = [url for url in all_quiz_urls if not state_manager.is_processed(url)]
-        already_processed = len(all_quiz_urls) - len(new_quiz_urls)
-        
-        logger.info(f"   Already processed: {already_processed}")
-        logger.info(f"   ✓ New quizzes to process: {len(new_quiz_urls)}")
-        
-        if new_quiz_urls:
-            logger.info(f"\n   New quiz URLs:")
-            for idx, url in enumerate(new_quiz_urls[:5], 1):  # Show first 5
-                logger.info(f"      {idx}. {url}")
-            if len(new_quiz_urls) > 5:
-                logger.info(f"      ... and {len(new_quiz_urls) - 5} more")
-        
-        if not new_quiz_urls:
-            logger.info("\n✓ No new quizzes to process. All quizzes are up to date!")
-            logger.info(f"   Database has {len(processed_urls)} processed quizzes")
-            logger.info(f"   Website has {len(all_quiz_urls)} total quizzes")
-            return 0
-        
-        # Step 7: Process each new quiz
         logger.info("\n[7/8] Processing new quizzes...")
         successful_count = 0
         failed_count = 0
@@ -417,7 +540,9 @@ def main():
                 supabase_manager=supabase_manager,
                 notification_sender=notification_sender,
                 state_manager=state_manager,
-                date_extractor=date_extractor
+                date_extractor=date_extractor,
+                debug_capture=scraper.debug_capture,
+                parse_cache=parse_cache
             )
             
             if success:
@@ -435,6 +560,13 @@ def main():
         logger.info(f"New quizzes: {len(new_quiz_urls)}")
         logger.info(f"Successfully processed: {successful_count}")
         logger.info(f"Failed: {failed_count}")
+        scraper.log_tier_stats()
+        scraper.log_http_cache_stats()
+        if parse_cache:
+            parse_cache.log_summary()
+        translator.log_summary()
+        scraper.log_rate_stats()
+        log_import_report()
         logger.info("=" * 80)
         
         # Return exit code based on results
@@ -461,6 +593,10 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
         return 1
+    
+    finally:
+        if scraper is not None:
+            scraper.close()
 
 
 if __name__ == "__main__":
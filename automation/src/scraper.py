@@ -5,19 +5,49 @@ Handles fetching quiz listings and individual quiz pages
 
 import os
 import time
+import threading
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from datetime import datetime
+from typing import Dict, List, Optional, Set
 from urllib3.util.retry import Retry
 
-# Try to import Playwright at module level
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    sync_playwright = None
+from .date_extractor import DateExtractor
+from .http_cache import HTTPCache, CachingHTTPAdapter
+from .html_archive import HTMLArchive
+from .debug_capture import DebugCapture
+from .rate_limiter import RateController, RateLimitedAdapter
+from .listing_endpoint import ListingEndpoint, extract_fragment_html
+
+from .browser_pool import (
+    BrowserPool,
+    PLAYWRIGHT_AVAILABLE,
+    session_cookies_for_browser,
+)
+
+
+# Head texts shown by .solution-sec .head once answers are revealed
+REVEAL_MARKERS = ('Correct Answer:', 'सही उत्तर:')
+
+# DOM predicate: true once every solution head shows a reveal marker
+SOLUTIONS_REVEALED_JS = """(markers) => {
+    const heads = document.querySelectorAll('.solution-sec .head');
+    if (heads.length === 0) {
+        return false;
+    }
+    return Array.from(heads).every(
+        (head) => markers.some((marker) => (head.textContent || '').includes(marker))
+    );
+}"""
+
+# href of the first anchor in every listing card, in page order
+CARD_HREFS_JS = """() => Array.from(document.querySelectorAll('div.card-section'))
+    .map((card) => card.querySelector('a[href]'))
+    .filter((anchor) => anchor !== null)
+    .map((anchor) => anchor.getAttribute('href'))"""
+
+# Overall deadline for revealing solutions after the quiz page has loaded
+DEFAULT_REVEAL_TIMEOUT = float(os.getenv('SOLUTION_WAIT_TIMEOUT', '15'))
 
 
 class ScraperError(Exception):
@@ -25,18 +55,113 @@ class ScraperError(Exception):
     pass
 
 
+def remaining_ms(deadline: float) -> float:
+    """Milliseconds left until a time.monotonic() deadline (at least 1)."""
+    return max(1.0, (deadline - time.monotonic()) * 1000)
+
+
+def has_revealed_answers(html: str) -> bool:
+    """
+    Check whether quiz HTML shows the correct answers.
+    
+    Looks at the first .solution-sec .head, the same check the Playwright
+    path has always used to decide whether the reveal worked.
+    
+    Args:
+        html: Quiz page HTML
+        
+    Returns:
+        True if the first solution head shows a reveal marker
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('div', class_='solution-sec'))
+    solution_section = soup.find('div', class_='solution-sec')
+    if not solution_section:
+        return False
+    
+    head = solution_section.find('div', class_='head')
+    if not head:
+        return False
+    
+    head_text = head.get_text(strip=True)
+    return any(marker in head_text for marker in REVEAL_MARKERS)
+
+
+class TierStats:
+    """Thread-safe record of which reveal tier served each quiz in a run"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.served_by: Dict[str, str] = {}
+        self.http_fallbacks = 0
+    
+    def record(self, url: str, tier: str) -> None:
+        """Remember that a quiz was served by a tier ("http" or "browser")"""
+        with self._lock:
+            self.served_by[url] = tier
+    
+    def record_fallback(self) -> None:
+        """Count an HTTP attempt that had to fall back to the browser"""
+        with self._lock:
+            self.http_fallbacks += 1
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of quizzes served per tier"""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for tier in self.served_by.values():
+                counts[tier] = counts.get(tier, 0) + 1
+            return counts
+    
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        counts = self.counts()
+        return (
+            f"http={counts.get('http', 0)}, browser={counts.get('browser', 0)}, "
+            f"http fallbacks={self.http_fallbacks}"
+        )
+
+
 class QuizScraper:
     """Scrapes quiz content from pendulumedu.com"""
     
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: requests.Session, browser_pool: Optional[BrowserPool] = None,
+                 rate_controller: Optional[RateController] = None):
         """
         Initialize QuizScraper with authenticated session
         
         Args:
             session: Authenticated requests.Session object
+            browser_pool: Optional shared BrowserPool (one is created if omitted)
+            rate_controller: Optional shared RateController (one is created if omitted)
         """
         self.session = session
         self.listing_url = "https://pendulumedu.com/quiz/current-affairs"
+        self.login_url = "https://pendulumedu.com/login"
+        self.reveal_timeout = DEFAULT_REVEAL_TIMEOUT
+        self.date_extractor = DateExtractor()
+        
+        # Page the listing over HTTP using the "Show more" endpoint a browser run recorded
+        self.http_listing = os.getenv('HTTP_LISTING', 'true').lower() == 'true'
+        self.listing_endpoint_path = os.getenv('LISTING_ENDPOINT_PATH', 'data/listing_endpoint.json')
+        
+        # Try the plain HTTP form submission before starting a browser
+        self.http_fast_path = os.getenv('HTTP_FAST_PATH', 'true').lower() == 'true'
+        self.tier_stats = TierStats()
+        
+        # Keep every revealed page so parsing can be replayed without the network
+        self.archive = HTMLArchive() if os.getenv('HTML_ARCHIVE', 'true').lower() == 'true' else None
+        
+        # Pages and screenshots are only written when a stage fails (or SCRAPER_DEBUG=true)
+        self.debug_capture = DebugCapture()
+        
+        # One controller paces HTTP requests and browser navigations of every worker
+        self.rate_controller = rate_controller or RateController()
+        
+        # Browser contexts start with the cookies LoginManager already validated
+        self.browser_pool = browser_pool or BrowserPool(
+            cookies=session_cookies_for_browser(session),
+            rate_controller=self.rate_controller
+        )
         
         # Configure retry strategy for network resilience
         retry_strategy = Retry(
@@ -45,17 +170,53 @@ class QuizScraper:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        
+        # Revalidate GETs against the on-disk cache so unchanged pages are not re-downloaded
+        self.http_cache = HTTPCache() if os.getenv('HTTP_CACHE', 'true').lower() == 'true' else None
+        if self.http_cache:
+            adapter = CachingHTTPAdapter(self.http_cache, max_retries=retry_strategy,
+                                         rate_controller=self.rate_controller)
+        else:
+            adapter = RateLimitedAdapter(max_retries=retry_strategy,
+                                         rate_controller=self.rate_controller)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def get_quiz_urls(self) -> List[str]:
+    def __enter__(self) -> "QuizScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the browser owned by the calling thread, if any"""
+        self.browser_pool.close()
+    
+    def get_quiz_urls(self, known_urls: Optional[Set[str]] = None,
+                      until_date: Optional[datetime] = None,
+                      max_pages: Optional[int] = None) -> List[str]:
         """
-        Fetch and extract all quiz URLs from the listing page
-        Uses Playwright to handle "Show more" button clicks
+        Fetch and extract quiz URLs from the listing page
+        
+        The listing is fetched over HTTP first and further pages are requested
+        from the "Show more" endpoint learned by an earlier browser run.
+        Playwright (clicking "Show more") is only used when the HTTP path
+        fails or the endpoint has not been learned yet.
+        
+        Discovery modes:
+        - Incremental (known_urls): keep paging only until the listing reaches
+          a URL that was already processed (the watermark)
+        - Archive (until_date): keep paging until the listing is exhausted or
+          the oldest loaded quiz is older than until_date
+        - Default: load the first page and click "Show more" once
+        
+        Args:
+            known_urls: Already-processed URLs, e.g. from StateManager
+            until_date: Oldest quiz date that must be reached (archive mode)
+            max_pages: Safety cap on listing pages (defaults to LISTING_MAX_PAGES, 50)
         
         Returns:
-            List of quiz URLs extracted from card-section divs
+            List of quiz URLs extracted from card-section divs, newest first
             
         Raises:
             ScraperError: If fetching or parsing fails
@@ -63,104 +224,287 @@ class QuizScraper:
         import logging
         logger = logging.getLogger(__name__)
         
+        if known_urls or until_date:
+            if max_pages is None:
+                max_pages = int(os.getenv('LISTING_MAX_PAGES', '50'))
+        else:
+            # Legacy behaviour: first page plus a single "Show more"
+            max_pages = 2
+        
+        if self.http_listing:
+            try:
+                return self._get_quiz_urls_http(known_urls, until_date, max_pages)
+            except (ScraperError, requests.RequestException) as e:
+                logger.info(f"HTTP listing unavailable ({e}), falling back to Playwright")
+        
+        return self._get_quiz_urls_browser(known_urls, until_date, max_pages)
+    
+    def _get_quiz_urls_http(self, known_urls: Optional[Set[str]],
+                            until_date: Optional[datetime],
+                            max_pages: int) -> List[str]:
+        """
+        Page the listing with plain HTTP requests
+        
+        Args:
+            known_urls: Already-processed URLs (incremental mode)
+            until_date: Oldest date to reach (archive mode)
+            max_pages: Safety cap on listing pages
+            
+        Returns:
+            List of quiz URLs, newest first
+            
+        Raises:
+            ScraperError: If the static listing has no cards or more pages are
+                needed but the "Show more" endpoint is unknown or not answering
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        logger.info(f"Fetching listing page over HTTP: {self.listing_url}")
+        response = self.session.get(self.listing_url, timeout=30)
+        response.raise_for_status()
+        
+        quiz_urls = self._extract_card_urls(response.text)
+        if not quiz_urls:
+            raise ScraperError("no card-section divs in the static listing HTML")
+        
+        endpoint = None
+        pages_loaded = 1
+        while True:
+            reason = self._discovery_stop_reason(quiz_urls, known_urls, until_date)
+            if reason:
+                logger.info(f"✓ Stopped paging after {pages_loaded} page(s): {reason}")
+                break
+            
+            if pages_loaded >= max_pages:
+                logger.info(f"✓ Stopped paging at the {max_pages} page limit")
+                break
+            
+            if endpoint is None:
+                endpoint = ListingEndpoint.load(self.listing_endpoint_path)
+                if endpoint is None:
+                    raise ScraperError("'Show more' endpoint has not been learned yet")
+            
+            request = endpoint.request_for_page(pages_loaded + 1)
+            request['headers']['Referer'] = self.listing_url
+            response = self.session.request(timeout=30, **request)
+            response.raise_for_status()
+            
+            page_urls = self._extract_card_urls(extract_fragment_html(response.text))
+            if not page_urls and pages_loaded == 1:
+                # An empty first replay means the saved endpoint went stale
+                raise ScraperError("'Show more' endpoint returned no cards")
+            
+            seen = set(quiz_urls)
+            new_urls = [url for url in page_urls if url not in seen]
+            if not new_urls:
+                logger.info(f"✓ Listing exhausted after {pages_loaded} page(s)")
+                break
+            
+            quiz_urls.extend(new_urls)
+            pages_loaded += 1
+        
+        print(f"Found {len(quiz_urls)} quiz URLs on listing page (HTTP)")
+        return quiz_urls
+    
+    def _get_quiz_urls_browser(self, known_urls: Optional[Set[str]],
+                               until_date: Optional[datetime],
+                               max_pages: int) -> List[str]:
+        """
+        Page the listing in Playwright by clicking "Show more"
+        
+        The XHR requests fired by the clicks are recorded and saved as the
+        listing endpoint so the next run can stay on the HTTP path.
+        
+        Args:
+            known_urls: Already-processed URLs (incremental mode)
+            until_date: Oldest date to reach (archive mode)
+            max_pages: Safety cap on listing pages
+            
+        Returns:
+            List of quiz URLs, newest first
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
         if not PLAYWRIGHT_AVAILABLE:
             raise ScraperError("Playwright not installed. Run: pip install playwright && playwright install chromium")
         
         logger.info("Fetching quiz URLs with Playwright (to handle 'Show more' button)...")
         
-        with sync_playwright() as p:
-            # Launch browser
-            use_headless = os.getenv('USE_HEADLESS', 'true').lower() == 'true'
-            browser = p.chromium.launch(headless=use_headless)
-            
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
+        recorded = []
+        
+        def record_request(request):
+            if request.resource_type in ('xhr', 'fetch') and 'pendulumedu.com' in request.url:
+                recorded.append((request.method, request.url, request.post_data))
+        
+        with self.browser_pool.page() as page:
+            # Navigate to listing page
+            logger.info(f"Loading listing page: {self.listing_url}")
+            self.browser_pool.goto(page, self.listing_url, wait_until='networkidle', timeout=30000)
+            logger.info("✓ Listing page loaded")
             
+            page.on('request', record_request)
             try:
-                # Navigate to listing page
-                logger.info(f"Loading listing page: {self.listing_url}")
-                page.goto(self.listing_url, wait_until='networkidle', timeout=30000)
-                logger.info("✓ Listing page loaded")
-                
-                # Click "Show more" button once to load additional quizzes
-                try:
-                    # Look for "Show more" button
-                    show_more_button = page.locator('.show_more')
+                pages_loaded = 1
+                first_page_count = 0
+                while True:
+                    quiz_urls = [self._absolute_url(href) for href in page.evaluate(CARD_HREFS_JS)]
+                    if pages_loaded == 1:
+                        first_page_count = len(quiz_urls)
                     
-                    # Check if button exists and is visible
-                    if show_more_button.count() > 0 and show_more_button.is_visible(timeout=2000):
-                        logger.info("Clicking 'Show more' button once...")
-                        
-                        # Scroll to button
-                        show_more_button.scroll_into_view_if_needed()
-                        page.wait_for_timeout(500)
-                        
-                        # Click the button
-                        show_more_button.click()
-                        logger.info("✓ 'Show more' button clicked")
-                        
-                        # Wait for new content to load
-                        page.wait_for_timeout(2000)
-                        
-                        # Wait for loading indicator to disappear
-                        try:
-                            loading = page.locator('.loding')
-                            if loading.count() > 0:
-                                loading.wait_for(state='hidden', timeout=5000)
-                        except Exception:
-                            pass
-                        
-                        logger.info("✓ Additional quizzes loaded")
-                    else:
-                        logger.info("'Show more' button not found or not visible")
-                        
-                except Exception as e:
-                    logger.info(f"Could not click 'Show more' button: {e}")
-                
-                # Get the final HTML
-                html = page.content()
-                
-                # Parse HTML
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find all card-section divs
-                card_sections = soup.find_all('div', class_='card-section')
-                
-                if not card_sections:
-                    logger.warning("No card-section divs found on listing page")
-                    return []
-                
-                # Extract URLs from anchor tags within card sections
-                quiz_urls = []
-                for card in card_sections:
-                    # Find anchor tag within the card
-                    anchor = card.find('a', href=True)
-                    if anchor:
-                        url = anchor['href']
-                        
-                        # Convert relative URLs to absolute
-                        if url.startswith('/'):
-                            url = f"https://pendulumedu.com{url}"
-                        elif not url.startswith('http'):
-                            url = f"https://pendulumedu.com/{url}"
-                        
-                        quiz_urls.append(url)
-                
-                print(f"Found {len(quiz_urls)} quiz URLs on listing page")
-                return quiz_urls
-                
+                    reason = self._discovery_stop_reason(quiz_urls, known_urls, until_date)
+                    if reason:
+                        logger.info(f"✓ Stopped paging after {pages_loaded} page(s): {reason}")
+                        break
+                    
+                    if pages_loaded >= max_pages:
+                        logger.info(f"✓ Stopped paging at the {max_pages} page limit")
+                        break
+                    
+                    if pages_loaded == 1:
+                        # Only XHRs fired by "Show more" clicks are of interest
+                        recorded.clear()
+                    
+                    if not self._load_more(page, len(quiz_urls)):
+                        logger.info(f"✓ Listing exhausted after {pages_loaded} page(s)")
+                        break
+                    
+                    pages_loaded += 1
             finally:
-                browser.close()
-                logger.info("Browser closed")
+                page.remove_listener('request', record_request)
+            
+            if pages_loaded > 1:
+                self._learn_listing_endpoint(recorded, pages_loaded - 1, first_page_count)
+            
+            if not quiz_urls:
+                logger.warning("No card-section divs found on listing page")
+                return []
+            
+            print(f"Found {len(quiz_urls)} quiz URLs on listing page")
+            return quiz_urls
+    
+    def _learn_listing_endpoint(self, recorded: List, clicks: int, cards_per_page: int) -> None:
+        """Save the "Show more" endpoint recorded during a browser listing run"""
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        endpoint = ListingEndpoint.learn(recorded, clicks, cards_per_page)
+        if endpoint is None:
+            logger.info(f"Could not identify the 'Show more' endpoint among {len(recorded)} XHR request(s)")
+            return
+        
+        endpoint.save(self.listing_endpoint_path)
+        logger.info(
+            f"✓ Learned listing endpoint: {endpoint.method} {endpoint.url} "
+            f"({endpoint.page_param} from {endpoint.first_value}, step {endpoint.step})"
+        )
+    
+    def _extract_card_urls(self, html: str) -> List[str]:
+        """
+        Extract quiz URLs from listing HTML
+        
+        Args:
+            html: Listing page or "Show more" fragment HTML
+            
+        Returns:
+            Absolute URLs of the first link in every card-section div
+        """
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('div', class_='card-section'))
+        
+        quiz_urls = []
+        for card in soup.find_all('div', class_='card-section'):
+            link = card.find('a', href=True)
+            if link:
+                quiz_urls.append(self._absolute_url(link['href']))
+        return quiz_urls
+    
+    @staticmethod
+    def _absolute_url(url: str) -> str:
+        """Convert a listing href to an absolute pendulumedu.com URL"""
+        if url.startswith('/'):
+            return f"https://pendulumedu.com{url}"
+        if not url.startswith('http'):
+            return f"https://pendulumedu.com/{url}"
+        return url
+    
+    def _discovery_stop_reason(self, quiz_urls: List[str],
+                               known_urls: Optional[Set[str]],
+                               until_date: Optional[datetime]) -> Optional[str]:
+        """
+        Decide whether the loaded listing already covers what was asked for
+        
+        Args:
+            quiz_urls: URLs loaded so far, newest first
+            known_urls: Already-processed URLs (incremental mode)
+            until_date: Oldest date to reach (archive mode)
+            
+        Returns:
+            Reason to stop paging, or None to keep going
+        """
+        if not quiz_urls:
+            return None
+        
+        if known_urls:
+            for position, url in enumerate(quiz_urls):
+                if url in known_urls:
+                    return f"reached already-processed quiz #{position + 1} ({url})"
+        
+        if until_date:
+            oldest = self.date_extractor.extract_date_from_url(quiz_urls[-1])
+            if oldest and oldest[0].date() < until_date.date():
+                return f"oldest loaded quiz ({oldest[1]}) is before {until_date.date()}"
+        
+        return None
     
-    def get_quiz_page(self, url: str) -> str:
+    def _load_more(self, page, previous_count: int) -> bool:
+        """
+        Click "Show more" and wait for additional cards
+        
+        Args:
+            page: Playwright page showing the listing
+            previous_count: Number of cards before clicking
+            
+        Returns:
+            True if new cards were loaded, False if the listing is exhausted
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        show_more_button = page.locator('.show_more')
+        try:
+            if show_more_button.count() == 0 or not show_more_button.first.is_visible():
+                return False
+            
+            show_more_button.first.scroll_into_view_if_needed()
+            show_more_button.first.click()
+            
+            # Done as soon as more cards are in the DOM
+            page.wait_for_function(
+                "(count) => document.querySelectorAll('div.card-section').length > count",
+                arg=previous_count,
+                timeout=10000
+            )
+            
+            # Wait for loading indicator to disappear
+            loading = page.locator('.loding')
+            if loading.count() > 0:
+                loading.first.wait_for(state='hidden', timeout=5000)
+            
+            return True
+        except Exception as e:
+            logger.info(f"Could not load more quizzes: {e}")
+            return False
+    
+    def get_quiz_page(self, url: str, fresh: bool = False) -> str:
         """
         Fetch individual quiz page HTML
         
+        Requests are paced by the shared rate controller.
+        
         Args:
             url: URL of the quiz page to fetch
+            fresh: Bypass the HTTP cache (e.g. right after submitting the quiz)
             
         Returns:
             HTML content as string
@@ -183,9 +527,9 @@ class QuizScraper:
                 'Sec-Fetch-User': '?1',
                 'Referer': 'https://pendulumedu.com/quiz/current-affairs',
             }
-            
-            # Add small delay
-            time.sleep(1)
+            if fresh:
+                # Skip cache revalidation: the page changes with session state
+                headers['Cache-Control'] = 'no-cache'
             
             response = self.session.get(
                 url,
@@ -207,9 +551,10 @@ class QuizScraper:
     
     def submit_quiz(self, url: str) -> str:
         """
-        Submit quiz to reveal solutions using Playwright.
+        Submit quiz to reveal solutions.
         
-        Playwright handles JavaScript execution properly, unlike Selenium in headless mode.
+        Tries the plain HTTP form submission first and only starts a
+        Playwright page when the returned HTML does not show the answers.
         
         Args:
             url: URL of the quiz page
@@ -224,15 +569,73 @@ class QuizScraper:
         logger = logging.getLogger(__name__)
         
         logger.info("=" * 80)
-        logger.info("SUBMIT_QUIZ: Starting quiz submission with Playwright")
+        logger.info("SUBMIT_QUIZ: Starting quiz submission")
         logger.info(f"SUBMIT_QUIZ: URL = {url}")
         logger.info("=" * 80)
         
-        return self._submit_quiz_playwright(url)
+        html = self.try_http_reveal(url)
+        if html is None:
+            html = self._submit_quiz_playwright(url)
+            self.tier_stats.record(url, 'browser')
+        
+        self.archive_html(url, html)
+        return html
+    
+    def archive_html(self, url: str, html: str) -> None:
+        """Store a revealed page in the HTML archive (if enabled)"""
+        if self.archive:
+            self.archive.put(url, html)
+    
+    def try_http_reveal(self, url: str) -> Optional[str]:
+        """
+        Reveal solutions over plain HTTP (tier 1).
+        
+        Args:
+            url: URL of the quiz page
+            
+        Returns:
+            HTML with solutions, or None if the browser is needed
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        if not self.http_fast_path:
+            return None
+        
+        started = time.monotonic()
+        with self.debug_capture.capture(url, 'http') as capture:
+            try:
+                html = self._submit_quiz_post(url)
+                capture.add_html('response', html)
+                if has_revealed_answers(html):
+                    self.tier_stats.record(url, 'http')
+                    logger.info(f"SUBMIT_QUIZ: ✓ Answers revealed over HTTP in {time.monotonic() - started:.2f}s")
+                    return html
+                logger.info("SUBMIT_QUIZ: HTTP response has no answers, falling back to browser")
+            except Exception as e:
+                capture.mark_failed(f"{type(e).__name__}: {e}")
+                logger.warning(f"SUBMIT_QUIZ: HTTP fast path failed ({e}), falling back to browser")
+        
+        self.tier_stats.record_fallback()
+        return None
+    
+    def log_tier_stats(self) -> None:
+        """Log which tier served the quizzes of this run"""
+        import logging
+        logging.getLogger(__name__).info(f"Reveal tiers: {self.tier_stats.summary()}")
+    
+    def log_http_cache_stats(self) -> None:
+        """Log conditional-GET cache statistics of this run"""
+        if self.http_cache:
+            self.http_cache.log_summary()
+    
+    def log_rate_stats(self) -> None:
+        """Log the pace the rate controller settled on"""
+        self.rate_controller.log_summary()
     
     def _submit_quiz_playwright(self, url: str) -> str:
         """
-        Submit quiz using Playwright (better JavaScript support than Selenium).
+        Submit quiz using Playwright (full JavaScript support).
         
         Args:
             url: URL of the quiz page
@@ -246,164 +649,173 @@ class QuizScraper:
         if not PLAYWRIGHT_AVAILABLE:
             raise ScraperError("Playwright not installed. Run: pip install playwright && playwright install chromium")
         
-        logger.info("PLAYWRIGHT: Starting browser...")
+        logger.info("PLAYWRIGHT: Borrowing page from browser pool...")
         
-        with sync_playwright() as p:
-            # Launch browser (headless by default, can be changed for debugging)
-            use_headless = os.getenv('USE_HEADLESS', 'true').lower() == 'true'
-            browser = p.chromium.launch(headless=use_headless)
+        with self.browser_pool.page() as page, \
+                self.debug_capture.capture(url, 'playwright') as capture:
+            capture.attach_page(page, self.browser_pool.context, trace=self.debug_capture.trace)
             
-            logger.info(f"PLAYWRIGHT: Browser launched (headless={use_headless})")
+            # The context already carries the session cookies, so go straight to the quiz
+            logger.info(f"PLAYWRIGHT: Loading quiz page: {url}")
+            self.browser_pool.goto(page, url, wait_until='networkidle', timeout=30000)
+            logger.info(f"PLAYWRIGHT: ✓ Quiz page loaded, URL: {page.url}")
             
-            # Create context and page
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
-            try:
-                # Get credentials
-                email = os.getenv('LOGIN_EMAIL')
-                password = os.getenv('LOGIN_PASSWORD')
+            if self._is_logged_out(page):
+                # Injected session was rejected, fall back to the login form
+                logger.info("PLAYWRIGHT: Injected session not accepted, logging in with form...")
+                self._login_playwright(page)
                 
-                if not email or not password:
-                    raise ScraperError("LOGIN_EMAIL and LOGIN_PASSWORD must be set")
+                self.browser_pool.goto(page, url, wait_until='networkidle', timeout=30000)
+                logger.info(f"PLAYWRIGHT: ✓ Quiz page reloaded, URL: {page.url}")
                 
-                # First, login to the website
-                logger.info("PLAYWRIGHT: Logging in...")
-                login_url = "https://pendulumedu.com/login"
-                page.goto(login_url, wait_until='networkidle', timeout=30000)
-                logger.info("PLAYWRIGHT: ✓ Login page loaded")
-                
-                # Fill login form
-                logger.info("PLAYWRIGHT: Filling login credentials...")
-                page.fill('input[name="emailId"]', email)
-                page.fill('input[name="password"]', password)
-                
-                # Click submit button
-                logger.info("PLAYWRIGHT: Submitting login form...")
-                page.click('button[type="submit"]')
-                
-                # Wait for login to complete (page will redirect)
-                logger.info("PLAYWRIGHT: Waiting for login to complete...")
-                page.wait_for_load_state('networkidle', timeout=10000)
-                logger.info(f"PLAYWRIGHT: ✓ Logged in, current URL: {page.url}")
-                
-                # Now navigate to quiz page
-                logger.info(f"PLAYWRIGHT: Loading quiz page: {url}")
-                page.goto(url, wait_until='networkidle', timeout=30000)
-                logger.info(f"PLAYWRIGHT: ✓ Quiz page loaded, URL: {page.url}")
-                
-                # Save screenshot for debugging
+                if self._is_logged_out(page):
+                    raise ScraperError("Browser session is not logged in after form login")
+            else:
+                logger.info("PLAYWRIGHT: ✓ Injected session accepted")
+            
+            # One deadline covers finding the submit button and the reveal itself
+            wait_started = time.monotonic()
+            deadline = wait_started + self.reveal_timeout
+            
+            # Check if quiz already has answers (already submitted before)
+            if page.evaluate(SOLUTIONS_REVEALED_JS, list(REVEAL_MARKERS)):
+                logger.info("PLAYWRIGHT: ✅ Quiz already submitted! Answers are visible.")
+                revealed = True
+            else:
+                logger.info("PLAYWRIGHT: Quiz not submitted yet, looking for submit button...")
                 try:
-                    page.screenshot(path='debug_playwright_page.png')
-                    logger.info("PLAYWRIGHT: Saved screenshot to debug_playwright_page.png")
-                except Exception:
-                    pass
+                    submit_button = page.locator('#submit-ans')
+                    submit_button.wait_for(state='visible', timeout=remaining_ms(deadline))
+                    submit_button.scroll_into_view_if_needed()
+                    logger.info("PLAYWRIGHT: ✓ Submit button found")
+                except Exception as e:
+                    logger.error(f"PLAYWRIGHT: Submit button not found: {e}")
+                    logger.error(f"PLAYWRIGHT: Current URL: {page.url}")
+                    raise
                 
-                # Check if quiz already has answers (already submitted before)
-                logger.info("PLAYWRIGHT: Checking if quiz already has answers...")
-                try:
-                    first_head = page.locator('.solution-sec .head').first
-                    head_text = first_head.text_content(timeout=2000)
-                    logger.info(f"PLAYWRIGHT: Head div text: '{head_text}'")
-                    
-                    if 'Correct Answer:' in head_text or 'सही उत्तर:' in head_text:
-                        logger.info("PLAYWRIGHT: ✅ Quiz already submitted! Answers are visible.")
-                        # No need to click submit, answers are already there
-                    else:
-                        logger.info("PLAYWRIGHT: Quiz not submitted yet, need to click submit button")
-                        raise Exception("Need to submit")
-                        
-                except Exception:
-                    # Quiz not submitted yet, need to click submit button
-                    logger.info("PLAYWRIGHT: Looking for submit button...")
-                    try:
-                        submit_button = page.locator('#submit-ans')
-                        submit_button.wait_for(state='visible', timeout=10000)
-                        logger.info("PLAYWRIGHT: ✓ Submit button found")
-                        
-                        # Scroll to button
-                        submit_button.scroll_into_view_if_needed()
-                        page.wait_for_timeout(1000)
-                        
-                        # Set up dialog handler BEFORE clicking
-                        def handle_dialog(dialog):
-                            logger.info(f"PLAYWRIGHT: Alert: '{dialog.message}'")
-                            dialog.accept()
-                        
-                        page.on('dialog', handle_dialog)
-                        
-                        # Click submit
-                        logger.info("PLAYWRIGHT: *** CLICKING SUBMIT BUTTON ***")
-                        submit_button.click()
-                        logger.info("PLAYWRIGHT: ✓ Submit button clicked")
-                        
-                        # Wait for solutions to update
-                        logger.info("PLAYWRIGHT: Waiting for solutions to load...")
-                        
-                        # Wait a moment for JavaScript to execute
-                        page.wait_for_timeout(2000)
-                        
-                        # Check if solutions loaded by looking at the head div text
-                        max_attempts = 15  # 15 seconds total
-                        for attempt in range(max_attempts):
-                            try:
-                                head_text = page.locator('.solution-sec .head').first.text_content()
-                                logger.info(f"PLAYWRIGHT: Attempt {attempt + 1}: Head div = '{head_text}'")
-                                
-                                if 'Correct Answer:' in head_text or 'सही उत्तर:' in head_text:
-                                    logger.info("PLAYWRIGHT: ✓ Solutions loaded!")
-                                    break
-                            except Exception:
-                                pass
-                            
-                            page.wait_for_timeout(1000)
-                        else:
-                            logger.warning("PLAYWRIGHT: Timeout waiting for solutions, continuing anyway...")
-                        
-                        # Wait a bit more for complete render
-                        page.wait_for_timeout(2000)
-                        
-                    except Exception as e:
-                        logger.error(f"PLAYWRIGHT: Submit button not found: {e}")
-                        logger.error(f"PLAYWRIGHT: Current URL: {page.url}")
-                        raise
+                # Set up dialog handler BEFORE clicking
+                def handle_dialog(dialog):
+                    logger.info(f"PLAYWRIGHT: Alert: '{dialog.message}'")
+                    dialog.accept()
                 
-                # Get HTML
-                html = page.content()
+                page.on('dialog', handle_dialog)
                 
-                # Save for debugging
                 try:
-                    with open('debug_scraped_quiz.html', 'w', encoding='utf-8') as f:
-                        f.write(html)
-                    logger.info("PLAYWRIGHT: Saved HTML to debug_scraped_quiz.html")
-                except Exception:
-                    pass
-                
-                # Verify we got correct answers
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
-                solution_sections = soup.find_all('div', class_='solution-sec')
-                
-                if solution_sections:
-                    first_head = solution_sections[0].find('div', class_='head')
-                    if first_head:
-                        head_text = first_head.get_text(strip=True)
-                        logger.info(f"PLAYWRIGHT: First head div: '{head_text}'")
-                        
-                        if 'Correct Answer:' in head_text or 'सही उत्तर:' in head_text:
-                            logger.info("PLAYWRIGHT: ✅ SUCCESS! Got correct answers!")
-                            return html
-                        else:
-                            logger.error(f"PLAYWRIGHT: ✗ FAILED - Head shows '{head_text}'")
-                
-                logger.warning("PLAYWRIGHT: Returning HTML anyway...")
+                    logger.info("PLAYWRIGHT: *** CLICKING SUBMIT BUTTON ***")
+                    submit_button.click()
+                    logger.info("PLAYWRIGHT: Waiting for solutions to load...")
+                    revealed = self._wait_for_solutions(page, deadline)
+                finally:
+                    # Pages are recycled by the pool, so drop the handler again
+                    page.remove_listener('dialog', handle_dialog)
+            
+            waited = time.monotonic() - wait_started
+            if revealed:
+                logger.info(f"PLAYWRIGHT: ✓ Solutions revealed after {waited:.2f}s")
+            else:
+                logger.warning(f"PLAYWRIGHT: Timeout after {waited:.2f}s waiting for solutions, continuing anyway...")
+            
+            # Get HTML
+            html = page.content()
+            capture.note('revealed_after', f"{waited:.2f}s" if revealed else "timeout")
+            
+            # Verify we got correct answers
+            if has_revealed_answers(html):
+                logger.info("PLAYWRIGHT: ✅ SUCCESS! Got correct answers!")
                 return html
-                
-            finally:
-                browser.close()
-                logger.info("PLAYWRIGHT: Browser closed")
+            
+            logger.error("PLAYWRIGHT: ✗ FAILED - First solution head shows no correct answer")
+            logger.warning("PLAYWRIGHT: Returning HTML anyway...")
+            capture.mark_failed("first solution head shows no correct answer")
+            return html
+    
+    def _wait_for_solutions(self, page, deadline: float) -> bool:
+        """
+        Wait until every solution head shows the correct answer.
+        
+        Uses a mutation-observer driven DOM predicate, so it returns as soon
+        as the page updates instead of polling on a fixed interval.
+        
+        Args:
+            page: Playwright page with the submitted quiz
+            deadline: time.monotonic() value after which waiting stops
+            
+        Returns:
+            True if solutions were revealed before the deadline
+        """
+        try:
+            page.wait_for_function(
+                SOLUTIONS_REVEALED_JS,
+                arg=list(REVEAL_MARKERS),
+                polling='mutation',
+                timeout=remaining_ms(deadline)
+            )
+            return True
+        except Exception:
+            return False
+    
+    def _is_logged_out(self, page) -> bool:
+        """
+        Check whether a loaded page shows the logged-out state.
+        
+        Args:
+            page: Playwright page after navigation
+            
+        Returns:
+            True if the page redirected to login or shows sign-in buttons
+        """
+        if '/login' in page.url.lower():
+            return True
+        
+        try:
+            signin = page.locator('.signin-btn, .signup-btn')
+            return signin.count() > 0 and signin.first.is_visible()
+        except Exception:
+            return False
+    
+    def _login_playwright(self, page) -> None:
+        """
+        Log in through the website's login form inside the browser.
+        
+        The resulting browser session is saved as storage_state and copied
+        into the requests.Session so both stay in sync.
+        
+        Args:
+            page: Playwright page to log in with
+            
+        Raises:
+            ScraperError: If credentials are missing
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        email = os.getenv('LOGIN_EMAIL')
+        password = os.getenv('LOGIN_PASSWORD')
+        
+        if not email or not password:
+            raise ScraperError("LOGIN_EMAIL and LOGIN_PASSWORD must be set")
+        
+        logger.info("PLAYWRIGHT: Logging in...")
+        self.browser_pool.goto(page, self.login_url, wait_until='networkidle', timeout=30000)
+        logger.info("PLAYWRIGHT: ✓ Login page loaded")
+        
+        # Fill login form
+        page.fill('input[name="emailId"]', email)
+        page.fill('input[name="password"]', password)
+        
+        # Click submit button and wait for the redirect
+        page.click('button[type="submit"]')
+        page.wait_for_load_state('networkidle', timeout=10000)
+        logger.info(f"PLAYWRIGHT: ✓ Logged in, current URL: {page.url}")
+        
+        cookies = self.browser_pool.save_storage_state()
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', 'pendulumedu.com'),
+                path=cookie.get('path', '/')
+            )
     
     def _submit_quiz_post(self, url: str) -> str:
         """
@@ -417,11 +829,15 @@ class QuizScraper:
         """
         import logging
         logger = logging.getLogger(__name__)
-        from bs4 import BeautifulSoup
         
         logger.info("POST: Fetching initial page to get quiz ID...")
         initial_html = self.get_quiz_page(url)
         
+        # Quizzes attempted before already show their answers
+        if has_revealed_answers(initial_html):
+            logger.info("POST: ✓ Answers already visible, no submission needed")
+            return initial_html
+        
         soup = BeautifulSoup(initial_html, 'html.parser')
         quiz_id_input = soup.find('input', {'id': 'intQuizId'})
         english_quiz_id_input = soup.find('input', {'id': 'intEnglishQuizId'})
@@ -487,322 +903,85 @@ class QuizScraper:
         
         # The POST updates the session. Now GET the quiz page again.
         logger.info("POST: Fetching quiz page again (should have answers now)...")
-        time.sleep(2)  # Give server a moment
-        
-        updated_html = self.get_quiz_page(url)
-        
-        # Save for debugging
-        try:
-            with open('debug_scraped_quiz.html', 'w', encoding='utf-8') as f:
-                f.write(updated_html)
-            logger.info("POST: Saved HTML to debug_scraped_quiz.html")
-        except Exception:
-            pass
+        updated_html = self.get_quiz_page(url, fresh=True)
         
         return updated_html
+
+
+class ReplayScraper:
+    """
+    Stand-in for QuizScraper that serves pages from the HTML archive.
     
-    def _submit_quiz_selenium(self, url: str) -> str:
+    Used by --replay runs: no login, no listing request and no browser,
+    every quiz comes from data/archive.
+    """
+    
+    def __init__(self, archive: Optional[HTMLArchive] = None):
         """
-        Use Selenium to click submit button and wait for answers to load.
+        Initialize the replay scraper
         
         Args:
-            url: URL of the quiz page
+            archive: Archive to read from (default HTMLArchive if omitted)
+        """
+        self.archive = archive or HTMLArchive()
+        self.tier_stats = TierStats()
+    
+    def __enter__(self) -> "ReplayScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Nothing to release"""
+        pass
+    
+    def get_quiz_urls(self, known_urls: Optional[Set[str]] = None,
+                      until_date: Optional[datetime] = None,
+                      max_pages: Optional[int] = None) -> List[str]:
+        """
+        Archived quiz URLs, newest first
+        
+        Args:
+            known_urls: Ignored (replay covers the whole archive)
+            until_date: Only quizzes dated on or after this day
+            max_pages: Ignored
             
         Returns:
-            HTML content with solutions visible
-            
+            List of archived quiz URLs
+        """
+        return self.archive.urls(since=until_date)
+    
+    def submit_quiz(self, url: str) -> str:
+        """
+        Return the archived HTML of a quiz
+        
         Raises:
-            ScraperError: If submission fails
+            ScraperError: If the quiz was never archived
         """
+        html = self.archive.get(url)
+        if html is None:
+            raise ScraperError(f"Quiz not in the HTML archive: {url}")
+        self.tier_stats.record(url, 'archive')
+        return html
+    
+    def try_http_reveal(self, url: str) -> Optional[str]:
+        """Archive lookup used where the async engine expects the HTTP tier"""
+        html = self.archive.get(url)
+        if html is not None:
+            self.tier_stats.record(url, 'archive')
+        return html
+    
+    def log_tier_stats(self) -> None:
+        """Log how many quizzes were replayed"""
         import logging
-        logger = logging.getLogger(__name__)
-        
-        logger.info("=" * 80)
-        logger.info("SELENIUM: Method started")
-        logger.info(f"SELENIUM: URL = {url}")
-        logger.info("=" * 80)
-        
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from selenium.common.exceptions import TimeoutException, NoSuchElementException
-            
-            logger.info("SELENIUM: Imports successful")
-            
-            logger.info("SELENIUM: Configuring Chrome options...")
-            # Configure Chrome options - try without headless first
-            chrome_options = Options()
-            
-            # Only use headless if environment variable is set
-            use_headless = os.getenv('USE_HEADLESS', 'true').lower() == 'true'
-            if use_headless:
-                logger.info("SELENIUM: Using headless mode")
-                chrome_options.add_argument('--headless=new')
-            else:
-                logger.info("SELENIUM: Using visible browser mode")
-            
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Enable JavaScript
-            chrome_options.add_argument('--enable-javascript')
-            
-            # Add preferences to appear more like a real browser
-            prefs = {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0,
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            logger.info("SELENIUM: Initializing Chrome driver...")
-            # Initialize the driver
-            # Try with webdriver-manager first, fall back to system Chrome
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                logger.info("SELENIUM: ✓ Chrome driver initialized with webdriver-manager")
-            except Exception as e:
-                logger.warning(f"SELENIUM: WebDriver Manager failed ({e}), trying system Chrome...")
-                # Fall back to system Chrome (works if Chrome and ChromeDriver are in PATH)
-                driver = webdriver.Chrome(options=chrome_options)
-                logger.info("SELENIUM: ✓ Chrome driver initialized with system Chrome")
-            
-            # Execute stealth scripts to avoid detection
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            try:
-                # Load the quiz page
-                logger.info(f"SELENIUM: Loading quiz page: {url}")
-                driver.get(url)
-                logger.info("SELENIUM: ✓ Page loaded")
-                
-                # Wait for page to load
-                time.sleep(3)
-                
-                # Check if we need to login (look for login elements)
-                try:
-                    # Check if there's a login/signup button in header
-                    signin_button = driver.find_element(By.CSS_SELECTOR, ".signin-btn, .signup-btn")
-                    logger.info("SELENIUM: Not logged in, need to login...")
-                    
-                    # Get credentials
-                    email = os.getenv('LOGIN_EMAIL')
-                    password = os.getenv('LOGIN_PASSWORD')
-                    
-                    if not email or not password:
-                        raise ScraperError("LOGIN_EMAIL and LOGIN_PASSWORD must be set")
-                    
-                    # Click signin button to open login modal/page
-                    logger.info("SELENIUM: Clicking signin button...")
-                    driver.execute_script("arguments[0].click();", signin_button)
-                    time.sleep(2)
-                    
-                    # Fill login form (might be in modal or redirected page)
-                    logger.info("SELENIUM: Looking for login form...")
-                    email_input = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "emailId"))
-                    )
-                    password_input = driver.find_element(By.ID, "password")
-                    
-                    logger.info("SELENIUM: Filling login credentials...")
-                    email_input.clear()
-                    email_input.send_keys(email)
-                    password_input.clear()
-                    password_input.send_keys(password)
-                    
-                    # Click login button
-                    login_button = driver.find_element(By.CSS_SELECTOR, "button[onclick*='sign_in']")
-                    logger.info("SELENIUM: Clicking login button...")
-                    driver.execute_script("arguments[0].click();", login_button)
-                    
-                    # Wait for login
-                    time.sleep(3)
-                    
-                    # Navigate back to quiz if we were redirected
-                    if driver.current_url != url:
-                        logger.info(f"SELENIUM: Navigating back to quiz: {url}")
-                        driver.get(url)
-                        time.sleep(2)
-                    
-                    logger.info("SELENIUM: ✓ Logged in successfully")
-                    
-                except Exception as e:
-                    logger.info(f"SELENIUM: Already logged in or login not needed: {e}")
-                
-                logger.info("SELENIUM: ✓ Quiz page ready")
-                
-                # Wait for page to load
-                logger.info("SELENIUM: Waiting 2 seconds for page to fully load...")
-                time.sleep(2)
-                
-                # Find and click the submit button
-                logger.info("SELENIUM: Looking for submit button (ID: submit-ans)...")
-                try:
-                    # Try to find submit button by ID
-                    logger.info("SELENIUM: Waiting for submit button to appear...")
-                    submit_button = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "submit-ans"))
-                    )
-                    logger.info("SELENIUM: ✓ Submit button found!")
-                    
-                    # Scroll to button
-                    logger.info("SELENIUM: Scrolling to submit button...")
-                    driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-                    time.sleep(1)
-                    
-                    # Click the button
-                    logger.info("SELENIUM: *** CLICKING SUBMIT BUTTON NOW ***")
-                    driver.execute_script("arguments[0].click();", submit_button)
-                    logger.info("SELENIUM: ✓ Submit button clicked!")
-                    
-                    # Wait a moment for any alerts or modals
-                    time.sleep(2)
-                    
-                    # Check for "already attempted" alert
-                    try:
-                        logger.info("SELENIUM: Checking for alerts...")
-                        alert = driver.switch_to.alert
-                        alert_text = alert.text
-                        logger.info(f"SELENIUM: Alert found: '{alert_text}'")
-                        
-                        if "already attempted" in alert_text.lower():
-                            logger.info("SELENIUM: Quiz already attempted - accepting alert...")
-                            alert.accept()
-                            logger.info("SELENIUM: ✓ Alert accepted")
-                            time.sleep(2)  # Wait for page to update after alert
-                    except Exception:
-                        logger.info("SELENIUM: No alert found (this is normal)")
-                    
-                    # Check for login modal
-                    try:
-                        login_modal = driver.find_element(By.ID, "myModal-score-card")
-                        if login_modal.is_displayed():
-                            logger.error("SELENIUM: ✗ Login modal appeared - cookies not working!")
-                            # Try to close modal and proceed anyway
-                            close_button = driver.find_element(By.CSS_SELECTOR, "#myModal-score-card .close")
-                            close_button.click()
-                            time.sleep(1)
-                    except Exception:
-                        logger.info("SELENIUM: No login modal (good!)")
-                    
-                    # Wait for solutions to appear
-                    logger.info("SELENIUM: Waiting for solution-sec divs to appear...")
-                    WebDriverWait(driver, 15).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "solution-sec"))
-                    )
-                    logger.info("SELENIUM: ✓ solution-sec divs found")
-                    
-                    # CRITICAL: Wait for the head div text to change from "Solution:" to "Correct Answer:"
-                    logger.info("SELENIUM: Waiting for head div to update (30 seconds timeout)...")
-                    try:
-                        WebDriverWait(driver, 30).until(
-                            lambda d: any(
-                                "Correct Answer:" in head.text or "सही उत्तर:" in head.text
-                                for head in d.find_elements(By.CSS_SELECTOR, ".solution-sec .head")
-                                if head.text.strip() and head.text.strip() != "Solution:"
-                            )
-                        )
-                        logger.info("SELENIUM: ✓ Head div updated with 'Correct Answer:' text!")
-                    except TimeoutException:
-                        logger.error("SELENIUM: ✗ TIMEOUT - Head div never updated!")
-                        # Check what we have
-                        heads = driver.find_elements(By.CSS_SELECTOR, ".solution-sec .head")
-                        if heads:
-                            logger.error(f"SELENIUM: Found {len(heads)} head divs")
-                            for i, head in enumerate(heads[:3]):
-                                logger.error(f"SELENIUM: Head {i+1}: '{head.text[:100]}'")
-                        
-                        # Try waiting longer
-                        logger.info("SELENIUM: Waiting additional 10 seconds...")
-                        time.sleep(10)
-                        
-                        # Check again
-                        heads = driver.find_elements(By.CSS_SELECTOR, ".solution-sec .head")
-                        if heads and heads[0].text.strip():
-                            logger.info(f"SELENIUM: After extra wait, head div: '{heads[0].text[:100]}'")
-                    
-                    # Wait for ans-text div to have content
-                    logger.info("SELENIUM: Waiting for explanation content...")
-                    try:
-                        WebDriverWait(driver, 20).until(
-                            lambda d: any(
-                                len(ans_text.find_elements(By.TAG_NAME, "li")) > 0 or
-                                len(ans_text.find_elements(By.TAG_NAME, "p")) > 0
-                                for ans_text in d.find_elements(By.CLASS_NAME, "ans-text")
-                            )
-                        )
-                        logger.info("SELENIUM: ✓ Explanation content detected")
-                    except TimeoutException:
-                        logger.warning("SELENIUM: Timeout waiting for explanation content")
-                    
-                    # Give it final time to render
-                    logger.info("SELENIUM: Final 5 second wait for complete render...")
-                    time.sleep(5)
-                    
-                    # Get the page source with solutions
-                    html = driver.page_source
-                    
-                    # Verify solutions are present and have content
-                    soup = BeautifulSoup(html, 'html.parser')
-                    solution_sections = soup.find_all('div', class_='solution-sec')
-                    
-                    if solution_sections:
-                        print(f"✓ Solutions revealed! Found {len(solution_sections)} solution sections")
-                        
-                        # Debug: Check first solution section
-                        first_solution = solution_sections[0]
-                        head_div = first_solution.find('div', class_='head')
-                        ans_text_div = first_solution.find('div', class_='ans-text')
-                        
-                        if head_div:
-                            print(f"  First head div: '{head_div.get_text(strip=True)[:80]}'")
-                        if ans_text_div:
-                            ans_text_content = ans_text_div.get_text(strip=True)
-                            print(f"  First ans-text length: {len(ans_text_content)} chars")
-                            if len(ans_text_content) > 0:
-                                print(f"  First ans-text preview: '{ans_text_content[:80]}'")
-                        
-                        # Save HTML for debugging
-                        try:
-                            with open('debug_scraped_quiz.html', 'w', encoding='utf-8') as f:
-                                f.write(html)
-                            print("  Debug: Saved scraped HTML to debug_scraped_quiz.html")
-                        except Exception as e:
-                            print(f"  Warning: Could not save debug HTML: {e}")
-                        
-                        return html
-                    else:
-                        print("Warning: Submit clicked but no solutions found")
-                        return html
-                        
-                except TimeoutException:
-                    print("Warning: Submit button not found or timeout waiting for solutions")
-                    # Return current page HTML anyway
-                    return driver.page_source
-                    
-            finally:
-                # Always close the driver
-                driver.quit()
-                
-        except ImportError:
-            raise ScraperError(
-                "Selenium is required for quiz submission. Install with: pip install selenium"
-            )
-        except Exception as e:
-            raise ScraperError(f"Error during Selenium quiz submission: {str(e)}")
+        count = self.tier_stats.counts().get('archive', 0)
+        logging.getLogger(__name__).info(f"Replayed {count} quizzes from the HTML archive")
     
-
+    def log_http_cache_stats(self) -> None:
+        """Replay makes no HTTP requests"""
+        pass
+    
+    def log_rate_stats(self) -> None:
+        """Replay makes no HTTP requests"""
+        pass
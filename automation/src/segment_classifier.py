@@ -0,0 +1,152 @@
+"""
+Pre-classifier for quiz segments that need no translation.
+Options such as "2024", "10.5%", "ISRO" or "₹1,500 crore" come back from the
+translation service unchanged (or worse), so the Translator resolves them
+locally: numeric/symbolic lines and acronyms are kept as they are, and
+amounts whose only words are known units go through a small glossary.
+Lines made up of proper nouns only (names of people and places) can be kept
+in English as well; that is opt-in because the check is a heuristic.
+"""
+
+import os
+import re
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Any Unicode letter
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+# ISRO, G20, UNESCO, AI-ML, R&D, U.S. (a lone capital such as "A" or "I" is not one)
+ACRONYM_PATTERN = re.compile(
+    r'^(?:[A-Z][A-Z0-9]+(?:[&/.\-][A-Z0-9]+)*\.?|[A-Z](?:[&/.\-][A-Z0-9]+)+\.?|(?:[A-Z]\.){2,})$'
+)
+
+# Narendra, O'Brien, Jammu-Kashmir
+NAME_PATTERN = re.compile(r"^[A-Z][a-z]+(?:['\-][A-Za-z]+)*\.?$")
+
+# Punctuation around a token: "(ISRO)", "crore,"
+TOKEN_EDGES = '()[]{}"\'“”‘’,;:'
+
+# Unit and currency words rendered with their usual Gujarati form
+UNIT_GLOSSARY: Dict[str, str] = {
+    'crore': 'કરોડ',
+    'crores': 'કરોડ',
+    'cr': 'કરોડ',
+    'lakh': 'લાખ',
+    'lakhs': 'લાખ',
+    'million': 'મિલિયન',
+    'billion': 'બિલિયન',
+    'trillion': 'ટ્રિલિયન',
+    'percent': 'ટકા',
+    'rs': 'રૂ',
+    'km': 'કિમી',
+}
+
+# Capitalized words that start ordinary answer phrases, not names
+NOT_NAMES = {
+    'None', 'All', 'Both', 'Neither', 'Either', 'Only', 'The', 'A', 'An', 'Which', 'What', 'Who',
+    'Where', 'When', 'How', 'Why', 'Yes', 'No', 'True', 'False', 'Above', 'Below', 'Other', 'Others',
+}
+
+# Words of ordinary answer phrases written in capitals ("NONE OF THE ABOVE");
+# "who" is left out so WHO (World Health Organization) stays an acronym
+COMMON_WORDS = {
+    'all', 'and', 'any', 'are', 'both', 'but', 'can', 'for', 'has', 'have', 'its', 'more', 'none',
+    'not', 'nor', 'of', 'one', 'only', 'or', 'than', 'that', 'the', 'these', 'this', 'those', 'two',
+    'was', 'were', 'with', 'above', 'below', 'either', 'neither', 'other', 'others', 'true', 'false',
+    'yes', 'no', 'to', 'in', 'on', 'is', 'at', 'by', 'as', 'an', 'be', 'from', 'which', 'what',
+}
+
+# Longest acronym-only line kept as it is
+MAX_ACRONYM_WORDS = 3
+
+# Longest proper-noun-only line kept in English
+MAX_NAME_WORDS = 4
+
+
+def is_acronym(word: str) -> bool:
+    """Whether a token is an acronym rather than a capitalized English word"""
+    return bool(ACRONYM_PATTERN.match(word)) and word.lower().rstrip('.') not in COMMON_WORDS
+
+
+class SegmentClassifier:
+    """Decides which single lines can be rendered without a translation request"""
+
+    def __init__(self, skip_proper_nouns: Optional[bool] = None):
+        """
+        Args:
+            skip_proper_nouns: Keep lines of capitalized names in English (defaults to
+                TRANSLATION_SKIP_PROPER_NOUNS env var, false)
+        """
+        if skip_proper_nouns is None:
+            skip_proper_nouns = os.getenv('TRANSLATION_SKIP_PROPER_NOUNS', 'false').lower() == 'true'
+        self.skip_proper_nouns = skip_proper_nouns
+        self._lock = threading.Lock()
+        # Lines resolved locally, per category
+        self.counts: Counter = Counter()
+
+    def classify(self, line: str) -> Optional[str]:
+        """
+        Category of a line that needs no translation
+
+        Args:
+            line: One stripped line of a segment
+
+        Returns:
+            'numeric', 'acronym', 'unit' or 'proper_noun', or None if the
+            line has to be translated
+        """
+        if not LETTER_PATTERN.search(line):
+            return 'numeric'
+
+        words = [token.strip(TOKEN_EDGES) for token in line.split()]
+        words = [word for word in words if LETTER_PATTERN.search(word)]
+
+        if len(words) <= MAX_ACRONYM_WORDS and all(is_acronym(word) for word in words):
+            return 'acronym'
+        units = [word.lower().rstrip('.') in UNIT_GLOSSARY for word in words]
+        if any(units) and all(unit or is_acronym(word) for unit, word in zip(units, words)):
+            return 'unit'
+        if (self.skip_proper_nouns and len(words) <= MAX_NAME_WORDS
+                and all(word not in NOT_NAMES and (NAME_PATTERN.match(word) or is_acronym(word))
+                        for word in words)):
+            return 'proper_noun'
+        return None
+
+    def resolve(self, line: str) -> Optional[str]:
+        """
+        Render a line locally if it needs no translation
+
+        Args:
+            line: One stripped line of a segment
+
+        Returns:
+            The line's Gujarati rendering, or None if it has to be translated
+        """
+        category = self.classify(line)
+        if category is None:
+            return None
+        with self._lock:
+            self.counts[category] += 1
+        if category == 'unit':
+            return ' '.join(self._unit(token) for token in line.split())
+        return line
+
+    @staticmethod
+    def _unit(token: str) -> str:
+        """Glossary form of a unit word, keeping surrounding punctuation"""
+        word = token.strip(TOKEN_EDGES).rstrip('.')
+        gujarati = UNIT_GLOSSARY.get(word.lower())
+        if gujarati is None:
+            return token
+        return token.replace(word, gujarati, 1)
+
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        with self._lock:
+            counts = dict(self.counts)
+        return ', '.join(f"{count} {category}" for category, count in sorted(counts.items())) or 'none'
@@ -1,9 +1,9 @@
 import os
 import logging
 import datetime
-from typing import Dict, List, Optional
-from supabase import create_client, Client
-from .parser import QuizData, QuizQuestion
+from typing import Any, Dict, Optional, Sequence
+from .parser import QuizQuestion
+from .lazy_imports import backend
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +17,11 @@ class SupabaseManager:
         
         if not self.url or not self.key:
             logger.warning("Supabase URL or Key missing. Database sync will be skipped.")
-            self.client: Optional[Client] = None
+            self.client: Optional[Any] = None
         else:
             try:
-                self.client = create_client(self.url, self.key)
+                # supabase pulls in a large dependency tree, so it is imported only when configured
+                self.client = backend('supabase').load().create_client(self.url, self.key)
                 logger.info("Supabase client initialized successfully.")
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
@@ -45,13 +46,13 @@ class SupabaseManager:
             logger.error(f"Error checking quiz existence: {e}")
             return False
 
-    def sync_quiz(self, quiz_data: QuizData, translated_questions: List[QuizQuestion], date_gujarati: str, quiz_date: Optional[datetime.date] = None) -> Optional[str]:
+    def sync_quiz(self, source_url: str, translated_questions: Sequence[QuizQuestion], date_gujarati: str, quiz_date: Optional[datetime.date] = None) -> Optional[str]:
         """
         Sync quiz and its questions to Supabase.
         
         Args:
-            quiz_data: Original quiz data (for source_url etc)
-            translated_questions: List of questions with Gujarati text
+            source_url: URL of the quiz page
+            translated_questions: Questions with Gujarati text
             date_gujarati: Formatted Gujarati date for display
             quiz_date: Specific date of the quiz
             
@@ -81,7 +82,7 @@ class SupabaseManager:
                 "slug": slug,
                 "date_str": date_gujarati,
                 "quiz_date": quiz_date.isoformat() if quiz_date else None,
-                "source_url": quiz_data.source_url
+                "source_url": source_url
             }
             
             quiz_res = self.client.table("quizzes").insert(quiz_payload).execute()
@@ -101,7 +102,7 @@ class SupabaseManager:
                     "quiz_id": quiz_id,
                     "q_index": q.question_number,
                     "text": q.question_text,
-                    "options": q.options,
+                    "options": dict(q.options),
                     "answer": q.correct_answer,
                     "explanation": q.explanation
                 })
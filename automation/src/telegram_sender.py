@@ -5,10 +5,10 @@ Telegram distribution service for sending PDF files to Telegram channel.
 import logging
 import os
 from typing import Optional
-from telegram import Bot
-from telegram.error import TelegramError
 import asyncio
 
+from .lazy_imports import backend
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,11 @@ class TelegramSender:
         
         self.bot_token = bot_token
         self.channel_username = channel_username
-        self.bot = Bot(token=bot_token)
+        
+        # python-telegram-bot is only imported once a sender is actually needed
+        telegram = backend('telegram').load()
+        self.bot = telegram.Bot(token=bot_token)
+        self.telegram_error = telegram.error.TelegramError
         
         logger.info(f"TelegramSender initialized for channel: {channel_username}")
     
@@ -69,7 +73,7 @@ class TelegramSender:
             logger.info("✓ Message sent successfully")
             return True
             
-        except TelegramError as e:
+        except self.telegram_error as e:
             logger.error(f"Telegram error sending message: {e}")
             return False
         except Exception as e:
@@ -155,7 +159,7 @@ class TelegramSender:
             logger.info(f"PDF sent successfully. Message ID: {message.message_id}")
             return True
             
-        except TelegramError as e:
+        except self.telegram_error as e:
             logger.error(f"Telegram API error: {str(e)}")
             logger.error(f"Error code: {e.__class__.__name__}")
             
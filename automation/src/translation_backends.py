@@ -0,0 +1,259 @@
+"""
+Translation service backends for the Translator.
+Each backend wraps one provider behind the same two calls: translate() for a
+single segment and translate_batch() for several segments sent in one
+request. deep_translator is the default provider. Google's gtx JSON endpoint
+(undocumented and unofficial, but callable over a pooled HTTP session) is
+opt-in, and the offline backend is a deterministic local stand-in for tests
+and benchmarks. The Translator fails over along the configured list when a
+backend is throttled or keeps failing.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import List, Optional, Protocol, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .lazy_imports import backend
+
+logger = logging.getLogger(__name__)
+
+# The unofficial gtx endpoint ('google') is only used when configured
+DEFAULT_BACKENDS = 'deep_translator'
+
+
+class TranslationThrottled(Exception):
+    """Raised when a service answers 429 Too Many Requests"""
+    pass
+
+
+class BatchSplitError(Exception):
+    """Raised when a batched response cannot be split back into its segments"""
+    pass
+
+
+class TranslationBackend(Protocol):
+    """Interface every translation backend implements"""
+
+    # Registry name
+    name: str
+    # Longest text (or newline-joined batch) accepted in one request
+    max_chars: int
+    # Rate controller key; None for backends that need no rate limiting
+    service_url: Optional[str]
+    # Whether results may be kept in the persistent translation memory
+    persistent: bool
+
+    def translate(self, text: str) -> str:
+        """Translate one segment with one request"""
+        ...
+
+    def translate_batch(self, texts: Sequence[str]) -> List[str]:
+        """
+        Translate single-line segments that fit in max_chars together with one request
+
+        Raises:
+            BatchSplitError: If the response does not have one line per segment
+        """
+        ...
+
+
+def split_batch(result: str, count: int) -> List[str]:
+    """
+    Split a newline-joined translation back into its segments
+
+    Raises:
+        BatchSplitError: If the line count differs or a line came back empty
+    """
+    lines = [line.strip() for line in result.split('\n')]
+    if len(lines) != count or not all(lines):
+        raise BatchSplitError(f"response has {len(lines)} lines for {count} segments")
+    return lines
+
+
+class GoogleBackend:
+    """
+    Google Translate's gtx JSON endpoint over a pooled keep-alive session
+
+    The endpoint is undocumented and unofficial, so it may change or be
+    blocked without notice; enable it explicitly, e.g.
+    TRANSLATION_BACKENDS=google,deep_translator.
+    """
+
+    name = 'google'
+    max_chars = 5000
+    service_url = 'https://translate.googleapis.com'
+    persistent = True
+
+    ENDPOINT = 'https://translate.googleapis.com/translate_a/single'
+
+    def __init__(self, source_lang: str, target_lang: str, pool_size: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            pool_size: Kept-alive connections (defaults to TRANSLATION_WORKERS env var, 4)
+            timeout: Request timeout in seconds (defaults to TRANSLATION_TIMEOUT env var, 15)
+        """
+        if pool_size is None:
+            pool_size = int(os.getenv('TRANSLATION_WORKERS', '4'))
+        if timeout is None:
+            timeout = float(os.getenv('TRANSLATION_TIMEOUT', '15'))
+
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.timeout = timeout
+
+        # One connection per worker thread, reused across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount('https://', adapter)
+
+    def translate(self, text: str) -> str:
+        # POST keeps long segments out of the URL
+        response = self.session.post(
+            self.ENDPOINT,
+            params={'client': 'gtx', 'sl': self.source_lang, 'tl': self.target_lang, 'dt': 't'},
+            data={'q': text},
+            timeout=self.timeout
+        )
+        if response.status_code == 429:
+            raise TranslationThrottled(f"{self.name}: 429 Too Many Requests")
+        response.raise_for_status()
+
+        # [[["translated sentence", "source sentence", ...], ...], ...]
+        sentences = response.json()[0] or []
+        return ''.join(sentence[0] for sentence in sentences if sentence and sentence[0])
+
+    def translate_batch(self, texts: Sequence[str]) -> List[str]:
+        return split_batch(self.translate('\n'.join(texts)), len(texts))
+
+
+class DeepTranslatorBackend:
+    """
+    deep_translator's GoogleTranslator (Google's mobile web page)
+
+    deep_translator opens its own connections, so this backend cannot share a
+    session; clients keep the request text in instance state and are
+    therefore created per thread.
+    """
+
+    name = 'deep_translator'
+    max_chars = 5000
+    service_url = 'https://translate.google.com'
+    persistent = True
+
+    def __init__(self, source_lang: str, target_lang: str):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self._local = threading.local()
+
+    @property
+    def client(self):
+        """GoogleTranslator of the calling thread, created (and imported) on first use"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            GoogleTranslator = backend('deep_translator').load()
+            client = GoogleTranslator(source=self.source_lang, target=self.target_lang)
+            self._local.client = client
+        return client
+
+    def translate(self, text: str) -> str:
+        try:
+            return self.client.translate(text)
+        except Exception as e:
+            if type(e).__name__ == 'TooManyRequests':
+                raise TranslationThrottled(f"{self.name}: {e}") from e
+            raise
+
+    def translate_batch(self, texts: Sequence[str]) -> List[str]:
+        return split_batch(self.translate('\n'.join(texts)), len(texts))
+
+
+class OfflineBackend:
+    """
+    Deterministic local stand-in: no network, same output for the same input
+
+    Latin letters are mapped onto Gujarati letters so downstream stages (PDF
+    fonts, Telegram formatting) see Gujarati script; digits, punctuation and
+    line structure are kept. An optional fixed latency per request simulates
+    a remote service in throughput benchmarks.
+    """
+
+    name = 'offline'
+    max_chars = 5000
+    service_url = None
+    persistent = False
+
+    # a-z and A-Z onto one Gujarati letter each
+    LETTERS = str.maketrans(
+        'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+        'અબકદએફગહઇજખલમનઓપઘરસતઉવશછયઝ' * 2
+    )
+
+    def __init__(self, source_lang: str, target_lang: str, latency: Optional[float] = None):
+        """
+        Args:
+            source_lang: Source language code (unused)
+            target_lang: Target language code (unused)
+            latency: Seconds each request takes (defaults to
+                OFFLINE_TRANSLATION_LATENCY env var, 0)
+        """
+        if latency is None:
+            latency = float(os.getenv('OFFLINE_TRANSLATION_LATENCY', '0'))
+        self.latency = latency
+
+    def translate(self, text: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return text.translate(self.LETTERS)
+
+    def translate_batch(self, texts: Sequence[str]) -> List[str]:
+        return split_batch(self.translate('\n'.join(texts)), len(texts))
+
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    DeepTranslatorBackend.name: DeepTranslatorBackend,
+    OfflineBackend.name: OfflineBackend,
+}
+
+
+def get_backends(names: Optional[str] = None, source_lang: str = 'en',
+                 target_lang: str = 'gu') -> List[TranslationBackend]:
+    """
+    Create translation backends in failover order
+
+    Args:
+        names: Comma-separated backend names; defaults to the TRANSLATION_BACKEND
+            env var (one backend) or else the TRANSLATION_BACKENDS env var
+            (deep_translator)
+        source_lang: Source language code
+        target_lang: Target language code
+
+    Returns:
+        Backend instances, preferred first
+
+    Raises:
+        ValueError: If a name is unknown or none is given
+    """
+    if names is None:
+        names = os.getenv('TRANSLATION_BACKEND') or os.getenv('TRANSLATION_BACKENDS', DEFAULT_BACKENDS)
+
+    backends = []
+    for name in (part.strip().lower() for part in names.split(',')):
+        if not name:
+            continue
+        backend_class = BACKENDS.get(name)
+        if backend_class is None:
+            raise ValueError(f"Unknown translation backend '{name}' (expected one of: {', '.join(BACKENDS)})")
+        backends.append(backend_class(source_lang, target_lang))
+
+    if not backends:
+        raise ValueError("No translation backend configured")
+    return backends
@@ -0,0 +1,215 @@
+"""
+Persistent translation memory for the Translator.
+Stores every translated line in SQLite under its normalized source text and
+language pair, so country names, ministries and recurring explanation
+sentences are translated once and then served locally by every run of the
+runner and the offline bulk scraper. The least recently used entries are
+evicted once the memory holds more than its configured number of entries.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import logging
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Stay well under SQLite's limit on bound parameters per statement
+LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (source_lang, target_lang, source_key)
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+
+def normalize(text: str) -> str:
+    """
+    Memory key of a source string
+
+    Unicode is NFC-normalized and whitespace is collapsed, so the same
+    sentence scraped with different spacing maps to one entry. Case is kept:
+    it changes how proper nouns are translated.
+    """
+    return WHITESPACE_PATTERN.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class TranslationMemory:
+    """SQLite store of translations keyed by normalized source text and language pair"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Initialize the memory (the database is created on first use)
+
+        Args:
+            path: Database file (defaults to TRANSLATION_MEMORY_PATH env var,
+                data/translation_memory.sqlite3)
+            max_entries: Entries kept before LRU eviction (defaults to
+                TRANSLATION_MEMORY_MAX_ENTRIES env var, 200000)
+        """
+        if path is None:
+            path = os.getenv('TRANSLATION_MEMORY_PATH', 'data/translation_memory.sqlite3')
+        if max_entries is None:
+            max_entries = int(os.getenv('TRANSLATION_MEMORY_MAX_ENTRIES', '200000'))
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._entries: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database once (lock held)"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by the translator's threads; every use holds self._lock
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection.executescript(SCHEMA)
+            self._entries = self._connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        return self._connection
+
+    def get_many(self, texts: Iterable[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """
+        Look up translations
+
+        Args:
+            texts: Source strings
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Mapping of each remembered source string to its translation
+        """
+        keys: Dict[str, List[str]] = {}
+        for text in texts:
+            keys.setdefault(normalize(text), []).append(text)
+        if not keys:
+            return {}
+
+        found: Dict[str, str] = {}
+        try:
+            with self._lock:
+                connection = self._connect()
+                key_list = list(keys)
+                for start in range(0, len(key_list), LOOKUP_CHUNK):
+                    chunk = key_list[start:start + LOOKUP_CHUNK]
+                    placeholders = ', '.join('?' * len(chunk))
+                    rows = connection.execute(
+                        f"SELECT source_key, translation FROM translations "
+                        f"WHERE source_lang = ? AND target_lang = ? AND source_key IN ({placeholders})",
+                        [source_lang, target_lang, *chunk]
+                    ).fetchall()
+                    for key, translation in rows:
+                        found[key] = translation
+
+                # Touch hits so eviction removes the least recently used first
+                if found:
+                    now = time.time()
+                    with connection:
+                        connection.executemany(
+                            "UPDATE translations SET last_used = ? "
+                            "WHERE source_lang = ? AND target_lang = ? AND source_key = ?",
+                            [(now, source_lang, target_lang, key) for key in found]
+                        )
+        except sqlite3.Error as e:
+            logger.warning(f"TRANSLATION MEMORY: Lookup failed, translating everything: {e}")
+            found = {}
+
+        result = {}
+        for key, originals in keys.items():
+            if key in found:
+                for text in originals:
+                    result[text] = found[key]
+        with self._lock:
+            self.hits += len(result)
+            self.misses += sum(len(originals) for key, originals in keys.items() if key not in found)
+        return result
+
+    def put_many(self, translations: Dict[str, str], source_lang: str, target_lang: str) -> None:
+        """
+        Remember translations
+
+        Args:
+            translations: Mapping of source strings to their translations
+            source_lang: Source language code
+            target_lang: Target language code
+        """
+        # A translation identical to its source is usually a failed request
+        rows = {
+            normalize(source): translation
+            for source, translation in translations.items()
+            if translation and normalize(translation) != normalize(source)
+        }
+        if not rows:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    before = connection.total_changes
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO translations "
+                        "(source_lang, target_lang, source_key, translation, last_used) VALUES (?, ?, ?, ?, ?)",
+                        [(source_lang, target_lang, key, translation, now) for key, translation in rows.items()]
+                    )
+                    self.stored += connection.total_changes - before
+                self._entries = connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+                self._evict(connection)
+        except sqlite3.Error as e:
+            logger.warning(f"TRANSLATION MEMORY: Could not store {len(rows)} translations: {e}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until at most max_entries remain (lock held)"""
+        excess = self._entries - self.max_entries
+        if excess <= 0:
+            return
+        with connection:
+            connection.execute(
+                "DELETE FROM translations WHERE rowid IN "
+                "(SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+        self._entries -= excess
+        self.evictions += excess
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def summary(self) -> str:
+        """Human-readable statistics"""
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        return (
+            f"{self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate), "
+            f"{self.stored} stored, {self.evictions} evicted"
+        )
+
+    def log_summary(self) -> None:
+        """Log statistics if the memory was used"""
+        if self.hits or self.misses:
+            logger.info(f"TRANSLATION MEMORY: {self.summary()}")
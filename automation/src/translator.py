@@ -2,42 +2,109 @@
 Translation service for converting quiz content from English to Gujarati.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+import os
+import math
+import queue
 import logging
+import threading
 import time
-from deep_translator import GoogleTranslator
 
 # Import the dataclasses from parser
-from .parser import QuizQuestion, QuizData
+from .parser import QuizQuestion, QuizData, QuizOptions
+from .translation_memory import TranslationMemory
+from .segment_classifier import SegmentClassifier
+from .translation_backends import BatchSplitError, TranslationBackend, TranslationThrottled, get_backends
+from .rate_limiter import RateController, RequestTicket
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Marks the end of a streamed question sequence
+_END_OF_STREAM = object()
 
-@dataclass
+# Google rejects requests over 5000 characters
+DEFAULT_BATCH_CHARS = 4500
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True, slots=True)
 class TranslatedQuizData:
     """Represents quiz data with translated content."""
     source_url: str
-    questions: List[QuizQuestion]  # Contains translated text
+    questions: Tuple[QuizQuestion, ...]  # Contains translated text; lists are converted
     extracted_date: str
+    
+    def __post_init__(self):
+        if not isinstance(self.questions, tuple):
+            object.__setattr__(self, 'questions', tuple(self.questions))
 
 
 class Translator:
     """Handles translation of quiz content from English to Gujarati."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None,
+                 backends: Union[None, str, Sequence[TranslationBackend]] = None):
         """
         Initialize the translator.
         
         Args:
             api_key: Optional API key for translation service (not needed for Google Translate)
+            backends: Backend instances or comma-separated names in failover order
+                (defaults to the TRANSLATION_BACKEND / TRANSLATION_BACKENDS env vars,
+                deep_translator)
         """
-        self.translator = GoogleTranslator(source='en', target='gu')
         self.source_lang = 'en'
         self.target_lang = 'gu'  # Gujarati
         self.api_key = api_key
         
+        if backends is None or isinstance(backends, str):
+            backends = get_backends(backends, self.source_lang, self.target_lang)
+        self.backends: List[TranslationBackend] = list(backends)
+        # Index of the backend in use; moves down the list on failover
+        self._active = 0
+        
+        # Segments are packed into requests of up to this many characters (0 disables batching)
+        self.batch_chars = min(
+            int(os.getenv('TRANSLATION_BATCH_CHARS', str(DEFAULT_BATCH_CHARS))),
+            min(service.max_chars for service in self.backends)
+        )
+        
+        # Translations already fetched by earlier runs (shared by the runner and the bulk scraper);
+        # stand-in backends must not fill it
+        if (os.getenv('TRANSLATION_MEMORY', 'true').lower() == 'true'
+                and all(service.persistent for service in self.backends)):
+            self.memory: Optional[TranslationMemory] = TranslationMemory()
+        else:
+            self.memory = None
+        
+        # Batches are translated in parallel under one adaptive requests/second budget
+        self.workers = max(1, int(os.getenv('TRANSLATION_WORKERS', '4')))
+        self.rate_controller = RateController(
+            rate=float(os.getenv('TRANSLATION_RATE', '3')),
+            max_rate=float(os.getenv('TRANSLATION_MAX_RATE', '8')),
+            max_concurrency=self.workers,
+            concurrency=self.workers,
+            latency_target=float(os.getenv('TRANSLATION_LATENCY_TARGET', '10'))
+        )
+        
+        # Statistics for log_summary()
+        self._stats_lock = threading.Lock()
+        self.segments_translated = 0
+        self.requests_made = 0
+        self.batch_fallbacks = 0
+        self.segment_latencies: List[float] = []
+        # Lines resolved locally instead of by a translation request
+        self.calls_avoided = 0
+        
+        # Numbers, acronyms and unit amounts are not sent to the service
+        self.classifier = SegmentClassifier()
+        
         # Items that should not be translated
         self.preserve_items = {
             'CurrentAdda',
@@ -65,21 +132,9 @@ class Translator:
         """
         logger.info(f"Starting translation of {len(quiz_data.questions)} questions")
         
-        translated_questions = []
-        
-        for question in quiz_data.questions:
-            try:
-                translated_question = self._translate_question(question)
-                translated_questions.append(translated_question)
-                logger.info(f"Translated question {question.question_number}")
-                
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error translating question {question.question_number}: {str(e)}")
-                # Re-raise to handle at higher level
-                raise
+        avoided_before = self.calls_avoided
+        translated_questions = self._translate_questions(quiz_data.questions)
+        self._log_calls_avoided(self.calls_avoided - avoided_before)
         
         return TranslatedQuizData(
             source_url=quiz_data.source_url,
@@ -87,6 +142,179 @@ class Translator:
             extracted_date=quiz_data.extracted_date
         )
     
+    def translate_stream(self, questions: Iterable[QuizQuestion], source_url: str,
+                         extracted_date: Optional[str] = None,
+                         buffer_size: Optional[int] = None) -> TranslatedQuizData:
+        """
+        Translate questions while they are still being produced.
+        
+        Args:
+            questions: Question iterable, typically QuizParser.iter_questions()
+            source_url: Source URL of the quiz
+            extracted_date: Extraction timestamp (defaults to now)
+            buffer_size: Parsed questions buffered ahead of translation
+                (defaults to TRANSLATION_STREAM_BUFFER env var, 4)
+            
+        Returns:
+            TranslatedQuizData with Gujarati text, in input order
+            
+        Raises:
+            Exception: If producing or translating a question fails
+        """
+        if extracted_date is None:
+            extracted_date = datetime.now().isoformat()
+        
+        avoided_before = self.calls_avoided
+        translated_questions = list(self.iter_translated(questions, buffer_size))
+        self._log_calls_avoided(self.calls_avoided - avoided_before)
+        
+        return TranslatedQuizData(
+            source_url=source_url,
+            questions=translated_questions,
+            extracted_date=extracted_date
+        )
+    
+    def iter_translated(self, questions: Iterable[QuizQuestion],
+                        buffer_size: Optional[int] = None,
+                        flush_chars: Optional[int] = None) -> Iterator[QuizQuestion]:
+        """
+        Yield translated questions, pulling input from a producer thread.
+        
+        The producer iterates questions (e.g. a parser generator) into a
+        bounded queue of buffer_size questions. The consumer collects them
+        until their text fills one request (flush_chars characters) or the
+        stream ends, and translates each collection while the parser goes
+        on with the rest. A queue bound alone would cap a collection at
+        buffer_size questions and send many half-empty requests. A larger
+        flush_chars (e.g. batch_chars times workers) keeps every worker
+        busy but holds back the first request for longer, up to the whole
+        quiz; flush_chars=0 translates whatever is queued as soon as the
+        translator is free. Errors raised by the producer are re-raised
+        here, in order.
+        
+        Args:
+            questions: Question iterable
+            buffer_size: Queue size (defaults to TRANSLATION_STREAM_BUFFER env var, 4)
+            flush_chars: Characters collected before translating (defaults to
+                TRANSLATION_STREAM_CHARS env var, batch_chars)
+            
+        Yields:
+            Translated QuizQuestion objects
+        """
+        if buffer_size is None:
+            buffer_size = int(os.getenv('TRANSLATION_STREAM_BUFFER', '4'))
+        if flush_chars is None:
+            flush_chars = int(os.getenv('TRANSLATION_STREAM_CHARS', str(self.batch_chars)))
+        
+        buffer: queue.Queue = queue.Queue(maxsize=max(1, buffer_size))
+        stop = threading.Event()
+        iterator = iter(questions)
+        
+        def put(item) -> bool:
+            """Block until there is room or the consumer has gone away"""
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for question in iterator:
+                    if not put((question, None)):
+                        return
+                put((_END_OF_STREAM, None))
+            except BaseException as e:
+                put((_END_OF_STREAM, e))
+            finally:
+                # Close an abandoned generator in the thread that ran it
+                close = getattr(iterator, 'close', None)
+                if close is not None:
+                    close()
+        
+        producer = threading.Thread(target=produce, name='translate-stream-producer', daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                # Collect up to flush_chars characters (without a budget, only what is ready)
+                batch = []
+                size = 0
+                item = buffer.get()
+                while item[0] is not _END_OF_STREAM:
+                    batch.append(item[0])
+                    size += self._question_chars(item[0])
+                    if 0 < flush_chars <= size:
+                        item = None
+                        break
+                    try:
+                        item = buffer.get() if flush_chars > 0 else buffer.get_nowait()
+                    except queue.Empty:
+                        item = None
+                        break
+                
+                if batch:
+                    yield from self._translate_questions(batch)
+                
+                if item is not None:
+                    if item[1] is not None:
+                        raise item[1]
+                    return
+        finally:
+            stop.set()
+            producer.join()
+    
+    @staticmethod
+    def _question_chars(question: QuizQuestion) -> int:
+        """Characters of a question's translatable text"""
+        return (len(question.question_text) + sum(len(option) for option in question.options.values())
+                + len(question.explanation or ''))
+    
+    def _translate_questions(self, questions: Sequence[QuizQuestion]) -> List[QuizQuestion]:
+        """
+        Translate questions with their segments batched into shared requests.
+        
+        Args:
+            questions: QuizQuestion objects with English content
+            
+        Returns:
+            QuizQuestion objects with Gujarati content, in input order
+        """
+        # Question text, options and explanation of every question, flattened
+        segments = []
+        for question in questions:
+            if not question.explanation:
+                logger.warning(f"Q{question.question_number}: No explanation to translate (empty)")
+            segments.append(question.question_text)
+            segments.extend(question.options.values())
+            segments.append(question.explanation)
+        
+        try:
+            translated = iter(self.translate_texts(segments))
+        except Exception as e:
+            numbers = ', '.join(str(question.question_number) for question in questions)
+            logger.error(f"Error translating question(s) {numbers}: {str(e)}")
+            # Re-raise to handle at higher level
+            raise
+        
+        translated_questions = []
+        for question in questions:
+            question_text = next(translated)
+            # Option labels (A, B, C, D) are kept
+            options = QuizOptions([(label, next(translated)) for label in question.options])
+            explanation = next(translated)
+            # Note: correct_answer is just a label (A, B, C, D), so no translation needed
+            translated_questions.append(question.replace(
+                question_text=question_text,
+                options=options,
+                explanation=explanation
+            ))  # correct_answer and question_number are kept
+            logger.info(f"Translated question {question.question_number}")
+        
+        return translated_questions
+    
     def _translate_question(self, question: QuizQuestion) -> QuizQuestion:
         """
         Translate a single question.
@@ -97,31 +325,130 @@ class Translator:
         Returns:
             QuizQuestion object with Gujarati content
         """
-        # Translate question text
-        translated_question_text = self._translate_text(question.question_text)
+        return self._translate_questions([question])[0]
+    
+    def translate_texts(self, texts: Sequence[str]) -> List[str]:
+        """
+        Translate many strings in as few requests as the size limit allows.
         
-        # Translate options (preserve labels A, B, C, D)
-        translated_options = {}
-        for label, text in question.options.items():
-            translated_text = self._translate_text(text)
-            translated_options[label] = translated_text
+        Strings are translated line by line: lines that need no translation
+        (numbers, acronyms, unit amounts) are rendered locally, each other
+        distinct line is looked up in the translation memory, the rest are
+        packed, newline-separated,
+        into requests of up to batch_chars characters, and the translated
+        lines are reassembled per string. Batches run on up to workers
+        threads under the shared rate controller. A batch whose response
+        does not have one non-empty line per input line is retranslated
+        line by line.
         
-        # Translate explanation
-        if question.explanation:
-            logger.debug(f"Q{question.question_number}: Translating explanation ({len(question.explanation)} chars)")
+        Args:
+            texts: Strings to translate (empty and preserved items are returned as-is)
+            
+        Returns:
+            Translated strings, in input order
+            
+        Raises:
+            Exception: If translation fails after retries
+        """
+        segment_lines = {
+            text: self._segment_lines(text)
+            for text in texts
+            if text and text.strip() and text not in self.preserve_items
+        }
+        with self._stats_lock:
+            self.segments_translated += len(segment_lines)
+        
+        # Translate each distinct line once
+        lines = list(dict.fromkeys(line for value in segment_lines.values() for line in value))
+        translations: Dict[str, str] = {}
+        for line in lines:
+            rendered = self.classifier.resolve(line)
+            if rendered is not None:
+                translations[line] = rendered
+        with self._stats_lock:
+            self.calls_avoided += len(translations)
+        
+        remaining = [line for line in lines if line not in translations]
+        if self.memory is not None and remaining:
+            translations.update(self.memory.get_many(remaining, self.source_lang, self.target_lang))
+        missing = [line for line in remaining if line not in translations]
+        
+        batches = self._pack_batches(missing)
+        if self.workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(batches)),
+                                    thread_name_prefix='translate') as executor:
+                results = list(executor.map(self._translate_batch, batches))
         else:
-            logger.warning(f"Q{question.question_number}: No explanation to translate (empty)")
-        translated_explanation = self._translate_text(question.explanation)
+            results = [self._translate_batch(batch) for batch in batches]
         
-        # Note: correct_answer is just a label (A, B, C, D), so no translation needed
+        for translated in results:
+            if self.memory is not None:
+                self.memory.put_many(translated, self.source_lang, self.target_lang)
+            translations.update(translated)
         
-        return QuizQuestion(
-            question_number=question.question_number,
-            question_text=translated_question_text,
-            options=translated_options,
-            correct_answer=question.correct_answer,  # Preserve label
-            explanation=translated_explanation
-        )
+        return [
+            '\n'.join(translations[line] for line in segment_lines[text]) if text in segment_lines else text
+            for text in texts
+        ]
+    
+    def _pack_batches(self, lines: List[str]) -> List[List[str]]:
+        """Group lines, in order, so each group joined by newlines fits in one request"""
+        batches: List[List[str]] = []
+        size = 0
+        for line in lines:
+            length = len(line) + 1
+            if not batches or self.batch_chars <= 0 or size + length > self.batch_chars:
+                batches.append([])
+                size = 0
+            batches[-1].append(line)
+            size += length
+        return batches
+    
+    @staticmethod
+    def _segment_lines(segment: str) -> List[str]:
+        """Non-blank lines of a segment, stripped (the unit of batching and of the memory)"""
+        return [line.strip() for line in segment.split('\n') if line.strip()]
+    
+    def _translate_batch(self, lines: List[str]) -> Dict[str, str]:
+        """
+        Translate one packed batch with a single request.
+        
+        Args:
+            lines: Lines that fit in one request
+            
+        Returns:
+            Mapping of each line to its translation
+        """
+        started = time.monotonic()
+        translations = self._translate_lines(lines)
+        # Every line of a batch becomes available when the batch completes
+        latency = time.monotonic() - started
+        with self._stats_lock:
+            self.segment_latencies.extend([latency] * len(lines))
+        return translations
+    
+    def _translate_lines(self, lines: List[str]) -> Dict[str, str]:
+        """Request a batch, falling back to one request per line if it comes back garbled"""
+        if len(lines) == 1:
+            return {lines[0]: self._translate_text(lines[0])}
+        
+        try:
+            received = self._call(lambda service: service.translate_batch(lines))
+            reason = "empty response"
+        except BatchSplitError as e:
+            received = None
+            reason = str(e)
+        
+        if not received:
+            logger.warning(
+                f"Batched translation of {len(lines)} lines could not be split back ({reason}), "
+                "translating them one by one"
+            )
+            with self._stats_lock:
+                self.batch_fallbacks += 1
+            return {line: self._translate_text(line) for line in lines}
+        
+        return dict(zip(lines, received))
     
     def _translate_text(self, text: str, max_retries: int = 3) -> str:
         """
@@ -144,28 +471,128 @@ class Translator:
         if text in self.preserve_items:
             return text
         
-        for attempt in range(max_retries):
-            try:
-                result = self.translator.translate(text)
+        result = self._call(lambda service: service.translate(text), max_retries)
+        if result:
+            return result
+        
+        # Every attempt came back empty: keep the original text
+        logger.warning(f"Empty translation result for text: {text[:50]}...")
+        logger.warning("Returning original text as fallback")
+        return text
+    
+    def _call(self, request: Callable[[TranslationBackend], T], max_retries: int = 3) -> Optional[T]:
+        """
+        Make one request on the active backend with retries and failover.
+        
+        Each attempt holds a rate controller slot of its backend, so requests
+        are paced across all workers and a failure slows every worker down.
+        A backend that is throttled, or fails max_retries times, is replaced
+        by the next configured backend for the rest of the run.
+        
+        Args:
+            request: Sends the request with the given backend
+            max_retries: Attempts per backend
+            
+        Returns:
+            The request's result, or None if every attempt returned an empty result
+            
+        Raises:
+            BatchSplitError: Passed through without retrying
+            Exception: If the last backend fails after all retries
+        """
+        while True:
+            with self._stats_lock:
+                position = self._active
+            service = self.backends[position]
+            has_fallback = position + 1 < len(self.backends)
+            failed = False
+            
+            for attempt in range(max_retries):
+                result = None
+                if service.service_url:
+                    slot = self.rate_controller.slot(service.service_url)
+                else:
+                    slot = nullcontext(RequestTicket(service.name, False))
+                
+                with slot as ticket:
+                    with self._stats_lock:
+                        self.requests_made += 1
+                    try:
+                        result = request(service)
+                        ticket.status = 200
+                    except BatchSplitError:
+                        ticket.status = 200
+                        raise
+                    except Exception as e:
+                        throttled = isinstance(e, TranslationThrottled)
+                        ticket.status = 429 if throttled else None
+                        last_error = e
+                        logger.warning(f"Translation attempt {attempt + 1} on {service.name} failed: {str(e)}")
+                        
+                        # Exponential backoff, shared: no worker uses this backend until it has passed
+                        wait_time = 2 ** attempt
+                        ticket.retry_after = wait_time
+                        if attempt < max_retries - 1 and not (throttled and has_fallback):
+                            logger.info(f"Retrying in {wait_time} seconds...")
+                            continue
+                        failed = True
+                        break
                 
                 if result:
                     return result
-                else:
-                    logger.warning(f"Empty translation result for text: {text[:50]}...")
-                    
-            except Exception as e:
-                logger.warning(f"Translation attempt {attempt + 1} failed: {str(e)}")
-                
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    # Final attempt failed
-                    logger.error(f"Translation failed after {max_retries} attempts")
-                    raise Exception(f"Failed to translate text after {max_retries} attempts: {str(e)}")
+            
+            if not failed:
+                return None
+            if not has_fallback:
+                # Final attempt failed
+                logger.error(f"Translation failed after {max_retries} attempts")
+                raise Exception(f"Failed to translate text after {max_retries} attempts: {str(last_error)}")
+            self._fail_over(position)
+    
+    def _fail_over(self, position: int) -> None:
+        """Switch every worker from the backend at position to the next one"""
+        with self._stats_lock:
+            if self._active != position:
+                return  # Another worker already failed over
+            self._active = position + 1
+        logger.warning(
+            f"TRANSLATION: {self.backends[position].name} is failing, "
+            f"switching to {self.backends[position + 1].name}"
+        )
+    
+    def _log_calls_avoided(self, count: int) -> None:
+        """Log the lines of one quiz that needed no translation request"""
+        if count:
+            logger.info(f"Skip classifier: {count} translation calls avoided for this quiz")
+    
+    def latency_summary(self) -> str:
+        """Per-segment latency of translated (not remembered) lines"""
+        with self._stats_lock:
+            latencies = sorted(self.segment_latencies)
+        if not latencies:
+            return "no segments requested"
         
-        # Should not reach here, but return original text as fallback
-        logger.warning("Returning original text as fallback")
-        return text
+        def percentile(fraction: float) -> float:
+            # Nearest rank
+            return latencies[max(0, math.ceil(len(latencies) * fraction) - 1)]
+        
+        return (
+            f"segment latency p50 {percentile(0.5):.2f}s, p95 {percentile(0.95):.2f}s, "
+            f"max {latencies[-1]:.2f}s over {len(latencies)} lines"
+        )
+    
+    def log_summary(self) -> None:
+        """Log request statistics if anything was translated"""
+        if self.segments_translated:
+            logger.info(
+                f"TRANSLATION: {self.segments_translated} segments in {self.requests_made} requests "
+                f"via {self.backends[self._active].name} "
+                f"({self.batch_fallbacks} batches retranslated line by line), {self.latency_summary()}"
+            )
+            logger.info(
+                f"TRANSLATION: {self.calls_avoided} calls avoided by the skip classifier "
+                f"({self.classifier.summary()})"
+            )
+            self.rate_controller.log_summary()
+        if self.memory is not None:
+            self.memory.log_summary()
@@ -28,7 +28,7 @@ scraper = QuizScraper(session)
 urls = scraper.get_quiz_urls()
 print(f"✓ Found {len(urls)} quizzes")
 
-# Fetch first quiz
+# Fetch first quiz (reuses the browser opened for the listing)
 if urls:
     url = urls[0]
     print(f"\nFetching: {url}")
@@ -77,3 +77,8 @@ if urls:
         if parent_options:
             print("\n=== First Option ===")
             print(parent_options[0].prettify()[:300])
+
+if scraper.http_cache:
+    print(f"\nHTTP cache: {scraper.http_cache.summary()}")
+
+scraper.close()
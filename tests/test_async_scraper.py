@@ -0,0 +1,217 @@
+"""
+Unit tests for the asyncio scraping engine.
+
+Tests cover:
+- HTTP fast path tried before the browser, which is launched lazily once
+- Concurrent pages bounded by the configured concurrency
+- Results returned in input order
+- One reveal deadline for the submit button and the solutions
+"""
+
+import unittest
+import asyncio
+import tempfile
+import shutil
+import time
+import os
+import sys
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.async_scraper import AsyncQuizScraper
+from src.debug_capture import DebugCapture
+
+
+def revealed_html(url):
+    return f'<html><div class="solution-sec"><div class="head">Correct Answer: Option B</div></div>{url}</html>'
+
+
+class FakeLocator:
+    """Locator of a FakePage (sign-in links are never shown)"""
+
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    async def count(self):
+        return 0
+
+    async def is_visible(self):
+        return False
+
+    async def wait_for(self, state, timeout):
+        self.page.timeouts.append(('submit', timeout))
+        await asyncio.sleep(self.page.button_delay)
+
+    async def scroll_into_view_if_needed(self):
+        pass
+
+    async def click(self):
+        self.page.revealed = True
+
+
+class FakePage:
+    """Async Playwright page that loads instantly or after a per-URL delay"""
+
+    def __init__(self, context):
+        self.context = context
+        self.url = 'about:blank'
+        self.revealed = context.revealed
+        self.button_delay = context.button_delay
+        self.timeouts = context.timeouts
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        await asyncio.sleep(self.context.delays.get(url, 0.01))
+        self.url = url
+        return Mock(status=200)
+
+    async def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+    def on(self, event, handler):
+        pass
+
+    async def evaluate(self, script, arg):
+        return self.revealed
+
+    async def wait_for_function(self, script, arg, polling, timeout):
+        self.timeouts.append(('reveal', timeout))
+        if not self.revealed:
+            raise TimeoutError("not revealed")
+
+    async def content(self):
+        return revealed_html(self.url)
+
+    async def close(self):
+        self.context.open_pages -= 1
+
+
+class FakeContext:
+    """Shared browser context that records how many pages are open at once"""
+
+    def __init__(self, delays=None, revealed=True, button_delay=0.0):
+        self.delays = delays or {}
+        self.revealed = revealed
+        self.button_delay = button_delay
+        self.timeouts = []
+        self.open_pages = 0
+        self.peak_pages = 0
+
+    async def new_page(self):
+        self.open_pages += 1
+        self.peak_pages = max(self.peak_pages, self.open_pages)
+        return FakePage(self)
+
+
+class FakeEngine(AsyncQuizScraper):
+    """AsyncQuizScraper whose browser launch installs a FakeContext"""
+
+    def __init__(self, context, events, **kwargs):
+        super().__init__(Mock(), **kwargs)
+        self.fake_context = context
+        self.events = events
+        self.launches = 0
+
+    async def _launch(self):
+        # Give concurrent fallbacks the chance to race for the launch
+        await asyncio.sleep(0.01)
+        self.launches += 1
+        self.events.append('launch')
+        self._context = self.fake_context
+
+    async def _reveal_in_browser(self, url):
+        self.events.append(f"browser:{url}")
+        return await super()._reveal_in_browser(url)
+
+
+class TestAsyncQuizScraper(unittest.TestCase):
+    """Test cases for AsyncQuizScraper."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def run_engine(self, urls, context, fast_hits=(), concurrency=5, handler=None, **kwargs):
+        events = []
+
+        def fast_path(url):
+            events.append(f"fast:{url}")
+            return revealed_html(url) if url in fast_hits else None
+
+        engine = FakeEngine(context, events, concurrency=concurrency, fast_path=fast_path,
+                            debug_capture=DebugCapture(directory=self.test_dir, enabled=False), **kwargs)
+
+        async def run():
+            async with engine:
+                return await engine.scrape_all(urls, handler)
+
+        return engine, events, asyncio.run(run())
+
+    def test_fast_path_first_and_lazy_launch(self):
+        """Test that the browser starts only for fast-path misses, once, after the fast path."""
+        urls = [f"https://pendulumedu.com/quiz/{n}" for n in range(4)]
+        engine, events, results = self.run_engine(urls, FakeContext(), fast_hits=set(urls))
+        self.assertEqual(engine.launches, 0)
+        self.assertEqual(set(results), set(urls))
+
+        engine, events, results = self.run_engine(urls, FakeContext(), fast_hits={urls[0], urls[2]})
+        self.assertEqual(engine.launches, 1)
+        for url in (urls[1], urls[3]):
+            self.assertLess(events.index(f"fast:{url}"), events.index(f"browser:{url}"))
+        self.assertNotIn(f"browser:{urls[0]}", events)
+        self.assertEqual(engine.tier_stats.counts().get('browser'), 2)
+
+    def test_concurrent_pages_bounded(self):
+        """Test that no more pages are open than the configured concurrency, and that many are."""
+        urls = [f"https://pendulumedu.com/quiz/{n}" for n in range(8)]
+        context = FakeContext(delays={url: 0.05 for url in urls})
+        engine, _, results = self.run_engine(urls, context, concurrency=3)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(context.peak_pages, 3)
+        self.assertEqual(context.open_pages, 0)
+        self.assertEqual(engine.launches, 1)
+
+    def test_results_in_input_order(self):
+        """Test that results follow the URL order even when later pages finish first."""
+        urls = [f"https://pendulumedu.com/quiz/{n}" for n in range(5)]
+        context = FakeContext(delays={url: 0.05 - 0.01 * n for n, url in enumerate(urls)})
+
+        def handler(url, html):
+            if url == urls[2]:
+                raise ValueError("No questions found")
+            return url.rsplit('/', 1)[1]
+
+        _, _, results = self.run_engine(urls, context, handler=handler)
+        self.assertEqual(list(results), [urls[0], urls[1], urls[3], urls[4]])
+        self.assertEqual(list(results.values()), ['0', '1', '3', '4'])
+
+    def test_reveal_shares_one_deadline(self):
+        """Test that the reveal wait only gets what the submit-button wait left over."""
+        url = "https://pendulumedu.com/quiz/0"
+        context = FakeContext(revealed=False, button_delay=0.3)
+        engine = FakeEngine(context, [], fast_path=lambda url: None,
+                            debug_capture=DebugCapture(directory=self.test_dir, enabled=False))
+        engine.reveal_timeout = 1
+
+        async def run():
+            async with engine:
+                return await engine.submit_quiz(url)
+
+        started = time.monotonic()
+        self.assertIn('Correct Answer', asyncio.run(run()))
+        self.assertLess(time.monotonic() - started, 1)
+
+        (_, submit_timeout), (_, reveal_timeout) = context.timeouts
+        self.assertLessEqual(submit_timeout, 1000)
+        self.assertLessEqual(reveal_timeout, 1000 - 300 + 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
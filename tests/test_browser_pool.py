@@ -0,0 +1,157 @@
+"""
+Unit tests for the persistent browser pool.
+
+Tests cover:
+- Page recycling up to max_page_uses
+- Pages discarded after a caller error
+- Disconnected browsers replaced
+- One browser per thread, closed by the thread that owns it
+- Session cookies converted for Playwright contexts
+"""
+
+import unittest
+import threading
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import requests
+from requests.cookies import create_cookie
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.browser_pool import BrowserPool, session_cookies_for_browser
+
+
+class FakePlaywright:
+    """sync_playwright() stand-in whose browsers hand out Mock pages"""
+
+    def __init__(self):
+        self.browsers = []
+
+    def __call__(self):
+        return self
+
+    def start(self):
+        playwright = Mock()
+        playwright.chromium.launch.side_effect = self.launch
+        return playwright
+
+    def launch(self, headless):
+        browser = Mock()
+        browser.is_connected.return_value = True
+        context = browser.new_context.return_value
+        context.new_page.side_effect = lambda: Mock(**{'is_closed.return_value': False})
+        self.browsers.append(browser)
+        return browser
+
+
+class TestBrowserPool(unittest.TestCase):
+    """Test cases for BrowserPool."""
+
+    def setUp(self):
+        self.playwright = FakePlaywright()
+        patches = [
+            patch('src.browser_pool.PLAYWRIGHT_AVAILABLE', True),
+            patch('src.browser_pool.backend', return_value=Mock(load=Mock(return_value=self.playwright))),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.pool = BrowserPool(headless=True, max_page_uses=2, storage_state_path=None,
+                                request_filter=Mock())
+
+    def test_pages_recycled_until_worn_out(self):
+        """Test that a page is reused and closed after max_page_uses."""
+        with self.pool.page() as first:
+            pass
+        with self.pool.page() as second:
+            pass
+        with self.pool.page() as third:
+            pass
+
+        self.assertIs(first, second)
+        self.assertIsNot(second, third)
+        first.goto.assert_called_once_with('about:blank')
+        first.close.assert_called_once()
+        self.assertEqual(self.pool.launch_count, 1)
+
+    def test_page_discarded_after_error(self):
+        """Test that a page whose caller raised is closed instead of recycled."""
+        with self.assertRaises(RuntimeError):
+            with self.pool.page() as broken:
+                raise RuntimeError("navigation failed")
+        with self.pool.page() as page:
+            pass
+
+        broken.close.assert_called_once()
+        self.assertIsNot(broken, page)
+
+    def test_disconnected_browser_replaced(self):
+        """Test that a crashed browser is closed and a new one launched."""
+        with self.pool.page():
+            pass
+        crashed = self.playwright.browsers[0]
+        crashed.is_connected.return_value = False
+
+        with self.pool.page():
+            pass
+
+        crashed.close.assert_called_once()
+        self.assertEqual(self.pool.launch_count, 2)
+        self.assertEqual(self.pool.open_browsers, 1)
+
+    def test_browser_per_thread_closed_by_owner(self):
+        """Test that each thread gets its own browser and close() only closes the caller's."""
+        worker_ready, main_closed = threading.Event(), threading.Event()
+
+        def worker():
+            with self.pool.page():
+                pass
+            worker_ready.set()
+            main_closed.wait(5)
+            self.pool.close()
+
+        with self.pool.page():
+            pass
+        thread = threading.Thread(target=worker)
+        thread.start()
+        worker_ready.wait(5)
+
+        self.assertEqual(self.pool.open_browsers, 2)
+        self.pool.close()
+        main_browser, worker_browser = self.playwright.browsers
+        main_browser.close.assert_called_once()
+        worker_browser.close.assert_not_called()
+        self.assertEqual(self.pool.open_browsers, 1)
+
+        main_closed.set()
+        thread.join(5)
+        worker_browser.close.assert_called_once()
+        self.assertEqual(self.pool.open_browsers, 0)
+
+
+class TestSessionCookies(unittest.TestCase):
+    """Test cases for session_cookies_for_browser."""
+
+    def test_conversion(self):
+        """Test domain, host-only, expiry and secure handling."""
+        session = requests.Session()
+        session.cookies.set_cookie(create_cookie('ci_session', 'abc', domain='.pendulumedu.com',
+                                                 path='/quiz', secure=True, expires=1893456000))
+        session.cookies.set_cookie(create_cookie('lang', 'en', domain=''))
+
+        cookies = {cookie['name']: cookie for cookie in session_cookies_for_browser(session)}
+
+        self.assertEqual(cookies['ci_session'], {
+            'name': 'ci_session', 'value': 'abc', 'domain': '.pendulumedu.com', 'path': '/quiz',
+            'expires': 1893456000.0, 'secure': True,
+        })
+        # Playwright needs a domain or a URL for every cookie
+        self.assertEqual(cookies['lang'], {'name': 'lang', 'value': 'en', 'url': 'https://pendulumedu.com'})
+        self.assertEqual(session_cookies_for_browser(requests.Session()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for failure-only debug capture.
+
+Tests cover:
+- Nothing is written for successful stages
+- Artifacts are written when a stage raises or is marked failed
+- The per-URL ring stays bounded
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+import json
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.debug_capture import DebugCapture
+
+
+URL = "https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz"
+
+
+class TestDebugCapture(unittest.TestCase):
+    """Test cases for DebugCapture."""
+
+    def setUp(self):
+        """Set up a capture ring in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.debug = DebugCapture(directory=self.tmpdir.name, enabled=False, trace=False,
+                                  max_per_url=2, max_urls=2)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def entries(self, url=URL):
+        url_dir = os.path.join(self.tmpdir.name, DebugCapture._url_key(url))
+        if not os.path.isdir(url_dir):
+            return []
+        return sorted(os.listdir(url_dir))
+
+    def test_success_writes_nothing_and_touches_no_page(self):
+        """Test that the successful path does not render or write anything."""
+        page = Mock()
+        with self.debug.capture(URL, 'playwright') as capture:
+            capture.attach_page(page)
+            capture.add_html('quiz', '<html></html>')
+
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+        page.content.assert_not_called()
+        page.screenshot.assert_not_called()
+
+    def test_exception_writes_artifacts(self):
+        """Test that a failing stage leaves HTML, screenshot and info behind."""
+        page = Mock()
+        page.content.return_value = '<html>live</html>'
+        page.screenshot.return_value = b'PNG'
+
+        with self.assertRaises(RuntimeError):
+            with self.debug.capture(URL, 'playwright') as capture:
+                capture.attach_page(page)
+                capture.add_html('quiz', '<html>parsed</html>')
+                raise RuntimeError("submit button not found")
+
+        [entry] = self.entries()
+        entry_dir = os.path.join(self.tmpdir.name, DebugCapture._url_key(URL), entry)
+        self.assertEqual(sorted(os.listdir(entry_dir)), ['info.json', 'page.html', 'quiz.html', 'screenshot.png'])
+        with open(os.path.join(entry_dir, 'info.json'), encoding='utf-8') as f:
+            info = json.load(f)
+        self.assertIn('submit button not found', info['failure'])
+
+    def test_mark_failed_writes_without_raising(self):
+        """Test that a stage can report failure without an exception."""
+        with self.debug.capture(URL, 'parse') as capture:
+            capture.add_html('quiz', '<html></html>')
+            capture.mark_failed("no answers")
+        self.assertEqual(len(self.entries()), 1)
+
+    def test_ring_is_bounded(self):
+        """Test that old captures per URL and old URLs are pruned."""
+        for _ in range(4):
+            with self.debug.capture(URL, 'parse') as capture:
+                capture.mark_failed("boom")
+        self.assertEqual(len(self.entries()), 2)
+
+        for index in range(3):
+            with self.debug.capture(f"{URL}-{index}", 'parse') as capture:
+                capture.mark_failed("boom")
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the HTML archive and replay scraper.
+
+Tests cover:
+- Storing and loading archived pages
+- Content de-duplication
+- Date ordering and filtering of archived URLs
+- Serving quizzes from the archive in replay mode
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.html_archive import HTMLArchive
+from src.scraper import ReplayScraper, ScraperError
+
+
+def quiz_url(day):
+    return f"https://pendulumedu.com/quiz/current-affairs/{day}-january-2025-current-affairs-quiz"
+
+
+class TestHTMLArchive(unittest.TestCase):
+    """Test cases for HTMLArchive."""
+
+    def setUp(self):
+        """Set up an archive in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.archive = HTMLArchive(directory=self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_put_and_get(self):
+        """Test that archived HTML round-trips, including non-ASCII text."""
+        html = '<div class="head">सही उत्तर: B</div>'
+        self.archive.put(quiz_url(1), html)
+
+        self.assertEqual(self.archive.get(quiz_url(1)), html)
+        self.assertIn(quiz_url(1), self.archive)
+        self.assertIsNone(self.archive.get(quiz_url(2)))
+
+    def test_identical_pages_share_one_object(self):
+        """Test that the same content is stored once."""
+        first = self.archive.put(quiz_url(1), '<html>same</html>')
+        second = self.archive.put(quiz_url(2), '<html>same</html>')
+
+        self.assertEqual(first, second)
+        objects = [f for _, _, files in os.walk(self.archive.objects_dir) for f in files]
+        self.assertEqual(len(objects), 1)
+
+    def test_index_survives_reload(self):
+        """Test that a new archive instance reads the saved index."""
+        self.archive.put(quiz_url(3), '<html>3</html>')
+
+        reopened = HTMLArchive(directory=self.tmpdir.name)
+        self.assertEqual(reopened.get(quiz_url(3)), '<html>3</html>')
+
+    def test_urls_newest_first_and_since(self):
+        """Test listing order and date filtering."""
+        for day in (5, 1, 20):
+            self.archive.put(quiz_url(day), f'<html>{day}</html>')
+
+        self.assertEqual(self.archive.urls(), [quiz_url(20), quiz_url(5), quiz_url(1)])
+        self.assertEqual(self.archive.urls(since=datetime(2025, 1, 5)), [quiz_url(20), quiz_url(5)])
+
+    def test_replay_scraper(self):
+        """Test that the replay scraper serves archived pages only."""
+        self.archive.put(quiz_url(1), '<html>1</html>')
+        scraper = ReplayScraper(self.archive)
+
+        self.assertEqual(scraper.submit_quiz(quiz_url(1)), '<html>1</html>')
+        with self.assertRaises(ScraperError):
+            scraper.submit_quiz(quiz_url(2))
+        self.assertEqual(scraper.tier_stats.counts(), {'archive': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the conditional-GET HTTP cache.
+
+Tests cover:
+- Storing validated responses and building conditional headers
+- Serving the cached body on 304 Not Modified
+- Size-based eviction
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.http_cache import HTTPCache, CachingHTTPAdapter
+
+
+URL = "https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz"
+
+
+def make_response(status, body=b'', headers=None):
+    """Build a requests.Response as HTTPAdapter.send would return it."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+class TestHTTPCache(unittest.TestCase):
+    """Test cases for HTTPCache and CachingHTTPAdapter."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = HTTPCache(directory=self.tmpdir.name, max_bytes=10 * 1024 * 1024)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_store_and_validators(self):
+        """Test that a stored entry yields conditional request headers."""
+        self.cache.store(URL, {'ETag': '"abc"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}, b'<html>quiz</html>')
+
+        self.assertEqual(self.cache.validators(URL), {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT',
+        })
+        meta, body = self.cache.get(URL)
+        self.assertEqual(body, b'<html>quiz</html>')
+
+    def test_response_without_validator_is_not_stored(self):
+        """Test that responses without ETag/Last-Modified are skipped."""
+        self.cache.store(URL, {'Content-Type': 'text/html'}, b'<html></html>')
+        self.assertIsNone(self.cache.get(URL))
+
+    def test_not_modified_serves_cached_body(self):
+        """Test that a 304 is turned into the cached 200 response."""
+        session = requests.Session()
+        session.mount("https://", CachingHTTPAdapter(self.cache))
+        responses = [
+            make_response(200, b'<html>v1</html>', {'ETag': '"v1"', 'Content-Type': 'text/html; charset=utf-8'}),
+            make_response(304, headers={'ETag': '"v1"'}),
+        ]
+
+        with patch.object(HTTPAdapter, 'send', side_effect=responses) as send:
+            first = session.get(URL)
+            second = session.get(URL)
+
+        self.assertEqual(first.text, '<html>v1</html>')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, '<html>v1</html>')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(send.call_args_list[1][0][0].headers['If-None-Match'], '"v1"')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_eviction_keeps_cache_under_limit(self):
+        """Test that the least recently used entries are evicted first."""
+        cache = HTTPCache(directory=self.tmpdir.name, max_bytes=3000)
+        body = os.urandom(1200)
+        for index in range(3):
+            url = f"{URL}?page={index}"
+            cache.store(url, {'ETag': f'"{index}"'}, body)
+            meta_path, _ = cache._paths(url)
+            os.utime(meta_path, (index, index))
+
+        self.assertIsNone(cache.get(f"{URL}?page=0"))
+        self.assertIsNotNone(cache.get(f"{URL}?page=2"))
+        self.assertGreaterEqual(cache.evictions, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
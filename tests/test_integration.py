@@ -5,6 +5,7 @@ Tests cover:
 - Complete pipeline with sample quiz URL
 - Handling of already-processed URLs
 - Error recovery scenarios
+- Translated quiz synced to Supabase
 """
 
 import unittest
@@ -20,6 +21,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.state_manager import StateManager
 from src.parser import QuizParser, QuizData, QuizQuestion
 from src.runner import process_quiz
+from src.translator import TranslatedQuizData
+from tests.test_parser_backends import question_block
 
 
 class TestIntegration(unittest.TestCase):
@@ -395,6 +398,67 @@ class TestIntegration(unittest.TestCase):
         self.assertFalse(state_manager.is_processed(quiz_urls[1]))
         self.assertTrue(state_manager.is_processed(quiz_urls[2]))
 
+    def test_supabase_sync_receives_translated_quiz(self):
+        """Test that the streamed, translated quiz is what gets synced to Supabase."""
+        state_manager = StateManager(tracking_file=self.test_tracking_file)
+        state_manager.load_processed_urls()
+
+        mock_scraper = Mock()
+        mock_scraper.submit_quiz.return_value = '<html><body>' + question_block(
+            "What is the capital of India?",
+            ["Mumbai", "New Delhi", "Kolkata", "Chennai"],
+            "Correct Answer: Option B",
+            "<p>New Delhi is the capital of India.</p>",
+        ) + '</body></html>'
+
+        def translate_stream(questions, source_url):
+            translated = [
+                QuizQuestion(
+                    question_number=q.question_number,
+                    question_text=f"gu:{q.question_text}",
+                    options={label: f"gu:{text}" for label, text in q.options.items()},
+                    correct_answer=q.correct_answer,
+                    explanation=f"gu:{q.explanation}",
+                )
+                for q in questions
+            ]
+            return TranslatedQuizData(source_url, translated, "2024-01-01T00:00:00")
+
+        mock_translator = Mock()
+        mock_translator.translate_stream.side_effect = translate_stream
+
+        mock_pdf_generator = Mock()
+        mock_pdf_generator.generate_pdf.return_value = os.path.join(self.test_pdf_dir, "test.pdf")
+        mock_telegram_sender = Mock()
+        mock_telegram_sender.send_pdf.return_value = True
+        mock_supabase_manager = Mock()
+        mock_supabase_manager.sync_quiz.return_value = "test-quiz"
+        mock_date_extractor = Mock()
+        mock_date_extractor.extract_date_from_url.return_value = None
+
+        with patch('time.sleep'):
+            success = process_quiz(
+                url=self.test_url,
+                scraper=mock_scraper,
+                parser=QuizParser(),
+                translator=mock_translator,
+                pdf_generator=mock_pdf_generator,
+                telegram_sender=mock_telegram_sender,
+                telegram_text_sender=None,
+                supabase_manager=mock_supabase_manager,
+                notification_sender=Mock(),
+                state_manager=state_manager,
+                date_extractor=mock_date_extractor
+            )
+
+        self.assertTrue(success)
+        mock_supabase_manager.sync_quiz.assert_called_once()
+        synced_url, synced_questions = mock_supabase_manager.sync_quiz.call_args.args[:2]
+        self.assertEqual(synced_url, self.test_url)
+        self.assertEqual(synced_questions[0].question_text, "gu:What is the capital of India?")
+        self.assertEqual(synced_questions[0].options['B'], "gu:New Delhi")
+        self.assertTrue(state_manager.is_processed(self.test_url))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+"""
+Unit tests for lazy backend loading.
+
+Tests cover:
+- Deferred import and caching of a backend
+- Missing backends reported with an install hint
+- The startup import report
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import lazy_imports
+from src.lazy_imports import LazyBackend, import_timer, import_report
+
+
+class TestLazyBackend(unittest.TestCase):
+    """Test cases for LazyBackend."""
+
+    def test_loads_once_on_first_use(self):
+        """Test that nothing is imported until load() and the value is cached."""
+        lazy = LazyBackend('json_dumps', 'json', 'dumps')
+
+        self.assertTrue(lazy.available)
+        self.assertFalse(lazy.loaded)
+
+        dumps = lazy.load()
+        self.assertEqual(dumps({'a': 1}), '{"a": 1}')
+        self.assertTrue(lazy.loaded)
+        self.assertIs(lazy.load(), dumps)
+        self.assertIn('json_dumps', lazy_imports.IMPORT_TIMES)
+
+    def test_missing_backend(self):
+        """Test that a missing module is unavailable and fails with the hint."""
+        lazy = LazyBackend('missing', 'no_such_module_xyz', install_hint="Run: pip install xyz")
+
+        self.assertFalse(lazy.available)
+        with self.assertRaises(ImportError) as ctx:
+            lazy.load()
+        self.assertIn("pip install xyz", str(ctx.exception))
+
+    def test_import_report(self):
+        """Test that timed imports and unloaded backends appear in the report."""
+        with import_timer('test.timed_block'):
+            pass
+
+        report = import_report()
+        self.assertIn('test.timed_block', report)
+        unloaded = [name for name, lazy in lazy_imports.BACKENDS.items() if not lazy.loaded]
+        if unloaded:
+            self.assertIn('not loaded:', report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Unit tests for the parse-result cache.
+
+Tests cover:
+- Round trip of QuizData keyed by page content
+- Invalidation by parser version and tree backend
+- Size-based eviction and unreadable entries
+- Parsing skipped by process_quiz on a cache hit
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parse_cache import ParseCache
+from src.parser import QuizParser, QuizData, QuizQuestion
+from src.runner import process_quiz
+from tests.test_parser_backends import question_block
+
+
+URL = "https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz"
+
+HTML = '<html><body>' + question_block(
+    "Which river is known as the Sorrow of Bihar?",
+    ["Kosi", "Gandak", "Son", "Ghaghara"],
+    "Correct Answer: Option A",
+    "<p>The Kosi changes its course often.</p>",
+) + '</body></html>'
+
+
+def make_quiz(url=URL):
+    question = QuizQuestion(
+        question_number=1,
+        question_text="Which river is known as the Sorrow of Bihar?",
+        options={'B': 'Gandak', 'A': 'Kosi'},
+        correct_answer='A',
+        explanation="The Kosi changes its course often.",
+    )
+    return QuizData(source_url=url, questions=[question], extracted_date="2025-01-01T06:00:00")
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for ParseCache."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test that a stored result is returned for the same HTML only."""
+        cache = ParseCache(directory=self.test_dir)
+        self.assertIsNone(cache.get(HTML, URL))
+
+        cache.put(HTML, make_quiz())
+        cached = cache.get(HTML, URL)
+        self.assertEqual(cached, make_quiz())
+        # Option order survives serialization
+        self.assertEqual(list(cached.questions[0].options), ['B', 'A'])
+        self.assertIsNone(cache.get(HTML + ' ', URL))
+        # Identical HTML served under another URL keeps the caller's URL
+        self.assertEqual(cache.get(HTML, URL + '-copy').source_url, URL + '-copy')
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_parser_version_and_backend_invalidate(self):
+        """Test that entries of another parser version or tree backend are not used."""
+        ParseCache(directory=self.test_dir, parser_version='1', backend='lxml').put(HTML, make_quiz())
+        self.assertIsNotNone(ParseCache(directory=self.test_dir, parser_version='1', backend='lxml').get(HTML, URL))
+        self.assertIsNone(ParseCache(directory=self.test_dir, parser_version='2', backend='lxml').get(HTML, URL))
+        self.assertIsNone(ParseCache(directory=self.test_dir, parser_version='1', backend='html.parser').get(HTML, URL))
+
+    def test_eviction_and_unreadable_entries(self):
+        """Test LRU eviction under the size limit and dropping of corrupt files."""
+        cache = ParseCache(directory=self.test_dir, max_bytes=10**6)
+        cache.put(HTML, make_quiz())
+        entry_size = cache._current_total()
+
+        cache = ParseCache(directory=self.test_dir, max_bytes=entry_size + entry_size // 2)
+        old = os.path.getmtime(cache._path(HTML)) - 60
+        os.utime(cache._path(HTML), (old, old))
+        cache.put(HTML + '<!-- v2 -->', make_quiz())
+        self.assertIsNone(cache.get(HTML, URL))
+        self.assertIsNotNone(cache.get(HTML + '<!-- v2 -->', URL))
+        self.assertEqual(cache.evictions, 1)
+
+        with open(cache._path(HTML + '<!-- v2 -->'), 'wb') as f:
+            f.write(b'not gzip')
+        self.assertIsNone(cache.get(HTML + '<!-- v2 -->', URL))
+        self.assertFalse(cache._path(HTML + '<!-- v2 -->').exists())
+
+    def test_process_quiz_skips_parser_on_hit(self):
+        """Test that a rerun of an unchanged page reuses the cached parse."""
+        cache = ParseCache(directory=self.test_dir)
+        streamed = []
+
+        def translate_stream(questions, source_url):
+            streamed.append(list(questions))
+            translated = MagicMock()
+            translated.questions = streamed[-1]
+            return translated
+
+        def run(parser):
+            scraper = MagicMock()
+            scraper.submit_quiz.return_value = HTML
+            translator = MagicMock()
+            translator.translate_stream.side_effect = translate_stream
+            date_extractor = MagicMock()
+            date_extractor.extract_date_from_url.return_value = None
+            # A downstream failure still leaves the parse cached
+            pdf_generator = MagicMock()
+            pdf_generator.generate_pdf.side_effect = RuntimeError("PDF failed")
+            return process_quiz(
+                url=URL, scraper=scraper, parser=parser, translator=translator,
+                pdf_generator=pdf_generator, telegram_sender=MagicMock(),
+                telegram_text_sender=None, supabase_manager=MagicMock(),
+                notification_sender=None, state_manager=MagicMock(),
+                date_extractor=date_extractor, parse_cache=cache
+            )
+
+        self.assertFalse(run(QuizParser()))
+        unused_parser = MagicMock()
+        self.assertFalse(run(unused_parser))
+
+        unused_parser.iter_questions.assert_not_called()
+        self.assertEqual(len(streamed[0]), 1)
+        self.assertEqual(streamed[1], streamed[0])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
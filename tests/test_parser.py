@@ -15,7 +15,10 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.parser import QuizParser, QuizData, QuizQuestion
+import dataclasses
+import json
+
+from src.parser import QuizParser, QuizData, QuizQuestion, QuizOptions
 
 
 class TestQuizParser(unittest.TestCase):
@@ -289,6 +292,108 @@ class TestQuizParser(unittest.TestCase):
         
         self.assertEqual(quiz_data.source_url, test_url)
 
+    
+    def test_hindi_sections_skipped_without_errors(self):
+        """Test that Hindi copies are filtered out before extraction and not logged as errors."""
+        section = """
+            <div class="q-section-inner-sol">
+                <div class="q-name">{question}</div>
+                <div class="q-option"><ul>
+                    <li><div class="containerr-text-opt">A. {a}</div></li>
+                    <li><div class="containerr-text-opt">B. {b}</div></li>
+                </ul></div>
+                <div class="solution-sec"><div class="head">Answer: B</div>
+                <div class="ans-text"><p>{explanation}</p></div></div>
+            </div>
+        """
+        html = "<html>" + section.format(
+            question="Who is the RBI Governor?", a="Urjit Patel", b="Sanjay Malhotra",
+            explanation="Sanjay Malhotra took charge in December 2024."
+        ) + section.format(
+            question="आरबीआई गवर्नर कौन हैं?", a="उर्जित पटेल", b="संजय मल्होत्रा",
+            explanation="संजय मल्होत्रा"
+        ) + "</html>"
+        
+        with self.assertLogs('src.parser', level='INFO') as logs:
+            quiz_data = self.parser.parse_quiz(html, "https://example.com/quiz1")
+        
+        self.assertEqual(len(quiz_data.questions), 1)
+        self.assertEqual(quiz_data.questions[0].question_text, "Who is the RBI Governor?")
+        self.assertEqual(quiz_data.questions[0].correct_answer, "B")
+        self.assertFalse([line for line in logs.output if line.startswith('ERROR')])
+        self.assertTrue(any("1 sections kept, 1 Hindi sections skipped" in line for line in logs.output))
+    
+    def test_iter_questions_yields_incrementally(self):
+        """Test that questions are yielded one at a time and match parse_quiz."""
+        section = """
+            <div class="q-section-inner-sol">
+                <div class="q-name">Question {n}?</div>
+                <div class="q-option"><ul>
+                    <li><div class="containerr-text-opt">A. Yes</div></li>
+                    <li><div class="containerr-text-opt">B. No</div></li>
+                </ul></div>
+                <div class="solution-sec"><div class="head">Answer: A</div>
+                <div class="ans-text"><p>Because {n}.</p></div></div>
+            </div>
+        """
+        html = "<html>" + "".join(section.format(n=n) for n in range(1, 4)) + "</html>"
+        
+        stream = self.parser.iter_questions(html, "https://example.com/quiz1")
+        first = next(stream)
+        self.assertEqual(first.question_number, 1)
+        self.assertEqual(first.question_text, "Question 1?")
+        
+        rest = list(stream)
+        self.assertEqual([q.question_number for q in rest], [2, 3])
+        self.assertEqual(tuple([first] + rest), self.parser.parse_quiz(html, "https://example.com/quiz1").questions)
+
+
+class TestQuizRecords(unittest.TestCase):
+    """Test cases for the immutable QuizQuestion/QuizData records."""
+    
+    def make_question(self):
+        return QuizQuestion(
+            question_number=3,
+            question_text="Capital of India?",
+            options={'A': 'Mumbai', 'B': 'New Delhi'},
+            correct_answer='B',
+            explanation="New Delhi."
+        )
+    
+    def test_records_are_immutable(self):
+        """Test that questions, options and question sequences cannot be modified."""
+        question = self.make_question()
+        quiz = QuizData(source_url="https://example.com/q", questions=[question], extracted_date="2025-01-01")
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            question.question_number = 1
+        with self.assertRaises(TypeError):
+            question.options['A'] = 'Kolkata'
+        self.assertIsInstance(quiz.questions, tuple)
+        self.assertFalse(hasattr(question, '__dict__'))
+    
+    def test_options_behave_like_a_dict(self):
+        """Test that converted options keep order, compare equal to dicts and serialize via dict()."""
+        question = self.make_question()
+        
+        self.assertIsInstance(question.options, QuizOptions)
+        self.assertEqual(question.options, {'A': 'Mumbai', 'B': 'New Delhi'})
+        self.assertEqual(list(question.options.items()), [('A', 'Mumbai'), ('B', 'New Delhi')])
+        self.assertIn('B', question.options)
+        self.assertNotIn('C', question.options)
+        self.assertEqual(json.loads(json.dumps(dict(question.options))), {'A': 'Mumbai', 'B': 'New Delhi'})
+        self.assertEqual(hash(question), hash(self.make_question()))
+    
+    def test_with_number_copies(self):
+        """Test that renumbering returns a copy sharing the immutable fields."""
+        question = self.make_question()
+        renumbered = question.with_number(10)
+        
+        self.assertEqual(question.question_number, 3)
+        self.assertEqual(renumbered.question_number, 10)
+        self.assertIs(renumbered.options, question.options)
+        self.assertIs(question.with_number(3), question)
+        self.assertEqual(question.replace(explanation="").explanation, "")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,181 @@
+"""
+Parity tests for the QuizParser tree backends.
+
+Tests cover:
+- Identical output from html.parser and lxml on the test_parser.py fixtures
+- Identical output on a page in the live site's structure
+- Identical output on unclosed <p> and <li> tags
+- Identical output on the page corpus in fixtures/pages and any archived pages
+- Backend selection
+"""
+
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parser import QuizParser
+from src.parser_backends import LXML_AVAILABLE, get_backend
+from src.html_archive import HTMLArchive
+from tests import test_parser
+
+FIXTURE_PAGES = os.path.join(os.path.dirname(__file__), 'fixtures', 'pages')
+
+
+def question_block(question, options, head, explanation):
+    """One solved question in the site's markup"""
+    items = ''.join(
+        f'<li><label><div class="containerr-text-opt">{label}. {text}</div></label></li>'
+        for label, text in zip('ABCD', options)
+    )
+    return f"""
+    <div class="q-section-inner-sol">
+        <div class="q-name"><p>{question}</p></div>
+        <div class="q-option"><ul>{items}</ul></div>
+        <div class="solution-sec">
+            <div class="head">{head}</div>
+            <div class="ans-text">{explanation}</div>
+        </div>
+    </div>
+    """
+
+
+SITE_PAGE = '<!DOCTYPE html><html><head><meta charset="utf-8"><script>var x = "<div>";</script></head><body>' + ''.join([
+    question_block(
+        "Which state hosted the 2025 <b>National Games</b>?",
+        ["Goa", "Uttarakhand", "Gujarat", "Kerala"],
+        "Correct Answer: Option B",
+        "<ul><li>The 38th National Games were held in  Uttarakhand.</li><li>Mascot:&nbsp;Mauli</li></ul>"
+        "<p>· Dehradun hosted the opening ceremony.</p><!-- ad slot -->",
+    ),
+    question_block(
+        "2025 के राष्ट्रीय खेलों की मेजबानी किस राज्य ने की?",
+        ["गोवा", "उत्तराखंड", "गुजरात", "केरल"],
+        "सही उत्तर: B",
+        "<p>उत्तराखंड</p>",
+    ),
+    question_block(
+        "RBI cut the repo rate to what level in February 2025?",
+        ["6.25%", "6.50%", "6.00%", "5.75%"],
+        "Ans: A",
+        "Plain text explanation &amp; no markup",
+    ),
+    question_block("Question without a revealed answer?", ["1", "2", "3", "4"], "Solution", "<p>n/a</p>"),
+]) + '</body></html>'
+
+
+def parser_fixtures():
+    """HTML passed to parse_quiz by every test in test_parser.py"""
+    recorded = []
+    parse_quiz = QuizParser.parse_quiz
+
+    def recording(parser, html, url):
+        recorded.append((html, url))
+        return parse_quiz(parser, html, url)
+
+    with mock.patch.object(QuizParser, 'parse_quiz', recording):
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(test_parser.TestQuizParser)
+        suite.run(unittest.TestResult())
+    return recorded
+
+
+def outcome(parser, html, url):
+    """Parsed questions (without the timestamp) or the error message"""
+    try:
+        quiz = parser.parse_quiz(html, url)
+    except ValueError as e:
+        return ('error', str(e))
+    return ('ok', list(quiz.questions))
+
+
+@unittest.skipUnless(LXML_AVAILABLE, "lxml is not installed")
+class TestParserBackendParity(unittest.TestCase):
+    """Both backends must produce the same QuizData."""
+
+    def setUp(self):
+        self.reference = QuizParser(backend='html.parser')
+        self.fast = QuizParser(backend='lxml')
+
+    def assertParity(self, html, url):
+        self.assertEqual(outcome(self.fast, html, url), outcome(self.reference, html, url), url)
+
+    def test_parser_fixtures(self):
+        """Test parity on every fixture used by test_parser.py."""
+        fixtures = parser_fixtures()
+        self.assertTrue(fixtures)
+        for html, url in fixtures:
+            with self.subTest(url=url):
+                self.assertParity(html, url)
+
+    def test_site_structure(self):
+        """Test parity on a page in the live site's structure."""
+        result = outcome(self.fast, SITE_PAGE, "https://example.com/site")
+        self.assertEqual(result[0], 'ok')
+        self.assertEqual(len(result[1]), 2)
+        self.assertParity(SITE_PAGE, "https://example.com/site")
+
+    def test_solution_landmarks_are_scoped(self):
+        """Test that head/ans-text divs outside solution-sec are ignored by both backends."""
+        html = question_block(
+            "Which planet is known as the Red Planet?",
+            ["Venus", "Mars", "Jupiter", "Saturn"],
+            "Answer: B",
+            "<p>Mars looks red because of iron oxide.</p>",
+        ).replace('<div class="q-option">', '<div class="head">Answer: D</div><div class="ans-text">Decoy</div><div class="q-option">')
+        for parser in (self.reference, self.fast):
+            with self.subTest(backend=parser.backend.name):
+                question = parser.parse_quiz(html, "https://example.com/scoped").questions[0]
+                self.assertEqual(question.correct_answer, 'B')
+                self.assertEqual(question.explanation, "Mars looks red because of iron oxide.")
+
+    def test_unclosed_tags(self):
+        """Test that unclosed paragraphs and list items are not counted twice."""
+        cases = [
+            ("<p>one<p>two", "one two"),
+            ("<ul><li>one<li>two</ul>", "• one • two"),
+            ("<ul><li>one<ul><li>sub</li></ul><li>three</ul>", "• one • sub • three"),
+        ]
+        for explanation, expected in cases:
+            html = question_block("Which is it?", ["1", "2", "3", "4"], "Answer: A", explanation)
+            for parser in (self.reference, self.fast):
+                with self.subTest(explanation=explanation, backend=parser.backend.name):
+                    question = parser.parse_quiz(html, "https://example.com/unclosed").questions[0]
+                    self.assertEqual(question.explanation, expected)
+
+    def test_page_corpus(self):
+        """Test parity on the fixture pages and on archived pages when there are any."""
+        pages = []
+        for name in sorted(os.listdir(FIXTURE_PAGES)):
+            if name.endswith('.html'):
+                with open(os.path.join(FIXTURE_PAGES, name), encoding='utf-8') as f:
+                    pages.append((f"https://pendulumedu.com/quiz/current-affairs/{name[:-5]}", f.read()))
+        self.assertTrue(pages)
+
+        directory = os.getenv('HTML_ARCHIVE_DIR',
+                              os.path.join(os.path.dirname(__file__), '..', 'automation', 'data', 'archive'))
+        archive = HTMLArchive(directory=directory)
+        pages.extend((url, archive.get(url)) for url in archive.urls())
+
+        for url, html in pages:
+            with self.subTest(url=url):
+                self.assertParity(html, url)
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test cases for get_backend()."""
+
+    def test_default_and_unknown(self):
+        """Test the env default and rejection of unknown names."""
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('QUIZ_PARSER_BACKEND', None)
+            self.assertEqual(get_backend().name, 'html.parser')
+        self.assertEqual(get_backend('auto').name, 'lxml' if LXML_AVAILABLE else 'html.parser')
+        with self.assertRaises(ValueError):
+            get_backend('html5lib')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the parser benchmark suite.
+
+Tests cover:
+- Percentile and regression comparison helpers
+- Recording results and comparing against the previous run
+"""
+
+import unittest
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+BENCHMARK_PATH = os.path.join(os.path.dirname(__file__), '..', 'automation', 'benchmarks', 'parser_benchmark.py')
+spec = importlib.util.spec_from_file_location('parser_benchmark', BENCHMARK_PATH)
+parser_benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(parser_benchmark)
+
+
+class TestBenchmarkHelpers(unittest.TestCase):
+    """Test cases for the statistics helpers."""
+
+    def test_percentile_and_compare(self):
+        """Test nearest-rank percentiles and regression detection."""
+        values = [float(n) for n in range(1, 101)]
+        self.assertEqual(parser_benchmark.percentile(values, 0.50), 50.0)
+        self.assertEqual(parser_benchmark.percentile(values, 0.99), 99.0)
+        self.assertEqual(parser_benchmark.percentile([], 0.5), 0.0)
+
+        previous = {'questions_per_sec': 100.0, 'p50_ms': 10.0, 'p99_ms': 20.0, 'peak_kib_max': 500.0}
+        current = {'questions_per_sec': 80.0, 'p50_ms': 10.5, 'p99_ms': 40.0, 'peak_kib_max': 500.0}
+        # p99 is reported but too noisy to gate on
+        self.assertEqual(parser_benchmark.compare(previous, current, 0.10), ['questions_per_sec'])
+
+
+class TestBenchmarkRun(unittest.TestCase):
+    """Test cases for a full benchmark run."""
+
+    def test_results_are_appended_and_compared(self):
+        """Test that each run appends one record per backend and finds the previous one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'parser.jsonl')
+            argv = ['--synthetic', '2', '--repeat', '1', '--backend', 'html.parser',
+                    '--archive-dir', os.path.join(tmpdir, 'archive'), '--output', output]
+
+            with mock.patch.object(parser_benchmark, 'git_commit', return_value='abc1234'):
+                self.assertEqual(parser_benchmark.main(argv), 0)
+                self.assertEqual(parser_benchmark.main(argv), 0)
+
+            with open(output, encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(records), 2)
+        record = records[-1]
+        self.assertEqual(record['backend'], 'html.parser')
+        self.assertEqual(record['commit'], 'abc1234')
+        self.assertEqual(record['corpus']['source'], 'synthetic')
+        self.assertEqual(record['questions'], 40)
+        self.assertEqual(record['errors'], 0)
+        self.assertGreater(record['questions_per_sec'], 0)
+        self.assertIsNotNone(parser_benchmark.previous_result(records[:1], record))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for the adaptive rate controller.
+
+Tests cover:
+- Token bucket pacing per host
+- Multiplicative decrease on 429/5xx and errors, additive increase on success
+- Retry-After handling
+- Asyncio acquisition
+- Concurrency seeded and capped from the worker count
+"""
+
+import unittest
+import asyncio
+import time
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.rate_limiter import RateController
+
+
+URL = "https://pendulumedu.com/quiz/current-affairs"
+
+
+class TestRateController(unittest.TestCase):
+    """Test cases for RateController."""
+
+    def test_token_bucket_paces_requests(self):
+        """Test that requests beyond the burst wait for tokens."""
+        controller = RateController(rate=20, max_rate=20, max_concurrency=8)
+        started = time.monotonic()
+        for _ in range(6):
+            with controller.slot(URL) as ticket:
+                ticket.status = 200
+        # One token available at once, the remaining five at 20 req/s
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_hosts_are_independent(self):
+        """Test that one host's back-off does not slow another host."""
+        controller = RateController(rate=4, max_rate=10)
+        with controller.slot(URL) as ticket:
+            ticket.status = 503
+        self.assertEqual(controller._hosts['pendulumedu.com'].rate, 2)
+
+        with controller.slot("https://translate.googleapis.com/x") as ticket:
+            ticket.status = 200
+        self.assertGreater(controller._hosts['translate.googleapis.com'].rate, 4)
+
+    def test_congestion_halves_rate_once_per_window(self):
+        """Test AIMD: one decrease for requests that were in flight together."""
+        controller = RateController(rate=8, max_rate=10, max_concurrency=8)
+        controller._state('pendulumedu.com').concurrency = 4
+        first = controller.acquire(URL)
+        second = controller.acquire(URL)
+        first.status = second.status = 429
+        controller.release(first)
+        controller.release(second)
+
+        state = controller._hosts['pendulumedu.com']
+        self.assertEqual(state.rate, 4)
+        self.assertEqual(state.congestion_events, 2)
+
+        with controller.slot(URL) as ticket:
+            ticket.status = 200
+        self.assertEqual(state.rate, 4.25)
+
+    def test_exception_counts_as_congestion(self):
+        """Test that a failed request backs the host off."""
+        controller = RateController(rate=4, max_rate=10)
+        with self.assertRaises(RuntimeError):
+            with controller.slot(URL):
+                raise RuntimeError("connection reset")
+        self.assertEqual(controller._hosts['pendulumedu.com'].rate, 2)
+
+    def test_retry_after_blocks_host(self):
+        """Test that Retry-After delays the next request."""
+        controller = RateController(rate=10, max_rate=10)
+        with controller.slot(URL) as ticket:
+            ticket.status = 429
+            ticket.retry_after = 0.3
+        started = time.monotonic()
+        controller.release(controller.acquire(URL))
+        self.assertGreaterEqual(time.monotonic() - started, 0.25)
+
+    def test_async_slot(self):
+        """Test concurrent asyncio acquisition under the concurrency limit."""
+        controller = RateController(rate=10, max_rate=10, max_concurrency=2)
+        peak = {'now': 0, 'max': 0}
+
+        async def request():
+            async with controller.async_slot(URL) as ticket:
+                peak['now'] += 1
+                peak['max'] = max(peak['max'], peak['now'])
+                await asyncio.sleep(0.01)
+                peak['now'] -= 1
+                ticket.status = 200
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(5)))
+
+        asyncio.run(run())
+        self.assertLessEqual(peak['max'], 2)
+        self.assertEqual(controller._hosts['pendulumedu.com'].requests, 5)
+
+    def test_configured_workers_reach_full_concurrency(self):
+        """Test that N configured workers have N requests in flight at once."""
+        def peak_in_flight(controller, workers):
+            peak = {'now': 0, 'max': 0}
+
+            async def request():
+                async with controller.async_slot(URL) as ticket:
+                    peak['now'] += 1
+                    peak['max'] = max(peak['max'], peak['now'])
+                    await asyncio.sleep(0.3)
+                    peak['now'] -= 1
+                    ticket.status = 200
+
+            async def run():
+                await asyncio.gather(*(request() for _ in range(workers)))
+
+            asyncio.run(run())
+            return peak['max']
+
+        # Without seeding, a host starts at two slots and grows only as requests finish
+        self.assertLess(peak_in_flight(RateController(rate=100, max_rate=100, max_concurrency=8), 10), 10)
+
+        controller = RateController(rate=100, max_rate=100, max_concurrency=8)
+        controller.set_concurrency(10)
+        self.assertEqual(peak_in_flight(controller, 10), 10)
+        self.assertEqual(RateController(rate=100, max_rate=100, max_concurrency=4, concurrency=4).initial_concurrency, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the browser request filter.
+
+Tests cover:
+- Allow, stub and abort decisions per resource type and host
+- Disabled filtering
+- Route handling and blocked-request statistics
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.request_filter import ESTIMATED_BYTES, TRANSPARENT_GIF, RequestFilter
+
+
+def route(url, resource_type):
+    return Mock(request=Mock(url=url, resource_type=resource_type))
+
+
+class TestRequestFilter(unittest.TestCase):
+    """Test cases for RequestFilter."""
+
+    def test_classification(self):
+        """Test the decision for site resources and third-party hosts."""
+        request_filter = RequestFilter(enabled=True)
+        cases = [
+            ("https://pendulumedu.com/quiz/current-affairs/x", 'document', 'allow'),
+            ("https://pendulumedu.com/js/quiz.js", 'script', 'allow'),
+            ("https://pendulumedu.com/css/site.css", 'stylesheet', 'allow'),
+            ("https://pendulumedu.com/quiz/submit", 'xhr', 'allow'),
+            ("https://pendulumedu.com/img/logo.png", 'image', 'stub'),
+            ("https://pendulumedu.com/fonts/a.woff2", 'font', 'abort'),
+            ("https://pendulumedu.com/video/intro.mp4", 'media', 'abort'),
+            # Ad and analytics hosts, including subdomains
+            ("https://www.googletagmanager.com/gtm.js", 'script', 'stub'),
+            ("https://stats.g.doubleclick.net/collect", 'xhr', 'abort'),
+            ("https://www.google-analytics.com/g/collect", 'fetch', 'abort'),
+            # A lookalike host is not a subdomain of a blocked one
+            ("https://notfacebook.com/app.js", 'script', 'allow'),
+            # Documents are never blocked, even from a blocked host
+            ("https://www.youtube.com/embed/x", 'document', 'allow'),
+        ]
+        for url, resource_type, decision in cases:
+            with self.subTest(url=url, resource_type=resource_type):
+                self.assertEqual(request_filter.classify(url, resource_type), decision)
+
+    def test_disabled_filter_allows_everything(self):
+        """Test that BLOCK_RESOURCES=false lets every request through and installs nothing."""
+        request_filter = RequestFilter(enabled=False)
+        self.assertEqual(request_filter.classify("https://doubleclick.net/ad.js", 'script'), 'allow')
+        self.assertEqual(request_filter.classify("https://pendulumedu.com/a.png", 'image'), 'allow')
+
+        context = Mock()
+        request_filter.install(context)
+        context.route.assert_not_called()
+
+    def test_route_handling_and_statistics(self):
+        """Test route calls and the blocked counts and estimated bytes saved."""
+        request_filter = RequestFilter(enabled=True)
+        image = route("https://pendulumedu.com/img/a.png", 'image')
+        font = route("https://pendulumedu.com/fonts/a.woff2", 'font')
+        tracker = route("https://www.googletagmanager.com/gtm.js", 'script')
+        page = route("https://pendulumedu.com/quiz/current-affairs/x", 'document')
+        for r in (image, font, tracker, page):
+            request_filter.handle(r)
+
+        image.fulfill.assert_called_once_with(status=200, content_type='image/gif', body=TRANSPARENT_GIF)
+        font.abort.assert_called_once()
+        tracker.fulfill.assert_called_once_with(status=200, content_type='application/javascript', body='')
+        page.continue_.assert_called_once()
+
+        self.assertEqual(request_filter.allowed, 1)
+        self.assertEqual(request_filter.blocked, {'image': 1, 'font': 1, 'script': 1})
+        self.assertEqual(request_filter.estimated_bytes_saved,
+                         ESTIMATED_BYTES['image'] + ESTIMATED_BYTES['font'] + ESTIMATED_BYTES['script'])
+        self.assertIn("3 requests blocked (font=1, image=1, script=1), 1 allowed", request_filter.summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
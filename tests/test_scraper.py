@@ -0,0 +1,302 @@
+"""
+Unit tests for QuizScraper module.
+
+Tests cover:
+- Detection of revealed answers in quiz HTML
+- HTTP fast path with browser fallback in submit_quiz
+- Detection of a rejected browser session
+- One deadline for the submit button and the solution reveal
+- Learning and replaying the listing's "Show more" endpoint
+"""
+
+import unittest
+import sys
+import os
+import json
+import time
+import tempfile
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.scraper import QuizScraper, ScraperError, has_revealed_answers
+from src.listing_endpoint import ListingEndpoint, extract_fragment_html
+from src.debug_capture import DebugCapture
+
+
+REVEALED_HTML = """
+<html>
+    <div class="solution-sec">
+        <div class="head">Correct Answer: Option B</div>
+        <div class="ans-text"><p>Explanation</p></div>
+    </div>
+</html>
+"""
+
+HIDDEN_HTML = """
+<html>
+    <div class="solution-sec">
+        <div class="head">Solution:</div>
+    </div>
+</html>
+"""
+
+
+class TestRevealedAnswers(unittest.TestCase):
+    """Test cases for has_revealed_answers."""
+
+    def test_revealed_english_head(self):
+        """Test that an English correct-answer head counts as revealed."""
+        self.assertTrue(has_revealed_answers(REVEALED_HTML))
+
+    def test_revealed_hindi_head(self):
+        """Test that a Hindi correct-answer head counts as revealed."""
+        html = '<div class="solution-sec"><div class="head">सही उत्तर: B</div></div>'
+        self.assertTrue(has_revealed_answers(html))
+
+    def test_hidden_answers(self):
+        """Test that the pre-submission head is not treated as revealed."""
+        self.assertFalse(has_revealed_answers(HIDDEN_HTML))
+
+    def test_missing_solution_section(self):
+        """Test HTML without any solution section."""
+        self.assertFalse(has_revealed_answers("<html><body></body></html>"))
+
+
+class TestSubmitQuizTiers(unittest.TestCase):
+    """Test cases for the tiered solution reveal."""
+
+    def setUp(self):
+        """Set up a scraper with a dummy session."""
+        self.scraper = QuizScraper(Mock(cookies=[]), browser_pool=Mock())
+        self.scraper.http_fast_path = True
+        self.scraper.archive = None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.scraper.debug_capture = DebugCapture(directory=self.tmpdir.name, enabled=False)
+        self.url = "https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_http_tier_serves_revealed_page(self):
+        """Test that the browser is skipped when HTTP reveals the answers."""
+        with patch.object(self.scraper, '_submit_quiz_post', return_value=REVEALED_HTML), \
+             patch.object(self.scraper, '_submit_quiz_playwright') as browser:
+            html = self.scraper.submit_quiz(self.url)
+
+        self.assertEqual(html, REVEALED_HTML)
+        browser.assert_not_called()
+        self.assertEqual(self.scraper.tier_stats.counts(), {'http': 1})
+
+    def test_browser_fallback_when_http_has_no_answers(self):
+        """Test fallback to the browser when the HTTP page is not revealed."""
+        with patch.object(self.scraper, '_submit_quiz_post', return_value=HIDDEN_HTML), \
+             patch.object(self.scraper, '_submit_quiz_playwright', return_value=REVEALED_HTML):
+            html = self.scraper.submit_quiz(self.url)
+
+        self.assertEqual(html, REVEALED_HTML)
+        self.assertEqual(self.scraper.tier_stats.counts(), {'browser': 1})
+        self.assertEqual(self.scraper.tier_stats.http_fallbacks, 1)
+
+    def test_browser_fallback_when_http_raises(self):
+        """Test fallback to the browser when the HTTP path errors."""
+        with patch.object(self.scraper, '_submit_quiz_post', side_effect=RuntimeError("boom")), \
+             patch.object(self.scraper, '_submit_quiz_playwright', return_value=REVEALED_HTML):
+            html = self.scraper.submit_quiz(self.url)
+
+        self.assertEqual(html, REVEALED_HTML)
+        self.assertEqual(self.scraper.tier_stats.counts(), {'browser': 1})
+
+
+class TestLoggedOutCheck(unittest.TestCase):
+    """Test cases for detecting a rejected browser session."""
+
+    def setUp(self):
+        self.scraper = QuizScraper(Mock(cookies=[]), browser_pool=Mock())
+
+    def page(self, url, signin_count=0, signin_visible=False):
+        page = Mock(url=url)
+        signin = page.locator.return_value
+        signin.count.return_value = signin_count
+        signin.first.is_visible.return_value = signin_visible
+        return page
+
+    def test_logged_out_states(self):
+        """Test login redirects, visible sign-in buttons and the logged-in page."""
+        quiz = "https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz"
+        cases = [
+            (self.page("https://pendulumedu.com/Login?next=/quiz"), True),
+            (self.page(quiz, signin_count=1, signin_visible=True), True),
+            (self.page(quiz, signin_count=1, signin_visible=False), False),
+            (self.page(quiz), False),
+        ]
+        for page, logged_out in cases:
+            with self.subTest(url=page.url, signin=page.locator.return_value.count.return_value):
+                self.assertEqual(self.scraper._is_logged_out(page), logged_out)
+
+    def test_locator_error_is_not_logged_out(self):
+        """Test that a failing locator does not trigger a form login."""
+        page = Mock(url="https://pendulumedu.com/quiz/current-affairs")
+        page.locator.side_effect = RuntimeError("page closed")
+        self.assertFalse(self.scraper._is_logged_out(page))
+
+class TestRevealDeadline(unittest.TestCase):
+    """Test cases for the browser reveal wait."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.page = Mock(url="https://pendulumedu.com/quiz/current-affairs/1-january-2025-current-affairs-quiz")
+        pool = Mock()
+        pool.page.return_value.__enter__ = Mock(return_value=self.page)
+        pool.page.return_value.__exit__ = Mock(return_value=False)
+        self.scraper = QuizScraper(Mock(cookies=[]), browser_pool=pool)
+        self.scraper.debug_capture = DebugCapture(directory=self.tmpdir.name, enabled=False)
+        self.scraper.reveal_timeout = 1
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_button_and_reveal_share_one_deadline(self):
+        """Test that the reveal wait only gets the time the submit-button wait left."""
+        timeouts = {}
+        submit_button = Mock()
+        signin = Mock(**{'count.return_value': 0})
+        self.page.locator.side_effect = lambda selector: submit_button if selector == '#submit-ans' else signin
+
+        def wait_for(state, timeout):
+            timeouts['button'] = timeout
+            time.sleep(0.3)
+
+        def wait_for_function(script, arg, polling, timeout):
+            timeouts['reveal'] = timeout
+
+        submit_button.wait_for.side_effect = wait_for
+        self.page.evaluate.return_value = False
+        self.page.wait_for_function.side_effect = wait_for_function
+        self.page.content.return_value = REVEALED_HTML
+
+        with patch('src.scraper.PLAYWRIGHT_AVAILABLE', True):
+            html = self.scraper._submit_quiz_playwright(self.page.url)
+
+        self.assertEqual(html, REVEALED_HTML)
+        submit_button.click.assert_called_once()
+        self.assertLessEqual(timeouts['button'], 1000)
+        self.assertLessEqual(timeouts['reveal'], 1000 - 300 + 50)
+
+    def test_timeout_returns_page_without_raising(self):
+        """Test that an expired deadline ends the wait and still returns the page."""
+        self.page.wait_for_function.side_effect = TimeoutError("Timeout 1ms exceeded")
+        self.page.locator.return_value.count.return_value = 0
+        self.page.evaluate.return_value = False
+        self.page.content.return_value = HIDDEN_HTML
+        self.page.screenshot.return_value = b'png'
+
+        with patch('src.scraper.PLAYWRIGHT_AVAILABLE', True):
+            html = self.scraper._submit_quiz_playwright(self.page.url)
+
+        self.assertEqual(html, HIDDEN_HTML)
+        self.assertEqual(self.page.wait_for_function.call_count, 1)
+
+
+def listing_html(*slugs):
+    """Build listing HTML with one card-section per quiz slug."""
+    cards = ''.join(
+        f'<div class="card-section"><a href="/quiz/current-affairs/{slug}">Quiz</a></div>'
+        for slug in slugs
+    )
+    return f'<html><body>{cards}</body></html>'
+
+
+def quiz_url(slug):
+    return f"https://pendulumedu.com/quiz/current-affairs/{slug}"
+
+
+class TestListingEndpoint(unittest.TestCase):
+    """Test cases for learning the "Show more" endpoint."""
+
+    def test_learn_from_two_clicks(self):
+        """Test that the parameter changing between clicks is the page parameter."""
+        recorded = [
+            ('GET', 'https://pendulumedu.com/track?event=click', None),
+            ('POST', 'https://pendulumedu.com/quiz/load-more', 'type=current-affairs&offset=12&limit=12'),
+            ('POST', 'https://pendulumedu.com/quiz/load-more', 'type=current-affairs&offset=24&limit=12'),
+        ]
+        endpoint = ListingEndpoint.learn(recorded, clicks=2)
+
+        self.assertEqual(endpoint.url, 'https://pendulumedu.com/quiz/load-more')
+        self.assertEqual(endpoint.page_param, 'offset')
+        self.assertEqual(endpoint.step, 12)
+        self.assertEqual(endpoint.request_for_page(4)['data']['offset'], '36')
+
+    def test_learn_from_single_click_uses_name_hint(self):
+        """Test that a single recorded click falls back to parameter name hints."""
+        recorded = [('GET', 'https://pendulumedu.com/quiz/more?page=2', None)]
+        endpoint = ListingEndpoint.learn(recorded, clicks=1)
+
+        self.assertEqual(endpoint.page_param, 'page')
+        self.assertEqual(endpoint.step, 1)
+        self.assertEqual(endpoint.request_for_page(3)['params'], {'page': '3'})
+
+    def test_json_fragment_response(self):
+        """Test that card markup embedded in JSON is extracted."""
+        body = json.dumps({'status': 1, 'html': listing_html('a-quiz')})
+        self.assertIn('card-section', extract_fragment_html(body))
+
+
+class TestHTTPListing(unittest.TestCase):
+    """Test cases for paging the listing without a browser."""
+
+    def setUp(self):
+        """Set up a scraper whose session serves canned listing pages."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.session = Mock(cookies=[])
+        self.scraper = QuizScraper(self.session, browser_pool=Mock())
+        self.scraper.listing_endpoint_path = os.path.join(self.tmpdir.name, 'endpoint.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_watermark_on_first_page_needs_no_endpoint(self):
+        """Test that a no-op incremental run stops after the static first page."""
+        self.session.get.return_value = Mock(text=listing_html('new-quiz', 'old-quiz'))
+
+        urls = self.scraper.get_quiz_urls(known_urls={quiz_url('old-quiz')})
+
+        self.assertEqual(urls, [quiz_url('new-quiz'), quiz_url('old-quiz')])
+        self.session.request.assert_not_called()
+
+    def test_replays_learned_endpoint(self):
+        """Test that further pages come from the saved endpoint."""
+        ListingEndpoint('GET', 'https://pendulumedu.com/quiz/more', {'page': '2'},
+                        'query', 'page', 2, 1).save(self.scraper.listing_endpoint_path)
+        self.session.get.return_value = Mock(text=listing_html('q1', 'q2'))
+        self.session.request.side_effect = [
+            Mock(text=listing_html('q3')),
+            Mock(text=listing_html('q4')),
+        ]
+
+        urls = self.scraper.get_quiz_urls(known_urls={quiz_url('q4')})
+
+        self.assertEqual(urls, [quiz_url(slug) for slug in ('q1', 'q2', 'q3', 'q4')])
+        self.assertEqual(self.session.request.call_args[1]['params'], {'page': '3'})
+
+    def test_unknown_endpoint_falls_back_to_browser(self):
+        """Test fallback to Playwright when more pages are needed."""
+        self.session.get.return_value = Mock(text=listing_html('q1'))
+
+        with patch.object(self.scraper, '_get_quiz_urls_browser', return_value=['x']) as browser:
+            urls = self.scraper.get_quiz_urls(known_urls={quiz_url('q9')})
+
+        self.assertEqual(urls, ['x'])
+        browser.assert_called_once()
+
+    def test_http_path_raises_without_endpoint(self):
+        """Test that the HTTP path reports a missing endpoint."""
+        self.session.get.return_value = Mock(text=listing_html('q1'))
+        with self.assertRaises(ScraperError):
+            self.scraper._get_quiz_urls_http({quiz_url('q9')}, None, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for the skip-translation classifier.
+
+Tests cover:
+- Numeric, symbolic, acronym and unit segments
+- Single capitals and all-caps answer phrases still translated
+- Opt-in proper-noun detection
+- Translator requests and avoided-call counts
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parser import QuizData, QuizQuestion
+from src.segment_classifier import SegmentClassifier
+from src.translator import Translator
+from tests.test_translator import FakeTranslator
+
+
+class TestSegmentClassifier(unittest.TestCase):
+    """Test cases for SegmentClassifier and its use by the Translator."""
+
+    def test_classification(self):
+        """Test which lines are resolved locally and how."""
+        classifier = SegmentClassifier(skip_proper_nouns=False)
+        cases = {
+            "2024": ('numeric', "2024"),
+            "10.5%": ('numeric', "10.5%"),
+            "₹1,500": ('numeric', "₹1,500"),
+            "ISRO": ('acronym', "ISRO"),
+            "G20 (2023)": ('acronym', "G20 (2023)"),
+            "R&D": ('acronym', "R&D"),
+            "₹1,500 crore": ('unit', "₹1,500 કરોડ"),
+            "Rs. 5 lakh": ('unit', "રૂ. 5 લાખ"),
+            "U.S.": ('acronym', "U.S."),
+            "AI-ML": ('acronym', "AI-ML"),
+            "INR 5 crore": ('unit', "INR 5 કરોડ"),
+            "WHO": ('acronym', "WHO"),
+            "WHO, UNICEF": ('acronym', "WHO, UNICEF"),
+            # A line mixing an acronym with English is translated as a whole
+            "WHO report": (None, None),
+            "2.5 billion (approx.)": (None, None),
+            "None of the above": (None, None),
+            "Narendra Modi": (None, None),
+            "Which state hosted the National Games?": (None, None),
+            # Single capitals and all-caps answer phrases are translated
+            "A": (None, None),
+            "I": (None, None),
+            "NONE OF THE ABOVE": (None, None),
+            "ALL OF THESE": (None, None),
+            "BOTH A AND B": (None, None),
+            "ONLY 1 AND 2": (None, None),
+            # Acronym-only lines are capped in length
+            "SEBI RBI NABARD IRDAI": (None, None),
+        }
+        for line, (category, rendered) in cases.items():
+            with self.subTest(line=line):
+                self.assertEqual(classifier.classify(line), category)
+                self.assertEqual(classifier.resolve(line), rendered)
+
+        # resolve() counted every line rendered locally, per category
+        self.assertEqual(classifier.counts, {'numeric': 3, 'acronym': 7, 'unit': 3})
+        self.assertEqual(classifier.summary(), "7 acronym, 3 numeric, 3 unit")
+
+    def test_proper_nouns_opt_in(self):
+        """Test that name-only lines are kept in English only when enabled."""
+        cases = {
+            "Narendra Modi": 'proper_noun',
+            "Neeraj Chopra (India)": 'proper_noun',
+            "Reserve Bank (RBI)": 'proper_noun',
+            "WHO (Geneva)": 'proper_noun',
+            "WHO report": None,
+            "Both Nepal and Bhutan": None,
+            "None Of These": None,
+            "NONE OF THESE": None,
+            "Reserve Bank Of India Governor Appointed": None,
+        }
+        enabled = SegmentClassifier(skip_proper_nouns=True)
+        disabled = SegmentClassifier(skip_proper_nouns=False)
+        for line, category in cases.items():
+            with self.subTest(line=line):
+                self.assertEqual(enabled.classify(line), category)
+                self.assertIsNone(disabled.classify(line))
+
+    def test_translator_skips_requests(self):
+        """Test that skipped lines never reach the backend and are counted per quiz."""
+        fake = FakeTranslator()
+        translator = Translator(backends=[fake])
+        translator.memory = None
+        question = QuizQuestion(
+            question_number=1,
+            question_text="What was India's fiscal deficit target?",
+            options={'A': '4.4%', 'B': '₹16 lakh crore', 'C': 'FRBM', 'D': 'Not fixed'},
+            correct_answer='A',
+            explanation="• Target: 4.4%\n• Set in the Union Budget",
+        )
+        with self.assertLogs('src.translator', level='INFO') as logs:
+            translated = translator.translate_quiz(QuizData("u", [question], "d")).questions[0]
+
+        self.assertEqual(dict(translated.options),
+                         {'A': '4.4%', 'B': '₹16 લાખ કરોડ', 'C': 'FRBM', 'D': 'gu:Not fixed'})
+        self.assertEqual(fake.requests, [
+            "What was India's fiscal deficit target?\nNot fixed\n• Target: 4.4%\n• Set in the Union Budget"
+        ])
+        self.assertEqual(translator.calls_avoided, 3)
+        self.assertTrue(any("3 translation calls avoided" in line for line in logs.output))
+
+
+if __name__ == '__main__':
+    unittest.main()
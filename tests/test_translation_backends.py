@@ -0,0 +1,99 @@
+"""
+Unit tests for the translation backends.
+
+Tests cover:
+- Backend selection from configuration, with gtx opt-in
+- Deterministic offline translation kept out of the translation memory
+- Google gtx response parsing and throttling
+- Failover to the next backend
+"""
+
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parser import QuizData
+from src.translator import Translator
+from src.translation_backends import (
+    BatchSplitError, GoogleBackend, OfflineBackend, TranslationThrottled, get_backends
+)
+from tests.test_translator import FakeTranslator, make_question
+
+
+class ThrottledBackend(FakeTranslator):
+    """Backend that always answers 429"""
+
+    name = 'throttled'
+    service_url = 'https://throttled.example.com'
+
+    def translate(self, text):
+        self.requests.append(text)
+        raise TranslationThrottled("429 Too Many Requests")
+
+
+class TestTranslationBackends(unittest.TestCase):
+    """Test cases for the backends and the Translator's failover."""
+
+    def test_selection(self):
+        """Test the default, configured backend lists, single-backend override and unknown names."""
+        with mock.patch.dict(os.environ):
+            os.environ.pop('TRANSLATION_BACKEND', None)
+            os.environ.pop('TRANSLATION_BACKENDS', None)
+            # The unofficial gtx endpoint is opt-in
+            self.assertEqual([b.name for b in get_backends()], ['deep_translator'])
+        with mock.patch.dict(os.environ, {'TRANSLATION_BACKENDS': 'offline, google'}):
+            os.environ.pop('TRANSLATION_BACKEND', None)
+            self.assertEqual([b.name for b in get_backends()], ['offline', 'google'])
+            with mock.patch.dict(os.environ, {'TRANSLATION_BACKEND': 'deep_translator'}):
+                self.assertEqual([b.name for b in get_backends()], ['deep_translator'])
+        with self.assertRaises(ValueError):
+            get_backends('bing')
+
+    def test_offline_backend(self):
+        """Test deterministic offline output, batch splitting and the disabled memory."""
+        backend = OfflineBackend('en', 'gu')
+        self.assertEqual(backend.translate("RBI 2025"), backend.translate("RBI 2025"))
+        self.assertTrue(backend.translate("RBI 2025").endswith(" 2025"))
+        self.assertEqual(backend.translate_batch(["a", "b"]), [backend.translate("a"), backend.translate("b")])
+        with self.assertRaises(BatchSplitError):
+            backend.translate_batch(["a", "b\nc"])
+
+        translator = Translator(backends='offline')
+        self.assertIsNone(translator.memory)
+        quiz = QuizData(source_url="u", questions=[make_question(1), make_question(2)], extracted_date="d")
+        translated = translator.translate_quiz(quiz).questions
+        self.assertEqual(translated[1].question_text, backend.translate("Question 2?"))
+        self.assertEqual(translator.requests_made, 1)
+
+    def test_google_response_and_throttling(self):
+        """Test gtx sentence joining and 429 handling on the pooled session."""
+        backend = GoogleBackend('en', 'gu', pool_size=2)
+        ok = mock.Mock(status_code=200)
+        ok.json.return_value = [[["પ્રથમ.\n", "First.\n"], ["બીજું", "Second"]], None, "en"]
+        with mock.patch.object(backend.session, 'post', return_value=ok) as post:
+            self.assertEqual(backend.translate_batch(["First.", "Second"]), ["પ્રથમ.", "બીજું"])
+        self.assertEqual(post.call_args.kwargs['data'], {'q': "First.\nSecond"})
+
+        with mock.patch.object(backend.session, 'post', return_value=mock.Mock(status_code=429)):
+            with self.assertRaises(TranslationThrottled):
+                backend.translate("First.")
+
+    def test_failover_to_next_backend(self):
+        """Test that a throttled backend is replaced for the rest of the run."""
+        throttled, fallback = ThrottledBackend(), FakeTranslator()
+        translator = Translator(backends=[throttled, fallback])
+        translator.memory = None
+
+        self.assertEqual(translator.translate_texts(["Alpha"]), ["gu:Alpha"])
+        self.assertEqual(translator.translate_texts(["Beta"]), ["gu:Beta"])
+        self.assertEqual(throttled.requests, ["Alpha"])
+        self.assertEqual(fallback.requests, ["Alpha", "Beta"])
+        self.assertIs(translator.backends[translator._active], fallback)
+
+
+if __name__ == '__main__':
+    unittest.main()
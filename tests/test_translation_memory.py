@@ -0,0 +1,85 @@
+"""
+Unit tests for the persistent translation memory.
+
+Tests cover:
+- Lookups by normalized source text and language pair
+- Persistence across instances and hit-rate counters
+- Least-recently-used eviction
+- Translator requests only for lines the memory does not know
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+import time
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translation_memory import TranslationMemory, normalize
+from src.translator import Translator
+from tests.test_translator import FakeTranslator
+
+
+class TestTranslationMemory(unittest.TestCase):
+    """Test cases for TranslationMemory."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, 'memory.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def open_memory(self, **kwargs):
+        memory = TranslationMemory(path=self.path, **kwargs)
+        self.addCleanup(memory.close)
+        return memory
+
+    def test_normalized_lookup_and_persistence(self):
+        """Test that entries survive reopening and match despite spacing differences."""
+        memory = self.open_memory()
+        memory.put_many({"None of the above": "ઉપરોક્તમાંથી કોઈ નહીં", "2025": "2025"}, 'en', 'gu')
+        memory.close()
+
+        memory = self.open_memory()
+        found = memory.get_many(["None  of the above ", "2025", "Ministry of Finance"], 'en', 'gu')
+        self.assertEqual(found, {"None  of the above ": "ઉપરોક્તમાંથી કોઈ નહીં"})
+        # Other language pairs are separate
+        self.assertEqual(memory.get_many(["None of the above"], 'en', 'hi'), {})
+        self.assertEqual((memory.hits, memory.misses, memory.stored), (1, 3, 0))
+        self.assertEqual(normalize(" Repo\tRate \n"), "Repo Rate")
+
+    def test_least_recently_used_entries_evicted(self):
+        """Test that eviction keeps the entries used most recently."""
+        memory = self.open_memory(max_entries=2)
+        memory.put_many({"India": "ભારત"}, 'en', 'gu')
+        memory.put_many({"Nepal": "નેપાળ"}, 'en', 'gu')
+        time.sleep(0.01)
+        memory.get_many(["India"], 'en', 'gu')
+        memory.put_many({"Bhutan": "ભૂટાન"}, 'en', 'gu')
+
+        self.assertEqual(set(memory.get_many(["India", "Nepal", "Bhutan"], 'en', 'gu')), {"India", "Bhutan"})
+        self.assertEqual(memory.evictions, 1)
+
+    def test_translator_uses_memory(self):
+        """Test that a second translator only requests lines the memory lacks."""
+        with mock.patch.dict(os.environ, {'TRANSLATION_MEMORY_PATH': self.path}):
+            first = Translator(backends=[FakeTranslator()])
+            second = Translator(backends=[FakeTranslator()])
+        for translator in (first, second):
+            self.addCleanup(translator.memory.close)
+
+        first.translate_texts(["Which is the capital of India?", "• New Delhi\n• Since 1931"])
+        result = second.translate_texts(["• Since 1931\n• Planned city", "Which is the capital of India?"])
+
+        self.assertEqual(result, ["gu:• Since 1931\ngu:• Planned city", "gu:Which is the capital of India?"])
+        self.assertEqual(second.backends[0].requests, ["• Planned city"])
+        self.assertEqual((second.memory.hits, second.memory.misses), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
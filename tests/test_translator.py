@@ -0,0 +1,242 @@
+"""
+Unit tests for the Translator's streaming consumer and request batching.
+
+Tests cover:
+- Translating questions in order as they are produced
+- Bounded buffering between producer and translator
+- Streamed questions collected into full batches despite a small buffer
+- First batch translated before the producer finishes
+- Propagation of producer errors
+- Packing segments into few requests and splitting the results back
+- Line-by-line fallback when a batch comes back garbled
+- Parallel batches under the shared rate budget, in order
+"""
+
+import unittest
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parser import QuizQuestion
+from src.translator import Translator
+from src.translation_backends import split_batch
+from src.rate_limiter import RateController
+
+
+class FakeTranslator:
+    """Translation backend that records requests instead of calling a service"""
+
+    name = 'fake'
+    max_chars = 5000
+    service_url = 'https://translate.example.com'
+    persistent = True
+
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def translate(self, text):
+        with self.lock:
+            self.requests.append(text)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return '\n'.join(f"gu:{line}" for line in text.split('\n'))
+
+    def translate_batch(self, texts):
+        return split_batch(self.translate('\n'.join(texts)), len(texts))
+
+
+def make_question(number):
+    return QuizQuestion(
+        question_number=number,
+        question_text=f"Question {number}?",
+        options={'A': 'Yes', 'B': 'No'},
+        correct_answer='A',
+        explanation=f"Because {number}."
+    )
+
+
+class TestTranslateStream(unittest.TestCase):
+    """Test cases for Translator.translate_stream."""
+
+    def setUp(self):
+        self.translator = Translator(backends=[FakeTranslator()])
+        self.translator.memory = None
+        patcher = mock.patch('src.translator.time.sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_translates_in_order_with_bounded_buffer(self):
+        """Test that output keeps input order and the producer never runs far ahead."""
+        produced = []
+        lock = threading.Lock()
+
+        def questions():
+            for number in range(1, 9):
+                with lock:
+                    produced.append(number)
+                yield make_question(number)
+
+        seen_ahead = []
+        original = self.translator._translate_questions
+
+        def translate_questions(questions):
+            with lock:
+                seen_ahead.extend(len(produced) - question.question_number for question in questions)
+            return original(questions)
+
+        # Without a character budget only queued questions are collected
+        with mock.patch.object(self.translator, '_translate_questions', side_effect=translate_questions), \
+                mock.patch.dict(os.environ, {'TRANSLATION_STREAM_CHARS': '0'}):
+            result = self.translator.translate_stream(questions(), source_url="https://example.com/q",
+                                                      buffer_size=2)
+
+        self.assertEqual([q.question_number for q in result.questions], list(range(1, 9)))
+        self.assertEqual(result.questions[0].question_text, "gu:Question 1?")
+        self.assertEqual(result.questions[0].options, {'A': 'gu:Yes', 'B': 'gu:No'})
+        self.assertEqual(result.source_url, "https://example.com/q")
+        # Queue of 2 plus the item the producer is waiting to put
+        self.assertLessEqual(max(seen_ahead), 3)
+
+    def test_batches_filled_by_character_budget(self):
+        """Test that a small buffer does not cap how many questions share a request."""
+        backend = self.translator.backends[0]
+        chars = Translator._question_chars(make_question(1))
+
+        def questions():
+            for number in range(1, 13):
+                yield make_question(number)
+
+        translated = list(self.translator.iter_translated(questions(), buffer_size=1))
+        self.assertEqual([q.question_number for q in translated], list(range(1, 13)))
+        self.assertEqual(len(backend.requests), 1)
+
+        backend.requests.clear()
+        batches = []
+        original = self.translator._translate_questions
+
+        def translate_questions(questions):
+            batches.append(len(questions))
+            return original(questions)
+
+        with mock.patch.object(self.translator, '_translate_questions', side_effect=translate_questions):
+            list(self.translator.iter_translated(questions(), buffer_size=1, flush_chars=chars * 5))
+        self.assertEqual(batches, [5, 5, 2])
+
+    def test_first_batch_sent_while_parsing(self):
+        """Test that translation starts once one request is full, not at the end of the stream."""
+        produced = []
+        sent_after = []
+
+        def questions():
+            for number in range(1, 21):
+                produced.append(number)
+                # About a fifth of a default request per question
+                yield make_question(number).replace(explanation=f"Because {number}. " + "More detail. " * 70)
+
+        original = self.translator._translate_questions
+
+        def translate_questions(questions):
+            sent_after.append(len(produced))
+            return original(questions)
+
+        with mock.patch.object(self.translator, '_translate_questions', side_effect=translate_questions), \
+                mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('TRANSLATION_STREAM_CHARS', None)
+            translated = list(self.translator.iter_translated(questions(), buffer_size=2))
+
+        self.assertEqual(len(translated), 20)
+        self.assertGreater(len(sent_after), 1)
+        # One request of about five questions, plus what the queue let the parser run ahead
+        self.assertLessEqual(sent_after[0], 10)
+
+    def test_producer_error_is_raised_after_earlier_questions(self):
+        """Test that a parser error surfaces in the consumer."""
+        translated = []
+
+        def questions():
+            yield make_question(1)
+            raise ValueError("broken section")
+
+        with self.assertRaises(ValueError):
+            for question in self.translator.iter_translated(questions(), buffer_size=1):
+                translated.append(question)
+
+        self.assertEqual([q.question_number for q in translated], [1])
+
+
+class TestBatchedTranslation(unittest.TestCase):
+    """Test cases for Translator.translate_texts."""
+
+    def setUp(self):
+        self.fake = FakeTranslator()
+        self.translator = Translator(backends=[self.fake])
+        self.translator.memory = None
+        self.translator.batch_chars = 60
+        self.translator.rate_controller = RateController(rate=1000, max_rate=1000, max_concurrency=4)
+
+    def test_segments_packed_and_split_back(self):
+        """Test that segments share requests under the size limit and map back in order."""
+        texts = ["Question 1?", "", "Yes", "No", "• Line one\n\n• Line two", "Yes", "CurrentAdda", "x" * 80]
+        result = self.translator.translate_texts(texts)
+
+        self.assertEqual(result, [
+            "gu:Question 1?", "", "gu:Yes", "gu:No", "gu:• Line one\ngu:• Line two", "gu:Yes",
+            "CurrentAdda", "gu:" + "x" * 80,
+        ])
+        # Duplicates, blanks and preserved items are not sent; the oversized segment goes alone
+        self.assertCountEqual(self.fake.requests, [
+            "Question 1?\nYes\nNo\n• Line one\n• Line two", "x" * 80,
+        ])
+        self.assertEqual(self.translator.requests_made, 2)
+
+        question = make_question(1)
+        self.fake.requests.clear()
+        translated = self.translator.translate_quiz(
+            mock.Mock(questions=(question, make_question(2)), source_url="u", extracted_date="d")
+        ).questions
+        self.assertEqual(translated[1].explanation, "gu:Because 2.")
+        self.assertEqual(translated[0].options, {'A': 'gu:Yes', 'B': 'gu:No'})
+        self.assertEqual(len(self.fake.requests), 1)
+
+    def test_garbled_batch_falls_back_per_line(self):
+        """Test that a batch with a wrong line count is retranslated line by line."""
+        def merge_lines(text):
+            self.fake.requests.append(text)
+            return f"gu:{text.replace(chr(10), ' ')}"
+
+        self.fake.translate = merge_lines
+        result = self.translator.translate_texts(["Alpha", "Beta\nGamma"])
+
+        self.assertEqual(result, ["gu:Alpha", "gu:Beta\ngu:Gamma"])
+        self.assertEqual(self.fake.requests, ["Alpha\nBeta\nGamma", "Alpha", "Beta", "Gamma"])
+        self.assertEqual(self.translator.batch_fallbacks, 1)
+
+    def test_batches_translated_in_parallel_in_order(self):
+        """Test that batches overlap under the rate budget and results keep input order."""
+        self.fake.delay = 0.05
+        texts = [f"Sentence number {number} of the explanation." for number in range(12)]
+        result = self.translator.translate_texts(texts)
+
+        self.assertEqual(result, [f"gu:{text}" for text in texts])
+        self.assertEqual(len(self.fake.requests), 12)
+        self.assertGreater(self.fake.max_in_flight, 1)
+        self.assertLessEqual(self.fake.max_in_flight, self.translator.workers)
+        self.assertEqual(len(self.translator.segment_latencies), 12)
+        self.assertIn("over 12 lines", self.translator.latency_summary())
+
+
+
+if __name__ == '__main__':
+    unittest.main()